@@ -8,4 +8,5 @@ done
 convert clock.png -crop 48x60+$((9*48))+0 clock_0.png
 convert clock.png -crop 48x60+$((11*48))+0 clock_colon.png
 
-# Encode the clock digits
+# Encode the clock digits (and all the other images)
+(cd .. && tools/assets.py)
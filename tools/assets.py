@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2020 Daniel Thompson
+
+"""Build the image assets used by wasp-os.
+
+The images to build, and the python modules they are written to, are
+listed in ``res/assets.ini``. Every image is encoded using every
+permitted encoder from ``rle_encode.py``, each result is decoded again to
+check it and then the smallest valid result is kept.
+
+Images are recoloured slightly differently depending on their format (a
+2-bit image only recolours white and the greys until their palette
+entries are reused) so results are also checked to make sure they
+recolour the same pixels as a (round-robin) 2-bit image would.
+
+Encoding is slow so the images are encoded in parallel and the results
+are cached, keyed by a hash of the image, the encoders and the checks.
+"""
+
+import argparse
+import concurrent.futures
+import configparser
+import functools
+import hashlib
+import json
+import os
+import sys
+
+import rle_encode
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The available formats, in order of preference if two encodings are the
+# same size
+FORMATS = {
+    '1bit': (rle_encode.encode, '1-bit RLE'),
+    '2bit': (functools.partial(rle_encode.encode_2bit, optimize=True),
+             '2-bit RLE'),
+    'lz': (rle_encode.encode_lz, 'Palette RLE'),
+}
+
+def _to_json(image):
+    if len(image) == 3:
+        return [image[0], image[1], image[2].hex()]
+    return image.hex()
+
+def _from_json(data):
+    if isinstance(data, list):
+        return (data[0], data[1], bytes.fromhex(data[2]))
+    return bytes.fromhex(data)
+
+def _size(image):
+    return len(image[2]) if len(image) == 3 else len(image)
+
+def encode_all(fname):
+    """Encode an image using every encoder and check the results.
+
+    :return: Dictionary mapping each format to the encoded image (in a form
+             that can be stored as JSON) or to None if the encoder failed
+             or the image does not decode (or recolour) correctly
+    """
+    from PIL import Image
+    im = Image.open(fname).convert('RGB')
+    expected = rle_encode.quantize(im)
+    try:
+        recolored = rle_encode.decode(rle_encode.encode_2bit(im), True)
+    except AssertionError:
+        recolored = None
+
+    results = {}
+    for (fmt, (encoder, kind)) in FORMATS.items():
+        try:
+            image = encoder(im)
+            if rle_encode.decode(image) != expected:
+                image = None
+            elif recolored and rle_encode.decode(image, True) != recolored:
+                image = None
+        except (AssertionError, ValueError):
+            image = None
+        results[fmt] = _to_json(image) if image else None
+    return results
+
+class Cache:
+    """Encoded images, stored on disc as one JSON file per image."""
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+        h = hashlib.sha256()
+        for src in (rle_encode.__file__, __file__):
+            with open(src, 'rb') as f:
+                h.update(f.read())
+        self._encoder = h.digest()
+
+    def key(self, fname):
+        h = hashlib.sha256(self._encoder)
+        with open(fname, 'rb') as f:
+            h.update(f.read())
+        return h.hexdigest()
+
+    def get(self, key):
+        try:
+            with open(os.path.join(self.path, key + '.json')) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, results):
+        with open(os.path.join(self.path, key + '.json'), 'w') as f:
+            json.dump(results, f)
+
+def load_manifest(fname):
+    """Read the manifest.
+
+    :return: Dictionary mapping each module to a list of (variable, image
+             filename, formats) tuples
+    """
+    config = configparser.ConfigParser()
+    config.optionxform = str
+    with open(fname) as f:
+        config.read_file(f)
+
+    resdir = os.path.dirname(os.path.abspath(fname))
+    modules = {}
+    for module in config.sections():
+        assets = []
+        for (name, value) in config[module].items():
+            words = value.split()
+            formats = words[1:] if len(words) > 1 else list(FORMATS)
+            for fmt in formats:
+                if fmt not in FORMATS:
+                    raise ValueError(f'{name}: unknown format: {fmt}')
+            assets.append((name, os.path.join(resdir, words[0]), formats))
+        modules[module] = assets
+    return modules
+
+def choose(results, formats):
+    """Pick the smallest valid encoding from the permitted formats."""
+    candidates = []
+    for fmt in formats:
+        if results[fmt]:
+            image = _from_json(results[fmt])
+            candidates.append((_size(image), list(FORMATS).index(fmt),
+                               fmt, image))
+    if not candidates:
+        return (None, None)
+    best = min(candidates)
+    return (best[2], best[3])
+
+def render_module(assets):
+    lines = [ '# Code generated by assets.py.', '# Cmd: tools/assets.py' ]
+    for (name, fname, fmt, image) in assets:
+        lines.append('')
+        lines.append(rle_encode.render_py(image, os.path.relpath(fname, ROOT),
+                                          name, FORMATS[fmt][1]))
+    return '\n'.join(lines) + '\n'
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--manifest',
+            default=os.path.join(ROOT, 'res', 'assets.ini'),
+            help='Images to build (default: res/assets.ini)')
+    parser.add_argument('--cache', default=os.path.join(ROOT, 'build-assets'),
+            help='Directory to cache encoded images in (default: build-assets)')
+    parser.add_argument('-j', '--jobs', type=int,
+            help='Number of images to encode in parallel (default: one per CPU)')
+    parser.add_argument('--check', action='store_true',
+            help='Report whether the modules are up to date (instead of '
+                 'writing them)')
+    args = parser.parse_args(argv)
+
+    modules = load_manifest(args.manifest)
+    images = sorted({ a[1] for assets in modules.values() for a in assets })
+
+    # Encode anything that is not already in the cache
+    cache = Cache(args.cache)
+    keys = { fname: cache.key(fname) for fname in images }
+    results = {}
+    todo = []
+    for fname in images:
+        results[fname] = cache.get(keys[fname])
+        if results[fname] is None:
+            todo.append(fname)
+    if todo:
+        with concurrent.futures.ProcessPoolExecutor(args.jobs) as pool:
+            for (fname, r) in zip(todo, pool.map(encode_all, todo)):
+                results[fname] = r
+                cache.put(keys[fname], r)
+    print(f'Encoded {len(todo)} image(s), {len(images) - len(todo)} cached',
+          file=sys.stderr)
+
+    # Pick the best encodings, write the modules and report the sizes
+    header = '{:<16} {:<6} {:>6}' + ' {:>6}' * len(FORMATS)
+    stale = []
+    for (module, assets) in modules.items():
+        print(module)
+        print('  ' + header.format('variable', 'format', 'bytes', *FORMATS))
+        chosen = []
+        total = 0
+        for (name, fname, formats) in assets:
+            (fmt, image) = choose(results[fname], formats)
+            if not fmt:
+                print(f'{os.path.relpath(fname, ROOT)}: no valid encoding',
+                      file=sys.stderr)
+                return 2
+            chosen.append((name, fname, fmt, image))
+            total += _size(image)
+
+            sizes = []
+            for f in FORMATS:
+                r = results[fname][f]
+                sizes.append(_size(_from_json(r)) if r else '-')
+            print('  ' + header.format(name, fmt, _size(image), *sizes))
+        print(('  ' + header.format('total', '', total,
+                                    *([''] * len(FORMATS)))).rstrip())
+        print()
+
+        text = render_module(chosen)
+        path = os.path.join(ROOT, module)
+        try:
+            with open(path) as f:
+                current = f.read()
+        except OSError:
+            current = None
+        if text != current:
+            stale.append(module)
+            if not args.check:
+                with open(path, 'w') as f:
+                    f.write(text)
+
+    for module in stale:
+        if args.check:
+            print(f'{module} is out of date', file=sys.stderr)
+        else:
+            print(f'Updated {module}', file=sys.stderr)
+    return 1 if args.check and stale else 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2020 Daniel Thompson
+
+"""Host-side tool for the PPG signal processing in wasp-os.
+
+Runs recorded photoplethysmogram (PPG) data through the signal processing
+from ``wasp/ppg.py``. The ``compare`` command checks that the fixed point
+filters used by wasp-os give the same results as the floating point
+reference filters. The ``bench`` command measures the accuracy, speed and
+memory use of the heart rate estimate for a batch of recordings.
+
+Recordings hold the raw samples (from ``HRS3300.read_hrs()``), sampled at
+24Hz, and come in three formats:
+
+* ``.csv`` files have one sample per row. If the first row is a header
+  then the samples are read from the ``hrs`` column and the reference
+  heart rate (if known) from the ``bpm`` column, otherwise these are the
+  first and second columns. The reference can be left blank for samples
+  where it is not known (the last known value is used).
+* ``.bin`` files are a sequence of little endian records, each holding a
+  32-bit sample and a 16-bit reference heart rate (or 0 if not known).
+* Any other file is text with the samples separated by whitespace or
+  commas.
+
+Lines starting with ``#`` are ignored in text and CSV files. If no
+recording is given then the data played back by the simulator is used.
+"""
+
+import argparse
+import ast
+import concurrent.futures
+import csv
+import json
+import math
+import os
+import struct
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[0:0] = (os.path.join(ROOT, 'wasp', 'boards', 'simulator'),
+                 os.path.join(ROOT, 'wasp'))
+
+import ppg
+
+class ReferencePPG(ppg.PPG):
+    """PPG preprocessing using the floating point filters."""
+    def __init__(self, spl):
+        super().__init__(spl)
+        self._hpf = ppg.Biquad(*ppg.HPF)
+        self._agc = ppg.PTAGC(*ppg.AGC)
+        self._lpf = ppg.Biquad(*ppg.LPF)
+
+    def preprocess(self, spl):
+        spl -= self._offset
+        spl = self._hpf.step(spl)
+        spl = self._agc.step(spl)
+        spl = self._lpf.step(spl)
+        spl = int(spl)
+
+        self._append(spl)
+        return spl
+
+def simulator_data(count):
+    """Replay the PPG data from the simulator.
+
+    The simulator plays its data forwards and then backwards, over and
+    over again, so we do the same.
+    """
+    with open(os.path.join(ROOT, 'wasp', 'boards', 'simulator',
+                           'watch.py')) as f:
+        tree = ast.parse(f.read())
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef) and node.name == 'HRS':
+            for stmt in node.body:
+                if isinstance(stmt, ast.Assign) and \
+                   stmt.targets[0].id == 'DATA':
+                    data = ast.literal_eval(stmt.value)
+                    break
+
+    cycle = data + data[-1:0:-1] + data[:1]
+    return [cycle[i % len(cycle)] for i in range(count)]
+
+def _load_csv(f):
+    rows = [r for r in csv.reader(f)
+              if r and not r[0].lstrip().startswith('#')]
+    (hrs, bpm) = (0, 1)
+    if rows and not rows[0][0].strip().lstrip('-').isdigit():
+        header = [h.strip().lower() for h in rows.pop(0)]
+        hrs = header.index('hrs') if 'hrs' in header else 0
+        bpm = header.index('bpm') if 'bpm' in header else None
+
+    samples = [int(r[hrs]) for r in rows]
+    labels = None
+    if bpm is not None and any(len(r) > bpm for r in rows):
+        labels = [float(r[bpm]) if len(r) > bpm and r[bpm].strip() else None
+                        for r in rows]
+    return (samples, labels)
+
+def _load_bin(f):
+    records = list(struct.iter_unpack('<IH', f.read()))
+    samples = [r[0] for r in records]
+    labels = [r[1] if r[1] else None for r in records]
+    if not any(labels):
+        labels = None
+    return (samples, labels)
+
+def _load_text(f):
+    samples = []
+    for line in f:
+        if line.lstrip().startswith('#'):
+            continue
+        samples += [int(w) for w in line.replace(',', ' ').split()]
+    return (samples, None)
+
+def load(fname):
+    """Load a recording.
+
+    :return: Tuple of the samples and the reference heart rates (a list
+             with an entry, possibly None, for every sample) or None if the
+             recording has no reference
+    """
+    ext = os.path.splitext(fname)[1].lower()
+    if ext == '.bin':
+        with open(fname, 'rb') as f:
+            return _load_bin(f)
+    with open(fname, newline='') as f:
+        if ext == '.csv':
+            return _load_csv(f)
+        return _load_text(f)
+
+def recordings(args):
+    """Expand the recordings given on the command line.
+
+    Directories are replaced by the files they contain.
+
+    :return: List of (name, filename) tuples, the filename is None for the
+             simulator data
+    """
+    if not args.recordings:
+        return [('simulator', None)]
+
+    files = []
+    for path in args.recordings:
+        if os.path.isdir(path):
+            files += sorted(os.path.join(path, f) for f in os.listdir(path)
+                                if not f.startswith('.'))
+        else:
+            files.append(path)
+    return [(f, f) for f in files]
+
+def _samples(fname, count):
+    if fname is None:
+        return (simulator_data(count), None)
+    return load(fname)
+
+def run(cls, samples):
+    """Process the samples, measuring the heart rate once a second (just
+    like the heart rate application does).
+
+    :return: Tuple of the processed samples, the heart rates and the
+             index of the sample at which each heart rate was measured
+    """
+    p = cls(samples[0])
+    out = []
+    rates = []
+    at = []
+    for (i, spl) in enumerate(samples):
+        out.append(p.preprocess(spl))
+        if p.count >= 240 and p.count % 24 == 0:
+            rates.append(p.get_heart_rate())
+            at.append(i)
+    return (out, rates, at)
+
+def _stream(cls, samples):
+    """Same as run() but without keeping the results."""
+    p = cls(samples[0])
+    for spl in samples:
+        p.preprocess(spl)
+        if p.count >= 240 and p.count % 24 == 0:
+            p.get_heart_rate()
+
+def _summary(rates):
+    found = [r for r in rates if r is not None]
+    if not found:
+        return f'none of {len(rates)}'
+    return (f'{len(found)} of {len(rates)}, {min(found)} to {max(found)} '
+            f'(mean {sum(found) / len(found):.1f})')
+
+def compare(args, samples):
+    (ref, ref_rates, _) = run(ReferencePPG, samples)
+    (out, rates, _) = run(ppg.PPG, samples)
+
+    errors = [abs(a - b) for (a, b) in zip(ref, out)]
+    worst = max(errors)
+    wrong = sum(1 for e in errors if e)
+    rms = math.sqrt(sum(e * e for e in errors) / len(errors))
+
+    print(f'samples:          {len(samples)}')
+    print(f'maximum error:    {worst}')
+    print(f'samples differ:   {wrong} ({100 * wrong / len(samples):.1f}%)')
+    print(f'rms error:        {rms:.3f}')
+    print(f'heart rate (ref): {_summary(ref_rates)}')
+    print(f'heart rate:       {_summary(rates)}')
+    differ = sum(1 for (a, b) in zip(ref_rates, rates) if a != b)
+    print(f'rates differ:     {differ}')
+
+    if worst > args.tolerance or \
+       differ > len(rates) * args.rate_tolerance / 100:
+        print('FAIL: fixed point results do not match the reference',
+              file=sys.stderr)
+        return 1
+    return 0
+
+def measure(job):
+    """Benchmark a single recording.
+
+    :return: Dictionary of results
+    """
+    (fname, count, reference) = job
+    (samples, labels) = _samples(fname, count)
+    cls = ReferencePPG if reference else ppg.PPG
+    result = { 'samples': len(samples), 'seconds': round(len(samples) / 24) }
+
+    # Accuracy (the error is only known if there is a reference)
+    (_, rates, at) = run(cls, samples)
+    result['estimates'] = len(rates)
+    result['found'] = sum(1 for r in rates if r is not None)
+    if labels:
+        label = None
+        labelled = 0
+        within = 0
+        errors = []
+        j = 0
+        for (rate, i) in zip(rates, at):
+            while j <= i:
+                if labels[j] is not None:
+                    label = labels[j]
+                j += 1
+            if label is None:
+                continue
+            labelled += 1
+            if rate is not None:
+                errors.append(rate - label)
+                if abs(rate - label) <= 5:
+                    within += 1
+        result['labelled'] = labelled
+        result['within_5bpm'] = within
+        result['abs_error'] = sum(abs(e) for e in errors)
+        result['sq_error'] = sum(e * e for e in errors)
+        result['errors'] = len(errors)
+
+    # Throughput
+    t = time.perf_counter()
+    _stream(cls, samples)
+    result['wall_s'] = time.perf_counter() - t
+
+    # Memory (measured separately because tracing is slow)
+    tracemalloc.start()
+    (base, _) = tracemalloc.get_traced_memory()
+    _stream(cls, samples)
+    (current, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result['peak_heap_bytes'] = peak - base
+
+    return result
+
+def _report(name, r):
+    found = 100 * r['found'] / r['estimates'] if r['estimates'] else 0
+    if r.get('errors'):
+        mae = f'{r["abs_error"] / r["errors"]:.2f}'
+        rmse = f'{math.sqrt(r["sq_error"] / r["errors"]):.2f}'
+    else:
+        (mae, rmse) = ('-', '-')
+    if r.get('labelled'):
+        within = f'{100 * r["within_5bpm"] / r["labelled"]:.1f}'
+    else:
+        within = '-'
+    rate = r['samples'] / r['wall_s'] if r['wall_s'] else 0
+    print(f'{name[-24:]:<24} {r["samples"]:>8} {found:>6.1f} {mae:>6} '
+          f'{rmse:>6} {within:>6} {rate:>9.0f} {r["peak_heap_bytes"]:>9}')
+
+def bench(args):
+    files = recordings(args)
+    jobs = [(fname, args.samples, args.reference) for (name, fname) in files]
+    with concurrent.futures.ProcessPoolExecutor(args.jobs) as pool:
+        results = dict(zip((name for (name, fname) in files),
+                           pool.map(measure, jobs)))
+
+    print(f'{"recording":<24} {"samples":>8} {"found%":>6} {"mae":>6} '
+          f'{"rmse":>6} {"<=5bpm":>6} {"spl/s":>9} {"heap":>9}')
+    total = {}
+    for (name, r) in results.items():
+        _report(name, r)
+        for (k, v) in r.items():
+            if k == 'peak_heap_bytes':
+                total[k] = max(total.get(k, 0), v)
+            else:
+                total[k] = total.get(k, 0) + v
+    if len(results) > 1:
+        _report('total', total)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({ 'recordings': results, 'total': total }, f,
+                      indent=2, sort_keys=True)
+            f.write('\n')
+    return 0
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('recordings', nargs='*',
+            help='PPG recordings or directories of recordings (default: '
+                 'the simulator data)')
+    common.add_argument('-n', '--samples', type=int, default=2400,
+            help='Number of samples of simulator data to use (default: 2400)')
+
+    p = subparsers.add_parser('compare', parents=[common],
+            help='Compare the fixed point filters to the reference')
+    p.add_argument('--tolerance', type=int, default=1,
+            help='Largest acceptable error in any sample (default: 1)')
+    p.add_argument('--rate-tolerance', type=float, default=2,
+            help='Acceptable percentage of heart rates that differ from '
+                 'the reference (default: 2)')
+    p.set_defaults(func=compare)
+
+    p = subparsers.add_parser('bench', parents=[common],
+            help='Measure the accuracy, speed and memory use of the heart '
+                 'rate estimate')
+    p.add_argument('-j', '--jobs', type=int,
+            help='Number of recordings to process in parallel (default: '
+                 'one per CPU)')
+    p.add_argument('-o', '--output',
+            help='Also write the results to a file (as JSON)')
+    p.add_argument('--reference', action='store_true',
+            help='Use the floating point filters instead of the fixed '
+                 'point ones')
+    p.set_defaults(func=bench)
+
+    args = parser.parse_args(argv)
+    if args.func == bench:
+        return bench(args)
+
+    result = 0
+    for (name, fname) in recordings(args):
+        (samples, labels) = _samples(fname, args.samples)
+        print(f'{name}:')
+        result |= args.func(args, samples)
+    return result
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -4,9 +4,16 @@
 # Copyright (C) 2020 Daniel Thompson
 
 import argparse
+import collections
+import itertools
 import sys
 import os.path
-from PIL import Image
+
+try:
+    import numpy as np
+except ImportError:
+    # The encoders still work without numpy, they are just a lot slower
+    np = None
 
 def clut8_rgb888(i):
     """Reference CLUT for wasp-os.
@@ -48,9 +55,9 @@ def clut8_rgb565(i):
 
     .. note::
 
-        This function is unused within this file but needs to be
-        maintained alongside the reference clut so it is reproduced
-        here.
+        This function is used to generate the lookup table used by the
+        decoder in wasp-os (``wasp/clut8.py``) so it must be maintained
+        alongside the reference clut.
 
     :param int i: Index (from 0..255 inclusive) into the CLUT
     :return:      16-bit colour in RGB565 format
@@ -81,6 +88,9 @@ class ReverseCLUT:
             l.append(clut(i))
         self.clut = tuple(l)
         self.lookup = {}
+        if np:
+            c = np.array(self.clut, dtype=np.int32)
+            self._rgb = np.stack((c >> 16, (c >> 8) & 0xff, c & 0xff), axis=1)
 
     def __call__(self, rgb888):
         """Compare rgb888 to every element of the CLUT and pick the
@@ -111,44 +121,123 @@ class ReverseCLUT:
         #print(f'# #{rgb888:06x} -> #{clut8_rgb888(index):06x}')
         return index
 
+    def map(self, rgb888):
+        """Find the closest CLUT entry for a whole sequence of colours.
+
+        The results are exactly the same as calling the object for each
+        colour in turn (ties go to the lowest index) but, when numpy is
+        available, every distinct colour is compared to the CLUT in a
+        single vectorised step.
+
+        :param rgb888: Sequence of colours
+        :return: List of CLUT indices
+        """
+        if not np:
+            return [self(c) for c in rgb888]
+
+        (colors, inverse) = np.unique(np.asarray(rgb888, dtype=np.int64),
+                                      return_inverse=True)
+        rgb = np.stack((colors >> 16, (colors >> 8) & 0xff, colors & 0xff),
+                       axis=1).astype(np.int32)
+
+        # Work in chunks to keep the distance matrix to a sensible size
+        index = np.empty(len(colors), dtype=np.uint8)
+        for i in range(0, len(colors), 4096):
+            d = rgb[i:i+4096, None, :] - self._rgb[None, :, :]
+            index[i:i+4096] = np.argmin((d * d).sum(axis=2), axis=1)
+
+        self.lookup.update(zip(colors.tolist(), index.tolist()))
+        return index[inverse.ravel()].tolist()
+
+def _pixels(im):
+    """Get the pixels of an image as a flat list of integers.
+
+    Each pixel is packed into a single integer so that two pixels are equal
+    only if all their channels (including alpha) are equal.
+
+    :return: Tuple of the pixels and the shift needed to convert a pixel to
+             RGB888
+    """
+    if im.mode not in ('RGB', 'RGBA'):
+        im = im.convert('RGB')
+    shift = 8 if im.mode == 'RGBA' else 0
+
+    if np:
+        a = np.asarray(im, dtype=np.int64).reshape(-1, len(im.mode))
+        pixels = (a[:, 0] << 16) | (a[:, 1] << 8) | a[:, 2]
+        if shift:
+            pixels = (pixels << 8) | a[:, 3]
+        return (pixels, shift)
+
+    if shift:
+        return ([(r << 24) | (g << 16) | (b << 8) | a
+                            for (r, g, b, a) in im.getdata()], shift)
+    return ([(r << 16) | (g << 8) | b for (r, g, b) in im.getdata()], shift)
+
+def _runs(pixels):
+    """Split a sequence of pixels into runs of identical pixels.
+
+    :return: List of (pixel, run length) tuples
+    """
+    if not len(pixels):
+        return []
+
+    if np:
+        if isinstance(pixels, (bytes, bytearray)):
+            pixels = np.frombuffer(pixels, dtype=np.uint8)
+        pixels = np.asarray(pixels)
+        starts = np.flatnonzero(pixels[1:] != pixels[:-1]) + 1
+        starts = np.concatenate(([0], starts))
+        lengths = np.diff(np.append(starts, len(pixels)))
+        return list(zip(pixels[starts].tolist(), lengths.tolist()))
+
+    return [(px, sum(1 for i in run)) for (px, run) in itertools.groupby(pixels)]
+
+def _quantize(im):
+    """Map every pixel of an image to the closest colour in the CLUT.
+
+    :return: List of rows, each a bytes object holding CLUT indices
+    """
+    (pixels, _) = _pixels(im.convert('RGB'))
+    pixels = bytes(ReverseCLUT(clut8_rgb888).map(pixels))
+    w = im.width
+    return [pixels[i:i+w] for i in range(0, len(pixels), w)]
+
+def quantize(im):
+    """Map every pixel of an image to the closest colour in the CLUT.
+
+    :return: List of rows, each a tuple of CLUT indices
+    """
+    return [tuple(row) for row in _quantize(im)]
+
 def varname(p):
     return os.path.basename(os.path.splitext(p)[0])
 
 def encode(im):
-    pixels = im.load()
+    """1-bit RLE encoder.
 
-    rle = []
-    rl = 0
-    px = pixels[0, 0]
+    The runs alternate between the background (black) and the foreground
+    colour, starting with the background.
+    """
+    im = im.convert('RGB')
+    runs = _runs(_pixels(im)[0])
 
-    def encode_pixel(px, rl):
+    # The first run is always the background
+    if runs[0][0] != 0:
+        runs.insert(0, (0, 0))
+
+    rle = []
+    for (px, rl) in runs:
+        assert(rl < (1 << 21))
         while rl > 255:
             rle.append(255)
             rle.append(0)
             rl -= 255
         rle.append(rl)
 
-    for y in range(im.height):
-        for x in range(im.width):
-            newpx = pixels[x, y]
-            if newpx == px:
-                rl += 1
-                assert(rl < (1 << 21))
-                continue
-
-            # Code the previous run
-            encode_pixel(px, rl)
-
-            # Start a new run
-            rl = 1
-            px = newpx
-
-    # Handle the final run
-    encode_pixel(px, rl)
-
     return (im.width, im.height, bytes(rle))
 
-def encode_2bit(im):
+def encode_2bit(im, optimize=False):
     """2-bit palette based RLE encoder.
 
     This encoder has a reprogrammable 2-bit palette. This allows it to encode
@@ -157,34 +246,76 @@ def encode_2bit(im):
     carefully constructed to keep a good locality of reference for the three
     non-background colours.
 
+    By default each new colour replaces the palette entries in turn. If
+    optimize is set then the encoder looks ahead and replaces the colour
+    that will not be needed for longest (which minimizes the number of
+    palette changes). The decoder reads the palette entry to replace from
+    the palette change itself so both kinds of image can be decoded in
+    exactly the same way (and have exactly the same pixels recoloured).
+
     The encoding competes well with the 1-bit encoder for small monochrome
     images but once run-lengths longer than 62 start to become frequent then
     this encoding is about 30% larger than a 1-bit encoding.
     """
-    pixels = im.load()
     assert(im.width <= 255)
     assert(im.height <= 255)
 
-    full_palette = ReverseCLUT(clut8_rgb888)
+    # Find the runs first and then map just one pixel from each run to
+    # the CLUT
+    (pixels, shift) = _pixels(im)
+    runs = _runs(pixels)
+    colors = ReverseCLUT(clut8_rgb888).map([px >> shift for (px, rl) in runs])
+
+    # The palette starts as black, grey25, grey50 and white and the last
+    # three entries are recoloured (to c1, c2 and fg) when the image is
+    # drawn, but only until they are replaced. Runs that the round-robin
+    # encoder draws using a recoloured entry are given the (negated)
+    # palette index as their colour. This cannot be loaded back into the
+    # palette so the optimizer cannot change which pixels are recoloured.
+    palette = [0, 254, 219, 215]
+    recolor = [False, True, True, True]
+    next_color = 1
+    for (i, px) in enumerate(colors):
+        if px not in palette:
+            palette[next_color] = px
+            recolor[next_color] = False
+            next_color = next_color % 3 + 1
+        elif recolor[palette.index(px)]:
+            colors[i] = -palette.index(px)
 
     rle = []
-    rl = 0
-    px = pixels[0, 0]
-    # black, grey25, grey50, white
-    palette = [0, 254, 219, 215]
+    palette = [0, -1, -2, -3]
     next_color = 1
 
-    def encode_pixel(px, rl):
+    # Find out when each colour is next used (after each run) and when the
+    # colours in the palette are first used
+    end = len(colors)
+    next_use = [end] * end
+    first_use = {}
+    for i in range(end - 1, -1, -1):
+        next_use[i] = first_use.get(colors[i], end)
+        first_use[colors[i]] = i
+    pending = [first_use.get(c, end) for c in palette]
+
+    def encode_pixel(i, px, rl):
         nonlocal next_color
-        px = full_palette((px[0] << 16) + (px[1] << 8) + px[2])
         if px not in palette:
-            rle.append(next_color << 6)
+            if optimize:
+                # Recoloured entries cannot be reloaded once they have
+                # been replaced so keep them until they are not needed
+                slot = max((s for s in range(1, len(palette))
+                                if palette[s] >= 0 or pending[s] == end),
+                           key=lambda s: pending[s])
+            else:
+                slot = next_color
+                next_color += 1
+                if next_color >= len(palette):
+                    next_color = 1
+            rle.append(slot << 6)
             rle.append(px)
-            palette[next_color] = px
-            next_color += 1
-            if next_color >= len(palette):
-                next_color = 1
+            palette[slot] = px
         px = palette.index(px)
+        pending[px] = next_use[i]
         if rl >= 63:
             rle.append((px << 6) + 63)
             rl -= 63
@@ -200,23 +331,143 @@ def encode_2bit(im):
     rle.append(im.width)
     rle.append(im.height)
 
-    for y in range(im.height):
-        for x in range(im.width):
-            newpx = pixels[x, y]
-            if newpx == px:
-                rl += 1
-                assert(rl < (1 << 21))
-                continue
+    for (i, (px, (_, rl))) in enumerate(zip(colors, runs)):
+        assert(rl < (1 << 21))
+        encode_pixel(i, px, rl)
 
-            # Code the previous run
-            encode_pixel(px, rl)
+    return bytes(rle)
 
-            # Start a new run
-            rl = 1
-            px = newpx
+def encode_lz(im):
+    """Palette RLE encoder with back-references to repeated rows.
+
+    This is the format decoded by :py:meth:`Draw565.blit` when the first
+    byte is 3. The image starts with a four byte header: the format (3),
+    the width, the height and a palette descriptor. The bottom four bits of
+    the descriptor hold the palette size, n (up to 8 colours). If bit 7 is
+    set then the image uses the default palette (black, white, grey25,
+    grey50), otherwise the header is followed by n indices into the
+    wasp-os CLUT. White and the two greys are replaced with the fg, c1
+    and c2 colours when the image is drawn. Unlike 2-bit images, where
+    these colours are only replaced until their palette entries are
+    reused, every white and grey pixel is replaced.
+
+    The pixel data consists of runs. Each run is a single byte holding k
+    (in the top p bits, where p is the smallest number of bits that can
+    represent n-1 distinct values) and the run length (in the remaining
+    bits). The colour of each run is encoded relative to the previous
+    colour, c, so the new colour is (c + 1 + k) % n. This means that a
+    monochrome image needs no bits at all to encode the colour and is
+    just as compact as the 1-bit RLE format. Before the first run c is
+    n-1. Runs whose length fields are all ones are followed by one or more
+    extension bytes that are added to the length (until an extension byte
+    less than 255 is found). Runs may cross from one row to the next and
+    can be zero length (to allow two runs of the same colour).
+
+    If a row does not start part way through a run then a zero byte at the
+    start of the row introduces a row reference. The next byte, v, is
+    either 0 (which encodes a zero length run, k = 0), a copy of the row v
+    rows above (v from 1 to 64) or, if bit 7 is set, the previous row
+    repeated (v & 0x7f) + 2 times. After a row reference c is the colour of
+    the last pixel in the copied row. Only rows that do not start part way
+    through a run can be referenced.
+    """
+    (w, h) = im.size
+    assert(w <= 240)
+    assert(h <= 240)
+    rows = _quantize(im)
+
+    # Choose the palette. Images that only use black, white and the two
+    # default greys don't need to store a palette at all.
+    colors = collections.Counter(b''.join(rows))
+    default = [0, 215, 254, 219]
+    if all(c in default for c in colors):
+        n = max(2, max(default.index(c) for c in colors) + 1)
+        palette = default[:n]
+        rle = [3, w, h, 0x80 | n]
+    else:
+        palette = sorted(colors, key=lambda c: -colors[c])
+        if len(palette) < 2:
+            palette.append(0 if palette[0] else 215)
+        n = len(palette)
+        if n > 8:
+            raise ValueError(f'Too many colours ({n}), the limit is 8')
+        rle = [3, w, h, n]
+        rle += palette
+    table = bytearray(256)
+    for (i, c) in enumerate(palette):
+        table[c] = i
+    rows = [row.translate(table) for row in rows]
+
+    fbits = 8 - (n - 2).bit_length()
+    fmax = (1 << fbits) - 1
+
+    color = n - 1
+    run = None
+    runlen = 0
+    row_start = True
+
+    def encode_run(px, rl):
+        nonlocal color, row_start
+        if px == color:
+            # Switch colour using an empty run (which must be escaped if
+            # it could be mistaken for a row reference)
+            if row_start:
+                rle.append(0)
+            rle.append(0)
+            color = (color + 1) % n
+        rle.append(((px - color - 1) % n) << fbits | min(rl, fmax))
+        if rl >= fmax:
+            rl -= fmax
+            while rl >= 255:
+                rle.append(255)
+                rl -= 255
+            rle.append(rl)
+        color = px
+        row_start = False
+
+    aligned = []
+    y = 0
+    while y < h:
+        row = rows[y]
+
+        # Look for an earlier row we can copy
+        distance = None
+        for d in range(1, min(64, y) + 1):
+            if aligned[y-d] and rows[y-d] == row:
+                distance = d
+                break
+        if distance:
+            if run is not None:
+                encode_run(run, runlen)
+                run = None
+            repeat = 1
+            if distance == 1:
+                while y + repeat < h and repeat < 129 and rows[y+repeat] == row:
+                    repeat += 1
+            rle.append(0)
+            if repeat > 1:
+                rle.append(0x80 | (repeat - 2))
+            else:
+                rle.append(distance)
+            color = row[-1]
+            aligned += [True] * repeat
+            y += repeat
+            continue
+
+        aligned.append(run != row[0])
+        for (i, (px, rl)) in enumerate(_runs(row)):
+            if px == run:
+                runlen += rl
+                continue
+            if run is not None:
+                encode_run(run, runlen)
+            row_start = i == 0
+            run = px
+            runlen = rl
+        y += 1
 
-    # Handle the final run
-    encode_pixel(px, rl)
+    if run is not None:
+        encode_run(run, runlen)
 
     return bytes(rle)
 
@@ -228,14 +479,13 @@ def encode_8bit(im):
     currently there is no decoder either (so don't assume this code
     actually works).
     """
-    pixels = im.load()
+    (pixels, shift) = _pixels(im)
 
     rle = []
-    rl = 0
-    px = pixels[0, 0]
 
     def encode_pixel(px, rl):
-        px = (px[0] & 0xe0) | ((px[1] & 0xe0) >> 3) | ((px[2] & 0xc0) >> 6)
+        px >>= shift
+        px = ((px >> 16) & 0xe0) | ((px >> 11) & 0x1c) | ((px >> 6) & 0x03)
 
         rle.append(px)
         if rl > 0:
@@ -248,23 +498,9 @@ def encode_8bit(im):
         if rl >= 0:
             rle.append(         rl        & 0x7f )
 
-    for y in range(im.height):
-        for x in range(im.width):
-            newpx = pixels[x, y]
-            if newpx == px:
-                rl += 1
-                assert(rl < (1 << 21))
-                continue
-
-            # Code the previous run
-            encode_pixel(px, rl)
-
-            # Start a new run
-            rl = 1
-            px = newpx
-
-    # Handle the final run
-    encode_pixel(px, rl)
+    for (px, rl) in _runs(pixels):
+        assert(rl < (1 << 21))
+        encode_pixel(px, rl)
 
     return (im.width, im.height, bytes(rle))
 
@@ -283,6 +519,30 @@ def render_c(image, fname):
 
     print('\n};')
 
+def render_clut():
+    """Render the RGB565 CLUT as a python module.
+
+    The table holds 256 little endian RGB565 values.
+    """
+    clut = bytearray()
+    for i in range(256):
+        rgb565 = clut8_rgb565(i)
+        clut.append(rgb565 & 0xff)
+        clut.append(rgb565 >> 8)
+
+    print('# Code generated by rle_encode.py.')
+    print('# Cmd: tools/rle_encode.py --clut')
+    print('"""8-bit colour lookup table')
+    print('~~~~~~~~~~~~~~~~~~~~~~~~~~~')
+    print()
+    print('Palette used by 2-bit RLE images as 256 little endian RGB565 values.')
+    print('"""')
+    print()
+    print('RGB565 = (')
+    for i in range(0, len(clut), 16):
+        print(f'    {bytes(clut[i:i+16])}')
+    print(')')
+
 def decode_to_ascii(image):
     (sx, sy, rle) = image
     data = bytearray(2*sx)
@@ -311,59 +571,224 @@ def decode_to_ascii(image):
     assert(dp == 0)
 
 
-
-parser = argparse.ArgumentParser(description='RLE encoder tool.')
-parser.add_argument('files', nargs='+',
-                    help='files to be encoded')
-parser.add_argument('--ascii', action='store_true',
-                    help='Run the resulting image(s) through an ascii art decoder')
-parser.add_argument('--c', action='store_true',
-                    help='Render the output as C instead of python')
-parser.add_argument('--indent', default=0, type=int,
-                    help='Add extra indentation in the generated code')
-parser.add_argument('--2bit', action='store_true', dest='twobit',
-                    help='Generate 2-bit image')
-parser.add_argument('--8bit', action='store_true', dest='eightbit',
-                    help='Generate 8-bit image')
-
-args = parser.parse_args()
-extra_indent = ' ' * args.indent
-if args.eightbit:
-    encoder = encode_8bit
-    depth = 8
-elif args.twobit:
-    encoder = encode_2bit
-    depth = 2
-else:
-    encoder = encode
-    depth =1
-
-for fname in args.files:
-    image = encoder(Image.open(fname))
-
-    if args.c:
-        render_c(image, fname)
+def _decode_1bit(image, recolor):
+    (w, h, rle) = image
+    fg = -3 if recolor else 215
+    pixels = []
+    color = 0
+    for rl in rle:
+        pixels += [color] * rl
+        color = fg if color == 0 else 0
+    return (w, h, pixels)
+
+def _decode_2bit(image, recolor):
+    (w, h, rle) = (image[1], image[2], image[3:])
+    palette = [0, -1, -2, -3] if recolor else [0, 254, 219, 215]
+    pixels = []
+    rl = 0
+    for op in rle:
+        if rl == 0:
+            px = op >> 6
+            rl = op & 0x3f
+            if 0 == rl:
+                rl = -1
+                continue
+            if rl >= 63:
+                continue
+        elif rl > 0:
+            rl += op
+            if op >= 255:
+                continue
+        else:
+            palette[px] = op
+            rl = 0
+            continue
+        pixels += [palette[px]] * rl
+        rl = 0
+    return (w, h, pixels)
+
+def _decode_lz(image, recolor):
+    (w, h, n) = (image[1], image[2], image[3] & 0xf)
+    if image[3] & 0x80:
+        palette = [0, 215, 254, 219][:n]
+        sp = 4
     else:
+        palette = list(image[4:4+n])
+        sp = 4 + n
+    fbits = 8 - (n - 2).bit_length()
+    fmax = (1 << fbits) - 1
+
+    def decode_run(state, count):
+        (sp, c, rl) = state
+        out = []
+        while len(out) < count:
+            if not rl:
+                v = image[sp]
+                sp += 1
+                c = (c + 1 + (v >> fbits)) % n
+                rl = v & fmax
+                if rl == fmax:
+                    e = 255
+                    while e == 255:
+                        e = image[sp]
+                        sp += 1
+                        rl += e
+                continue
+            k = min(rl, count - len(out))
+            out += [palette[c]] * k
+            rl -= k
+        state[:] = (sp, c, rl)
+        return out
+
+    state = [sp, n - 1, 0]
+    rows = {}
+    pixels = []
+    y = 0
+    while y < h:
+        repeat = 1
+        ref = None
+        if not state[2]:
+            sp = state[0]
+            if image[sp] == 0:
+                v = image[sp+1]
+                if v:
+                    if v & 0x80:
+                        repeat = (v & 0x7f) + 2
+                        v = 1
+                    if v > 64:
+                        raise ValueError('Bad row reference')
+                    ref = rows[y - v]
+                    state[0] = sp + 2
+                else:
+                    state[0] = sp + 1
+            if ref is None:
+                rows[y] = tuple(state[0:2])
+
+        for i in range(repeat):
+            if ref is None:
+                pixels += decode_run(state, w)
+            else:
+                rows[y] = ref
+                copy = list(ref) + [0]
+                pixels += decode_run(copy, w)
+            y += 1
+        if ref is not None:
+            state[1] = copy[1]
+
+    if state[0] != len(image) or state[2]:
+        raise ValueError('Trailing data')
+    if recolor:
+        recolored = { 254: -1, 219: -2, 215: -3 }
+        pixels = [recolored.get(px, px) for px in pixels]
+    return (w, h, pixels)
+
+def decode(image, recolor=False):
+    """Decode an image back into CLUT indices.
+
+    This is a (slow) reference implementation of the decoders used by
+    ``Draw565.blit()`` and is used to check the output of the encoders.
+    Images are decoded using the default colours, so foreground pixels are
+    white (215) and the recolourable greys are 254 and 219.
+
+    :param recolor: Decode the pixels that are recoloured when the image
+                    is drawn as -1 (c1), -2 (c2) and -3 (fg) instead
+    :return: List of rows, each a tuple of CLUT indices
+    """
+    try:
         if len(image) == 3:
-            print(f'{extra_indent}# {depth}-bit RLE, generated from {fname}, '
-                  f'{len(image[2])} bytes')
-            (x, y, pixels) = image
-            print(f'{extra_indent}{varname(fname)} = (')
-            print(f'{extra_indent}    {x}, {y},')
+            (w, h, pixels) = _decode_1bit(image, recolor)
+        elif image[0] == 2:
+            (w, h, pixels) = _decode_2bit(image, recolor)
+        elif image[0] == 3:
+            (w, h, pixels) = _decode_lz(image, recolor)
         else:
-            print(f'{extra_indent}# {depth}-bit RLE, generated from {fname}, '
-                  f'{len(image)} bytes')
-            pixels = image[3:]
-            print(f'{extra_indent}{varname(fname)} = (')
-            print(f'{extra_indent}    {image[0:1]}')
-            print(f'{extra_indent}    {image[1:3]}')
-
-        # Split the bytestring to ensure each line is short enough to
-        # be absorbed on the target if needed.
-        for i in range(0, len(pixels), 16):
-            print(f'{extra_indent}    {pixels[i:i+16]}')
-        print(f'{extra_indent})')
-
-    if args.ascii:
-        print()
-        decode_to_ascii(image)
+            raise ValueError('Unknown image format')
+    except (IndexError, KeyError):
+        raise ValueError('Truncated or corrupt image')
+
+    if len(pixels) != w * h:
+        raise ValueError(f'Decoded {len(pixels)} pixels, expected {w * h}')
+    return [tuple(pixels[y*w:(y+1)*w]) for y in range(h)]
+
+def render_py(image, fname, name, kind, indent=''):
+    """Render an image as python source code."""
+    lines = []
+    if len(image) == 3:
+        lines.append(f'{indent}# {kind}, generated from {fname}, '
+                     f'{len(image[2])} bytes')
+        (x, y, pixels) = image
+        lines.append(f'{indent}{name} = (')
+        lines.append(f'{indent}    {x}, {y},')
+    else:
+        lines.append(f'{indent}# {kind}, generated from {fname}, '
+                     f'{len(image)} bytes')
+        pixels = image[3:]
+        lines.append(f'{indent}{name} = (')
+        lines.append(f'{indent}    {image[0:1]}')
+        lines.append(f'{indent}    {image[1:3]}')
+
+    # Split the bytestring to ensure each line is short enough to
+    # be absorbed on the target if needed.
+    for i in range(0, len(pixels), 16):
+        lines.append(f'{indent}    {pixels[i:i+16]}')
+    lines.append(f'{indent})')
+
+    return '\n'.join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description='RLE encoder tool.')
+    parser.add_argument('files', nargs='*',
+                        help='files to be encoded')
+    parser.add_argument('--ascii', action='store_true',
+                        help='Run the resulting image(s) through an ascii art decoder')
+    parser.add_argument('--c', action='store_true',
+                        help='Render the output as C instead of python')
+    parser.add_argument('--indent', default=0, type=int,
+                        help='Add extra indentation in the generated code')
+    parser.add_argument('--2bit', action='store_true', dest='twobit',
+                        help='Generate 2-bit image')
+    parser.add_argument('--optimize', action='store_true',
+                        help='Choose the palette entries of 2-bit images to '
+                             'minimize the number of palette changes')
+    parser.add_argument('--8bit', action='store_true', dest='eightbit',
+                        help='Generate 8-bit image')
+    parser.add_argument('--lz', action='store_true',
+                        help='Generate palette RLE image (with row references)')
+    parser.add_argument('--clut', action='store_true',
+                        help='Generate the RGB565 lookup table used by the decoder')
+
+    args = parser.parse_args()
+    if args.clut:
+        render_clut()
+        return
+
+    from PIL import Image
+
+    extra_indent = ' ' * args.indent
+    if args.eightbit:
+        encoder = encode_8bit
+        kind = '8-bit RLE'
+    elif args.twobit:
+        encoder = lambda im: encode_2bit(im, args.optimize)
+        kind = '2-bit RLE'
+    elif args.lz:
+        encoder = encode_lz
+        kind = 'Palette RLE'
+    else:
+        encoder = encode
+        kind = '1-bit RLE'
+
+    for fname in args.files:
+        image = encoder(Image.open(fname))
+
+        if args.c:
+            render_c(image, fname)
+        else:
+            print(render_py(image, fname, varname(fname), kind, extra_indent))
+
+        if args.ascii:
+            print()
+            decode_to_ascii(image)
+
+if __name__ == '__main__':
+    main()
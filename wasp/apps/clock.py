@@ -40,6 +40,10 @@ class ClockApp():
     def foreground(self):
         """Activate the application."""
         self.on_screen = ( -1, -1, -1, -1, -1, -1 )
+
+        # Enough to cache the status bar icons (which are redrawn every
+        # second) and one of the digits
+        wasp.watch.drawable.set_cache(sprites=9216)
         self.draw()
         wasp.system.request_tick(1000)
 
@@ -56,7 +60,7 @@ class ClockApp():
         """Redraw the display from scratch."""
         draw = wasp.watch.drawable
 
-        draw.fill()
+        draw.clear()
         draw.rleblit(digits.clock_colon, pos=(2*48, 80), fg=0xb5b6)
         self.on_screen = ( -1, -1, -1, -1, -1, -1 )
         self.update()
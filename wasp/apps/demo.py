@@ -60,172 +60,84 @@ class Hack:
     """
     pass
 
-# 1-bit RLE, generated from res/pine64.png, 961 bytes
+# Palette RLE, generated from res/pine64.png, 965 bytes
 pine64 = (
-    240, 240,
-    b'x\x01\xee\x03\xec\x05\xea\x07\xe8\t\xe6\x0b\xe4\r\xe2\x0f'
-    b'\xe0\x11\xde\x13\xdc\x15\xda\x17\xd8\x19\xd6\x1b\xd4\x1d\xd2\x1f'
-    b"\xd1 \xcf!\xce#\xcc%\xca'\xc8)\xc6+\xc4-"
-    b"\xc3-\xc6'\xcb#\xd0\x1d\xb6\x02\x1d\x19\x1b\x03\x99\x05"
-    b'\x1e\x13\x1c\x05\x99\x08\x1d\x0f\x1c\x08\x98\n\x1e\t\x1d\n'
-    b'\x97\r\x1e\x05\x1c\r\x97\x10:\x10\x96\x126\x12\x95\x15'
-    b'1\x15\x95\x17-\x18\x93\x1b(\x1a\x93\x1d$\x1c\x93\x1e'
-    b'!\x1f\x91\x1d%\x1d\x91\x1b*\x1a\x91\x19.\x19\x8f\x17'
-    b'\x19\x01\x19\x17\x8f\x15\x19\x05\x19\x15\x8f\x13\x19\t\x1a\x13'
-    b'\x8d\x12\x19\r\x1a\x11\x8d\x10\x18\x12\x1a\x10\x8c\r\x19\x17'
-    b'\x19\x0e\x8b\x0c\x19\x1b\x19\x0c\x8b\n\x19\x1f\x1a\n\x89\t'
-    b'\x18$\x1a\x08\x89\x07\x18)\x19\x06\x89\x04\x19-\x19\x05'
-    b'\x87\x03\x191\x19\x03\x87\x01\x186\x19\x01\x9e;\xb3?'
-    b'\xafC\xabG\xa6L\xa2Q\x9dU\x98Z\x94^\x90c'
-    b'\x8bg\x87k\x85kn\x01\x18f\x1a\x01V\x03\x19a'
-    b'\x1a\x03V\x05\x19]\x1a\x05V\x07\x19Y\x19\x08V\n'
-    b'\x18T\x1a\nV\x0c\x19O\x1a\x0cV\x0e\x19K\x19\x0f'
-    b'V\x11\x18G\x19\x11V\x13\x18B\x1a\x13V\x16\x18='
-    b'\x19\x16V\x18\x189\x19\x18V\x1a\x185\x19\x1aV\x1c'
-    b"\x181\x19\x1cV\x1f\x18+\x19\x1fV!\x18'\x19!"
-    b'V#\x18#\x19#V%\x18\x1f\x18&V(\x17\x1a'
-    b'\x19(V*\x18\x15\x19*V,\x18\x11\x18-V/'
-    b'\x17\r\x18/V1\x17\x08\x191V4\x17\x03\x184'
-    b'V6.6V8*8V:&:V= ='
-    b'V<"<V:&:V7+8V505'
-    b'V3\x19\x01\x1a3V0\x1a\x05\x1b0V.\x19\x0b'
-    b"\x1a.V,\x19\x0f\x1a,V)\x1a\x13\x1b)V'"
-    b"\x1a\x17\x1b'V%\x19\x1d\x1a%V#\x19!\x1a#"
-    b'V \x1a%\x1b V\x1e\x1a)\x1b\x1eV\x1c\x1a.'
-    b'\x1a\x1cV\x19\x1b2\x1b\x19V\x17\x1a7\x1b\x17V\x14'
-    b'\x1b<\x1a\x15V\x12\x1b@\x1b\x12V\x10\x1aE\x1b\x10'
-    b'V\x0e\x1aI\x1b\x0eV\x0b\x1bM\x1c\x0bV\t\x1bQ'
-    b'\x1c\tV\x07\x1aW\x1b\x07V\x04\x1b[\x1b\x05V\x02'
-    b'\x1b_\x1c\x02qc\x8ai\x85m\x81q}uyz'
-    b'vyZ\x03\x1cu\x1d\x03=\x04\x1cq\x1d\x04>\x06'
-    b'\x1cm\x1d\x06?\x08\x1ch\x1c\x08@\n\x1cd\x1c\n'
-    b'A\x0c\x1b_\x1c\x0cB\x0e\x1b[\x1c\x0eB\x11\x1bV'
-    b'\x1b\x11C\x12\x1bR\x1b\x12D\x14\x1bM\x1c\x14E\x16'
-    b'\x1aI\x1b\x16F\x18\x1aE\x1b\x18G\x1a\x1a?\x1b\x1a'
-    b'H\x1c\x1a;\x1b\x1cI\x1e\x197\x1a\x1eJ \x193'
-    b'\x1a J"\x1a-\x1b!L$\x19)\x1a$L&'
-    b"\x19%\x1a&M(\x18!\x1a'N*\x19\x1c\x19*"
-    b'O+\x19\x18\x19+P.\x18\x13\x19.Q/\x18\x0f'
-    b'\x19/R2\x18\n\x182S3\x18\x05\x193T5'
-    b'\x18\x01\x195T8,8U9(9V<"<'
-    b'W< <X:$:Y7(7Z4-5'
-    b'Z222[/\x1a\x01\x1b/\\-\x19\x06\x1b-'
-    b"])\x1a\x0b\x1b)^'\x1a\x0f\x1b'_$\x1a\x13"
-    b'\x1b$`!\x1a\x19\x1b!a\x1e\x1a\x1d\x1b\x1eb\x1c'
-    b'\x1a!\x1b\x1cc\x19\x1a%\x1b\x19d\x16\x1a*\x1c\x16'
-    b'd\x14\x1a/\x1b\x14e\x11\x1a3\x1b\x11f\x0f\x1a7'
-    b'\x1b\x0fg\x0b\x1a<\x1c\x0bh\t\x1a@\x1c\ti\x06'
-    b'\x1aE\x1b\x06j\x03\x1bI\x1c\x03\x86M\xa0S\x9bW'
-    b'\x97[\x93_\x8ee\x89i\x85m\x85i\x89e\x8d`'
-    b'\x93[\x97W\x9bS\x9fN\xa5I\xa9E\xadA\xb1<'
-    b'\xb68\xbb3\xbf/\xc3+\xc7&\xcd!\xd1\x1d\xd5\x19'
-    b'\xda\x13\xdf\x0f\xe2\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c'
-    b'\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c'
-    b'\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c'
-    b'\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c'
-    b's'
+    b'\x03'
+    b'\xf0\xf0'
+    b'\x82x\x01\xee\x03\xec\x05\xea\x07\xe8\t\xe6\x0b\xe4\r\xe2'
+    b'\x0f\xe0\x11\xde\x13\xdc\x15\xda\x17\xd8\x19\xd6\x1b\xd4\x1d\xd2'
+    b"\x1f\xd1 \xcf!\xce#\xcc%\xca'\xc8)\xc6+\xc4"
+    b"-\xc3-\xc6'\xcb#\xd0\x1d\xb6\x02\x1d\x19\x1b\x03\x99"
+    b'\x05\x1e\x13\x1c\x05\x99\x08\x1d\x0f\x1c\x08\x98\n\x1e\t\x1d'
+    b'\n\x97\r\x1e\x05\x1c\r\x97\x10:\x10\x96\x126\x12\x95'
+    b'\x151\x15\x95\x17-\x18\x93\x1b(\x1a\x93\x1d$\x1c\x93'
+    b'\x1e!\x1f\x91\x1d%\x1d\x91\x1b*\x1a\x91\x19.\x19\x8f'
+    b'\x17\x19\x01\x19\x17\x8f\x15\x19\x05\x19\x15\x8f\x13\x19\t\x1a'
+    b'\x13\x8d\x12\x19\r\x1a\x11\x8d\x10\x18\x12\x1a\x10\x8c\r\x19'
+    b'\x17\x19\x0e\x8b\x0c\x19\x1b\x19\x0c\x8b\n\x19\x1f\x1a\n\x89'
+    b'\t\x18$\x1a\x08\x89\x07\x18)\x19\x06\x89\x04\x19-\x19'
+    b'\x05\x87\x03\x191\x19\x03\x87\x01\x186\x19\x01\x9e;\xb3'
+    b'?\xafC\xabG\xa6L\xa2Q\x9dU\x98Z\x94^\x90'
+    b'c\x8bg\x87k\x85kn\x01\x18f\x1a\x01V\x03\x19'
+    b'a\x1a\x03V\x05\x19]\x1a\x05V\x07\x19Y\x19\x08V'
+    b'\n\x18T\x1a\nV\x0c\x19O\x1a\x0cV\x0e\x19K\x19'
+    b'\x0fV\x11\x18G\x19\x11V\x13\x18B\x1a\x13V\x16\x18'
+    b'=\x19\x16V\x18\x189\x19\x18V\x1a\x185\x19\x1aV'
+    b"\x1c\x181\x19\x1cV\x1f\x18+\x19\x1fV!\x18'\x19"
+    b'!V#\x18#\x19#V%\x18\x1f\x18&V(\x17'
+    b'\x1a\x19(V*\x18\x15\x19*V,\x18\x11\x18-V'
+    b'/\x17\r\x18/V1\x17\x08\x191V4\x17\x03\x18'
+    b'4V6.6V8*8V:&:V= '
+    b'=V<"<V:&:V7+8V50'
+    b'5V3\x19\x01\x1a3V0\x1a\x05\x1b0V.\x19'
+    b'\x0b\x1a.V,\x19\x0f\x1a,V)\x1a\x13\x1b)V'
+    b"'\x1a\x17\x1b'V%\x19\x1d\x1a%V#\x19!\x1a"
+    b'#V \x1a%\x1b V\x1e\x1a)\x1b\x1eV\x1c\x1a'
+    b'.\x1a\x1cV\x19\x1b2\x1b\x19V\x17\x1a7\x1b\x17V'
+    b'\x14\x1b<\x1a\x15V\x12\x1b@\x1b\x12V\x10\x1aE\x1b'
+    b'\x10V\x0e\x1aI\x1b\x0eV\x0b\x1bM\x1c\x0bV\t\x1b'
+    b'Q\x1c\tV\x07\x1aW\x1b\x07V\x04\x1b[\x1b\x05V'
+    b'\x02\x1b_\x1c\x02qc\x8ai\x85m\x81q}uy'
+    b'zvyZ\x03\x1cu\x1d\x03=\x04\x1cq\x1d\x04>'
+    b'\x06\x1cm\x1d\x06?\x08\x1ch\x1c\x08@\n\x1cd\x1c'
+    b'\nA\x0c\x1b_\x1c\x0cB\x0e\x1b[\x1c\x0eB\x11\x1b'
+    b'V\x1b\x11C\x12\x1bR\x1b\x12D\x14\x1bM\x1c\x14E'
+    b'\x16\x1aI\x1b\x16F\x18\x1aE\x1b\x18G\x1a\x1a?\x1b'
+    b'\x1aH\x1c\x1a;\x1b\x1cI\x1e\x197\x1a\x1eJ \x19'
+    b'3\x1a J"\x1a-\x1b!L$\x19)\x1a$L'
+    b"&\x19%\x1a&M(\x18!\x1a'N*\x19\x1c\x19"
+    b'*O+\x19\x18\x19+P.\x18\x13\x19.Q/\x18'
+    b'\x0f\x19/R2\x18\n\x182S3\x18\x05\x193T'
+    b'5\x18\x01\x195T8,8U9(9V<"'
+    b'<W< <X:$:Y7(7Z4-'
+    b'5Z222[/\x1a\x01\x1b/\\-\x19\x06\x1b'
+    b"-])\x1a\x0b\x1b)^'\x1a\x0f\x1b'_$\x1a"
+    b'\x13\x1b$`!\x1a\x19\x1b!a\x1e\x1a\x1d\x1b\x1eb'
+    b'\x1c\x1a!\x1b\x1cc\x19\x1a%\x1b\x19d\x16\x1a*\x1c'
+    b'\x16d\x14\x1a/\x1b\x14e\x11\x1a3\x1b\x11f\x0f\x1a'
+    b'7\x1b\x0fg\x0b\x1a<\x1c\x0bh\t\x1a@\x1c\ti'
+    b'\x06\x1aE\x1b\x06j\x03\x1bI\x1c\x03\x86M\xa0S\x9b'
+    b'W\x97[\x93_\x8ee\x89i\x85m\x85i\x89e\x8d'
+    b'`\x93[\x97W\x9bS\x9fN\xa5I\xa9E\xadA\xb1'
+    b'<\xb68\xbb3\xbf/\xc3+\xc7&\xcd!\xd1\x1d\xd5'
+    b'\x19\xda\x13\xdf\x0f\xe2\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4'
+    b'\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4'
+    b'\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4'
+    b'\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4\x0c\xe4'
+    b'\x0cs'
 )
 
 class Hack:
     pass
 
-# 1-bit RLE, generated from res/micropython.png, 1491 bytes
+# Palette RLE, generated from res/micropython.png, 62 bytes
 micropython = (
-    240, 240,
-    b'\xff\x00\xff\x00\xff\x00\xff\x00\xff\x00\xff\x00\xff\x00\xff\x00'
-    b'\xff\x00\xff\x00\xff\x00\xff\x00\xff\x00\xff\x00\xff\x00\x1fc'
-    b'\tc!c\tc!c\tc!c\tc!c'
-    b'\tc!c\tc!c\tc!c\tc!c'
-    b'\tc!c\tc!c\tc!c\tc!c'
-    b'\tc!c\tc!c\tc!c\tc!c'
-    b'\tc!c\tc!c\tc!c\tc!c'
-    b'\tc!c\tc!c\tc!c\tc!c'
-    b'\tc!c\tc!c\tc!c\tc!c'
-    b'\tc!c\tc!c\tc!c\tc!c'
-    b'\tc!c\tc!c\tc!c\tc!c'
-    b'\tc!c\tc!c\tc!c\tc!c'
-    b'\tc!c\tc!c\tc!c\tc!c'
-    b'\tc!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\t-\t-'
-    b'\t-!-\t-\t-\t-!-\tc\t-'
-    b'!-\tc\t-!-\tc\t-!-\tc'
-    b'\t-!-\tc\t-!-\tc\t-!-'
-    b'\tc\t\x12\x0c\x0f!-\tc\t\x12\x0c\x0f!-'
-    b'\tc\t\x12\x0c\x0f!-\tc\t\x12\x0c\x0f!-'
-    b'\tc\t\x12\x0c\x0f!-\tc\t\x12\x0c\x0f!-'
-    b'\tc\t\x12\x0c\x0f!-\tc\t\x12\x0c\x0f!-'
-    b'\tc\t\x12\x0c\x0f!-\tc\t\x12\x0c\x0f!-'
-    b'\tc\t\x12\x0c\x0f!-\tc\t\x12\x0c\x0f!-'
-    b'\tc\t\x12\x0c\x0f!-\tc\t\x12\x0c\x0f!-'
-    b'\tc\t\x12\x0c\x0f!-\tc\t\x12\x0c\x0f!-'
-    b'\tc\t\x12\x0c\x0f!-\tc\t\x12\x0c\x0f!-'
-    b'\tc\t\x12\x0c\x0f!-\tc\t\x12\x0c\x0f!-'
-    b'\tc\t\x12\x0c\x0f!-\tc\t-!-\tc'
-    b'\t-!-\tc\t-!-\tc\t-!-'
-    b'\tc\t-!-\tc\t-!-\tc\t-'
-    b'!-\tc\t-!-\tc\t-!-\tc'
-    b'\t-!-\tc\t-!-\tc\t-!-'
-    b'\tc\t-!-\tc\t-!-\tc\t-'
-    b'!-\tc\t-!-\tc\t-!-\tc'
-    b'\t-\xff\x00\xff\x00\xff\x00\xff\x00\xff\x00\xff\x00\xff\x00'
-    b'\xff\x00\xff\x00\xff\x00\xff\x00\xff\x00\xff\x00\xff\x00\xff\x00'
-    b'\xff\x00\x11'
+    b'\x03'
+    b'\xf0\xf0'
+    b'\x82\xf0\x00\x8d\x00\x00\x10c\tc\x11\x00\xaa\x00\x00\x10'
+    b'-\t-\t-\t-\x11\x00\xf2\x00\x00\x10-\tc'
+    b'\t-\x11\x00\x83\x00\x00\x10-\tc\t\x12\x0c\x0f\x11'
+    b'\x00\x92\x00\x16\x00\x8f\x00\x00\xf0\x00\x8e'
 )
 class DemoApp():
     """Application for live demos.
@@ -264,7 +176,7 @@ class DemoApp():
             else:
                 self._logo = pine64
             draw.fill()
-        draw.rleblit(self._logo, fg=colors[self._color])
+        draw.blit(self._logo, 0, 0, fg=colors[self._color])
         self._color += 1
         if self._color >= len(colors):
             self._color = 0
@@ -211,18 +211,35 @@ class GameOfLifeApp():
 
         display = wasp.watch.display
         lb = display.linebuffer
-        alive = memoryview(lb)[0:2*16]
         self._color = xorshift12(self._color)
-        rgbhi = get_color(self._color)
-        rgblo = rgbhi & 0xff
-        rgbhi >>= 8
-        for i in range(0, len(alive), 2):
-            alive[i] = rgbhi
-            alive[i+1] = rgblo
-        for i in (0, 3,  12, 15):
-            alive[i*2] = 0
-            alive[i*2+1] = 0
-        dead = memoryview(lb)[2*16:4*16]
+        if display.bpp == 12:
+            # Pairs of RGB444 pixels are packed into three bytes
+            rgb = get_color(self._color)
+            rgb = ((rgb >> 4) & 0xf00) | ((rgb >> 3) & 0xf0) | ((rgb >> 1) & 0xf)
+            alive = memoryview(lb)[0:3*8]
+            for i in range(0, len(alive), 3):
+                alive[i] = rgb >> 4
+                alive[i+1] = ((rgb & 0xf) << 4) | (rgb >> 8)
+                alive[i+2] = rgb & 0xff
+            for i in (0, 12):
+                alive[i*3//2] = 0
+                alive[i*3//2 + 1] &= 0x0f
+            for i in (3, 15):
+                alive[i*3//2] &= 0xf0
+                alive[i*3//2 + 1] = 0
+            dead = memoryview(lb)[3*8:6*8]
+        else:
+            alive = memoryview(lb)[0:2*16]
+            rgbhi = get_color(self._color)
+            rgblo = rgbhi & 0xff
+            rgbhi >>= 8
+            for i in range(0, len(alive), 2):
+                alive[i] = rgbhi
+                alive[i+1] = rgblo
+            for i in (0, 3,  12, 15):
+                alive[i*2] = 0
+                alive[i*2+1] = 0
+            dead = memoryview(lb)[2*16:4*16]
         for i in range(len(dead)):
             dead[i] = 0
 
@@ -2,8 +2,10 @@
 # Copyright (C) 2020 Daniel Thompson
 
 import wasp
-import machine
+import array
 import ppg
+import sampler
+import timeseries
 
 class HeartApp():
     """Heart Rate Sensing application.
@@ -26,19 +28,37 @@ class HeartApp():
         self._hrdata = ppg.PPG(wasp.watch.hrs.read_hrs())
         self._x = 0
 
+        # The sensor is read at 24Hz by a timer, the samples are collected
+        # (and processed) in batches by tick()
+        self._buf = array.array('i', [0] * 16)
+        self._sampler = sampler.Sampler(wasp.watch.hrs.read_hrs, 24)
+        self._sampler.start()
+
+        self._log = timeseries.TimeSeries('heart', timeseries.MEAN)
+
     def background(self):
+        self._sampler.stop()
         wasp.watch.hrs.disable()
+        self._log.flush()
+        del self._log
+        del self._sampler
+        del self._buf
         del self._hrdata
 
-    def _subtick(self, ticks):
-        """Notify the application that its periodic tick is due."""
+    def _process(self, spl):
+        """Process (and plot) a single sample."""
         draw = wasp.watch.drawable
 
-        spl = self._hrdata.preprocess(wasp.watch.hrs.read_hrs())
+        spl = self._hrdata.preprocess(spl)
 
-        if len(self._hrdata.data) >= 240:
-            draw.string('{} bpm'.format(self._hrdata.get_heart_rate()),
-                        0, 6, width=240)
+        # The heart rate is updated continuously but there's no need to
+        # redraw it more than once a second
+        count = self._hrdata.count
+        if count >= 240 and count % 24 == 0:
+            rate = self._hrdata.get_heart_rate()
+            draw.string('{} bpm'.format(rate), 0, 6, width=240)
+            if rate:
+                self._log.append(rate)
 
         # Graph is orange by default...
         color = 0xffc0
@@ -59,22 +79,13 @@ class HeartApp():
         self._x = x
 
     def tick(self, ticks):
-        """This is an outrageous hack but, at present, the RTC can only
-        wake us up every 125ms so we implement sub-ticks using a regular
-        timer to ensure we can read the sensor at 24Hz.
-        """
-        t = machine.Timer(id=1, period=8000000)
-        t.start()
-        self._subtick(1)
+        """Process any samples collected since the last tick."""
         wasp.system.keep_awake()
 
-        while t.time() < 41666:
-            pass
-        self._subtick(1)
-
-        while t.time() < 83332:
-            pass
-        self._subtick(1)
-
-        t.stop()
-        del t
+        buf = self._buf
+        while True:
+            n = self._sampler.read_into(buf)
+            for i in range(n):
+                self._process(buf[i])
+            if n < len(buf):
+                break
@@ -15,6 +15,17 @@ import icons
 import io
 import sys
 
+from micropython import const
+
+_LINE_HEIGHT = const(24)
+
+# The pager uses hardware scrolling and arranges for there to be exactly
+# 13 lines of text in the scrolling area (10 on the screen and 3 more that
+# are hidden) so that a line of text never wraps at the bottom of the
+# scrolling area.
+_SCROLL_LINES = const(13)
+_SCROLL_HEIGHT = const(_SCROLL_LINES * _LINE_HEIGHT)
+
 class PagerApp():
     """Show a long text message in a pager."""
     NAME = 'Pager'
@@ -27,17 +38,23 @@ class PagerApp():
     def foreground(self):
         """Activate the application."""
         wasp.system.request_event(wasp.EventMask.SWIPE_UPDOWN)
+        wasp.watch.display.set_scroll_area(0, _SCROLL_HEIGHT,
+                                           320 - _SCROLL_HEIGHT)
         self._redraw()
 
     def background(self):
-        """De-activate the application."""
+        """De-activate the application.
+
+        Conceal the display before the scroll area is reset otherwise the
+        unscrolled frame memory is briefly shown to the user.
+        """
+        wasp.watch.display.mute(True)
+        wasp.watch.display.set_scroll_area()
         self._chunks = None
         self._numpages = None
 
     def swipe(self, event):
         """Swipe to page up/down."""
-        mute = wasp.watch.display.mute
-
         if event[0] == wasp.EventType.UP:
             if self._page >= self._numpages:
                 wasp.system.navigate(wasp.EventType.BACK)
@@ -48,9 +65,7 @@ class PagerApp():
                 wasp.watch.vibrator.pulse()
                 return
             self._page -= 1
-        mute(True)
-        self._draw()
-        mute(False)
+        self._scroll_to(self._page * 9)
 
     def _redraw(self):
         """Redraw from scratch (jump to the first page)"""
@@ -61,22 +76,64 @@ class PagerApp():
 
     def _draw(self):
         """Draw a page from scratch."""
+        top = self._page * 9
+        self._top = top
+        wasp.watch.display.scroll(self._row(top))
+        for i in range(top, top + 10):
+            self._draw_line(i)
+        self._draw_scroll()
+
+    def _row(self, line):
+        """Find the frame memory row used to display a line of text."""
+        return (line * _LINE_HEIGHT) % _SCROLL_HEIGHT
+
+    def _draw_line(self, line):
+        """Draw a single line of text (or a blank line)."""
         draw = wasp.watch.drawable
-        draw.fill()
+        chunks = self._chunks
+        y = self._row(line)
 
-        page = self._page
-        i = page * 9
-        j = i + 11
-        chunks = self._chunks[i:j]
-        for i in range(len(chunks)-1):
-            sub = self._msg[chunks[i]:chunks[i+1]].rstrip()
-            draw.string(sub, 0, 24*i)
+        draw.fill(0, 0, y, 240, _LINE_HEIGHT)
+        if line + 1 < len(chunks):
+            sub = self._msg[chunks[line]:chunks[line+1]].rstrip()
+            draw.string(sub, 0, y)
 
+    def _draw_scroll(self):
+        """Draw the scroll indicator at the bottom of the screen."""
         scroll = self._scroll
-        scroll.up = page > 0
-        scroll.down = page < self._numpages
+        scroll.up = self._page > 0
+        scroll.down = self._page < self._numpages
+        scroll.move(240-18, self._row(self._top + 9))
         scroll.draw()
 
+    def _scroll_to(self, top):
+        """Smoothly scroll until the requested line is at the top.
+
+        Only the lines of text that are revealed by the scroll are drawn,
+        everything else is moved by the display hardware.
+        """
+        display = wasp.watch.display
+        line = self._top
+
+        # Redraw the bottom line to remove the scroll indicator
+        self._draw_line(line + 9)
+
+        while line != top:
+            if top > line:
+                self._draw_line(line + 10)
+                step = _LINE_HEIGHT // 3
+            else:
+                self._draw_line(line - 1)
+                step = -_LINE_HEIGHT // 3
+
+            row = self._row(line)
+            for i in range(1, 4):
+                display.scroll((row + i*step) % _SCROLL_HEIGHT)
+            line += 1 if top > line else -1
+
+        self._top = top
+        self._draw_scroll()
+
 class NotificationApp(PagerApp):
     NAME = 'Notifications'
 
@@ -45,6 +45,9 @@ class StepCounterApp():
         lc = self._last_clock
         self._last_clock = (lc[0], lc[1], lc[2], -1, -1, -1)
 
+        # Enough to cache the digits of the step count that don't change
+        # very often
+        wasp.watch.drawable.set_cache(glyphs=8192)
         self._draw()
         wasp.system.request_tick(1000)
 
@@ -55,7 +58,7 @@ class StepCounterApp():
     def _draw(self):
         """Draw the display from scratch."""
         draw = wasp.watch.drawable
-        draw.fill()
+        draw.clear()
         draw.blit(feet, 12, 132-24)
 
         self._last_count = -1
@@ -73,9 +76,10 @@ class StepCounterApp():
             draw.set_color(0x7bef)
             draw.string(t1, 48, 12, 240-96)
 
+            # The system manager records the steps and resets the
+            # count at midnight
             if now[2] != self._last_clock[2]:
-                watch.accel.steps = 0
-                draw.fill(0, 60, 132-18, 180, 36)
+                draw.clear(60, 132-18, 180, 36)
 
             self._last_clock = now
             self._meter.update()
@@ -18,6 +18,9 @@ class StopwatchApp():
         """Activate the application."""
         self._last_clock = ( -1, -1, -1, -1, -1, -1 )
 
+        # Enough to cache the centisecond digits (which are redrawn on
+        # every tick) with a little to spare for the seconds
+        wasp.watch.drawable.set_cache(glyphs=10240)
         self._draw()
         wasp.system.request_tick(97)
         wasp.system.request_event(wasp.EventMask.TOUCH |
@@ -68,7 +71,7 @@ class StopwatchApp():
         draw = wasp.watch.drawable
         splits = self._splits
         if 0 == len(splits):
-            draw.fill(0, 0, 120, 240, 120)
+            draw.clear(0, 120, 240, 120)
             return
         y = 240 - 6 - (len(splits) * 24)
         
@@ -91,7 +94,7 @@ class StopwatchApp():
     def _draw(self):
         """Draw the display from scratch."""
         draw = wasp.watch.drawable
-        draw.fill()
+        draw.clear()
 
         self._last_count = -1
         self._update()
@@ -134,7 +137,7 @@ class StopwatchApp():
             draw.set_color(0xc67f)
             w = fonts.width(fonts.sans36, t1)
             draw.string(t1, 180-w, 120-36)
-            draw.fill(0, 0, 120-36, 180-w, 36)
+            draw.clear(0, 120-36, 180-w, 36)
 
             draw.set_font(fonts.sans24)
             draw.string(t2, 180, 120-36+18, width=46)
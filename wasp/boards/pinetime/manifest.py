@@ -14,6 +14,7 @@ freeze('../..',
         'apps/stopwatch.py',
         'apps/testapp.py',
         'boot.py',
+        'clut8.py',
         'draw565.py',
         'drivers/bma421.py',
         'drivers/battery.py',
@@ -31,7 +32,9 @@ freeze('../..',
         'gadgetbridge.py',
         'icons.py',
         'ppg.py',
+        'sampler.py',
         'shell.py',
+        'timeseries.py',
         'wasp.py',
         'widgets.py',
     ),
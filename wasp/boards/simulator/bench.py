@@ -0,0 +1,250 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2020 Daniel Thompson
+
+"""Host-side benchmarks for the drawing library and applications.
+
+Runs the workloads from the self test application, a full redraw of
+every registered application and a couple of minutes of ticks for the
+applications that redraw continuously, using the headless simulator. For
+each workload we report the (best) wall time, the SPI traffic it
+generates, the estimated time the traffic would occupy the bus on a real
+watch, the hit rates of the drawing caches and the memory allocated by
+the host Python. Results are written as JSON.
+
+If a baseline (a previous set of results) is provided then the results are
+compared against it and the exit code reports whether anything regressed.
+
+Usage::
+
+    python3 wasp/boards/simulator/bench.py [-o results.json]
+                                           [--baseline old.json]
+                                           [--threshold 5]
+                                           [--time-threshold 25]
+
+(with ``.:wasp/boards/simulator:wasp`` in ``PYTHONPATH``, see ``make
+bench``).
+"""
+
+import os
+
+os.environ.setdefault('WASP_HEADLESS', '1')
+os.environ.setdefault('WASP_FAST_FORWARD', '1')
+os.environ.setdefault('WASP_EPOCH', '1577836800')
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import sys
+import time
+import tracemalloc
+
+import display
+import simtime
+import spistats
+
+# The simulated peripherals log to stdout, keep it clean for the results
+with contextlib.redirect_stdout(sys.stderr):
+    import wasp
+
+# Metrics that are compared against a baseline (wall time is handled
+# separately because it is noisy)
+DETERMINISTIC = ('data_bytes', 'transactions', 'bus_us', 'peak_heap_bytes')
+
+def _testapp():
+    for app in wasp.system.launcher_ring:
+        if app.NAME == 'Self Test':
+            return app
+    raise RuntimeError('Self Test application is not registered')
+
+def _test(name, method):
+    def run():
+        app = _testapp()
+        app.test = name
+        getattr(app, method)()
+        wasp.watch.drawable.flush()
+    return run
+
+def _redraw(app):
+    def run():
+        wasp.system.switch(app)
+    return run
+
+def _app(name):
+    for app in wasp.system.quick_ring + wasp.system.launcher_ring:
+        if app.NAME == name:
+            return app
+    raise RuntimeError(name + ' application is not registered')
+
+def _ticks(app, ms, count):
+    def run():
+        for i in range(count):
+            simtime.sleep(ms / 1000)
+            app.tick(1)
+            wasp.watch.drawable.flush()
+    return run
+
+def _setup_switch(name):
+    def setup():
+        wasp.system.switch(_app('Timer' if name == 'Clock' else 'Clock'))
+        wasp.system.switch(_app(name))
+    return setup
+
+def _setup_stopwatch():
+    app = _app('Timer')
+    wasp.system.switch(_app('Clock'))
+    wasp.system.switch(app)
+    app._reset()
+    app.press(wasp.EventType.HOME, True)
+
+def workloads():
+    """Collect the workloads as (name, setup, run) tuples."""
+    testapp = _testapp()
+    def setup_testapp():
+        wasp.system.switch(testapp)
+
+    loads = [
+        ('testapp.fill', setup_testapp, _test('Fill', '_benchmark_fill')),
+        ('testapp.fill-h', setup_testapp, _test('Fill-H', '_benchmark_fill')),
+        ('testapp.fill-v', setup_testapp, _test('Fill-V', '_benchmark_fill')),
+        ('testapp.rle', setup_testapp, _test('RLE', '_benchmark_rle')),
+        ('testapp.string', setup_testapp, _test('String', '_benchmark_string')),
+        ('testapp.wrap', setup_testapp, _test('Wrap', '_benchmark_wrap')),
+    ]
+
+    apps = wasp.system.quick_ring + wasp.system.launcher_ring
+    for app in apps:
+        # Switch to a different application first so that every redraw
+        # starts from the same place
+        other = apps[1] if app is apps[0] else apps[0]
+        loads.append(('redraw.' + app.NAME,
+                      lambda other=other: wasp.system.switch(other),
+                      _redraw(app)))
+
+    # Applications that redraw continuously (and rely on the caches)
+    loads.append(('tick.Clock', _setup_switch('Clock'),
+                  _ticks(_app('Clock'), 1000, 120)))
+    loads.append(('tick.Steps', _setup_switch('Steps'),
+                  _ticks(_app('Steps'), 1000, 120)))
+    loads.append(('tick.Timer', _setup_stopwatch,
+                  _ticks(_app('Timer'), 97, 1200)))
+
+    return loads
+
+def measure(stats, setup, run, repeat):
+    """Measure a single workload."""
+    result = {}
+
+    # Traffic is deterministic so a single run is enough
+    setup()
+    stats.reset()
+    run()
+    result.update(stats.total.as_dict(stats.model))
+    for (name, (hits, misses)) in stats.caches.items():
+        result[name + '_hits'] = hits
+        result[name + '_misses'] = misses
+
+    # Time the workload (taking the best of several runs)
+    best = None
+    for i in range(repeat):
+        setup()
+        gc.collect()
+        t = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - t
+        best = elapsed if best is None or elapsed < best else best
+    result['wall_us'] = round(best * 1000000, 1)
+
+    # Measure the memory separately (tracing slows everything down). The
+    # simulated display is disconnected whilst we do this so that only
+    # allocations made by wasp-os itself are counted.
+    setup()
+    gc.collect()
+    gc.disable()
+    display.spi_st7789_sim.write = lambda data: None
+    tracemalloc.start()
+    blocks = sys.getallocatedblocks()
+    (base, _) = tracemalloc.get_traced_memory()
+    run()
+    (current, peak) = tracemalloc.get_traced_memory()
+    result['net_blocks'] = sys.getallocatedblocks() - blocks
+    tracemalloc.stop()
+    del display.spi_st7789_sim.write
+    gc.enable()
+    result['net_heap_bytes'] = current - base
+    result['peak_heap_bytes'] = peak - base
+
+    return result
+
+def compare(results, baseline, threshold, time_threshold):
+    """Compare results with a baseline, return a list of regressions."""
+    regressions = []
+    for (name, result) in sorted(results.items()):
+        old = baseline.get(name)
+        if not old:
+            continue
+        for metric in DETERMINISTIC + ('wall_us',):
+            if metric not in old or metric not in result:
+                continue
+            limit = time_threshold if metric == 'wall_us' else threshold
+            if result[metric] > old[metric] * (1 + limit / 100):
+                regressions.append('{}: {} {} -> {} (+{:.1f}%)'.format(
+                    name, metric, old[metric], result[metric],
+                    100 * (result[metric] - old[metric]) / max(old[metric], 1)))
+    return regressions
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-o', '--output',
+            help='Write the results to a file (instead of stdout)')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+            help='Number of timing runs for each workload (default: 5)')
+    parser.add_argument('-k', '--filter', default='',
+            help='Only run workloads whose name contains this string')
+    parser.add_argument('--baseline',
+            help='Compare with the results of a previous run')
+    parser.add_argument('--threshold', type=float, default=5,
+            help='Allowed increase (in %%) of traffic and memory (default: 5)')
+    parser.add_argument('--time-threshold', type=float, default=25,
+            help='Allowed increase (in %%) of wall time (default: 25)')
+    args = parser.parse_args(argv)
+
+    stats = spistats.install(wasp.watch.display, wasp.watch.drawable)
+
+    results = {}
+    for (name, setup, run) in workloads():
+        if args.filter not in name:
+            continue
+        # Keep the applications quiet (some print to the console)
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[name] = measure(stats, setup, run, args.repeat)
+        r = results[name]
+        lookups = r['glyphs_hits'] + r['glyphs_misses'] + \
+                  r['sprites_hits'] + r['sprites_misses']
+        hits = '{:>5.1f}% hits'.format(100 * (r['glyphs_hits'] +
+                r['sprites_hits']) / lookups) if lookups else ''
+        print('{:<24} {:>10.0f} us {:>8} bytes {}'.format(name,
+                r['wall_us'], r['data_bytes'], hits), file=sys.stderr)
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold,
+                              args.time_threshold)
+        for r in regressions:
+            print('REGRESSION: ' + r, file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -1,18 +1,42 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 # Copyright (C) 2020 Daniel Thompson
 
-""" Simulated ST7789 display and CST816S touchscreen. """
-
+""" Simulated ST7789 display and CST816S touchscreen.
+
+By default the simulated display is shown in an SDL window. Set
+``WASP_HEADLESS=1`` to run without SDL, in which case the frame memory is
+only kept in memory. In either mode :py:func:`save_png` and
+:py:func:`write_frame` can be used to capture the display and, if
+``WASP_FRAME_STREAM`` names a file, every frame shown on the panel will be
+appended to it as raw 240x240 RGB888 data.
+
+Input can be recorded and replayed, see :py:mod:`replay`.
+"""
+
+import numpy
+import os
+import replay
+import simtime
+import struct
 import sys
-import sdl2
-import sdl2.ext
+import zlib
+
+HEADLESS = bool(os.environ.get('WASP_HEADLESS'))
+if not HEADLESS:
+    import sdl2
+    import sdl2.ext
 
 CASET = 0x2a
 RASET = 0x2b
 RAMWR = 0x2c
+VSCRDEF = 0x33
+COLMOD = 0x3a
+VSCSAD = 0x37
 
 WIDTH = 240
 HEIGHT = 240
+FRAME_HEIGHT = 320
+FRAME_RATE = 60
 
 SKIN = {
     'fname' : 'res/simulator_skin.png',
@@ -30,12 +54,81 @@ class ST7789Sim(object):
         self.rowclip = [0, HEIGHT-1]
         self.cmd = 0
 
+        # The frame memory is taller than the panel. We keep a (RGB565)
+        # copy of it so that we can emulate hardware scrolling.
+        self.frame = numpy.zeros((FRAME_HEIGHT, WIDTH), numpy.uint16)
+        self.scroll_area = (0, FRAME_HEIGHT, 0)
+        self.scroll = 0
+
+        # Pixels can straddle SPI transfers (especially in 12-bit mode
+        # where they straddle byte boundaries too) so we must remember
+        # any partial pixel. In 12-bit mode this is a list of nibbles.
+        self.bpp = 16
+        self.partial = ()
+
+        # Updating the window is expensive so it is rate limited
+        self.dirty = True
+        self.last_refresh = 0
+
+    def screen_rows(self):
+        """Find which frame memory row is displayed on each panel row."""
+        (tfa, vsa, bfa) = self.scroll_area
+        rows = numpy.arange(HEIGHT)
+        scrolled = (rows >= tfa) & (rows < tfa + vsa)
+        rows[scrolled] = tfa + ((rows[scrolled] - tfa + self.scroll - tfa) % vsa)
+        return rows
+
+    def refresh(self, force=False):
+        """Redraw the panel from the frame memory.
+
+        Unless forced, the window is updated at most FRAME_RATE times a
+        second.
+        """
+        now = simtime.monotonic()
+        if not force and now - self.last_refresh < 1 / FRAME_RATE:
+            return
+        self.last_refresh = now
+
+        if self.dirty:
+            self.dirty = False
+            if frame_stream:
+                write_frame(frame_stream)
+            if not HEADLESS:
+                rgb = self.frame[self.screen_rows()].astype(numpy.uint32)
+                rgb = (((rgb & 0xf800) << 8) |
+                       ((rgb & 0x07e0) << 5) |
+                       ((rgb & 0x001f) << 3))
+                (x, y) = SKIN['adjust']
+                pixelview = sdl2.ext.pixels2d(windowsurface)
+                pixelview[x:x+WIDTH, y:y+HEIGHT] = rgb.T
+                # Forcibly release the surface to ensure it is unlocked
+                del pixelview
+        if not HEADLESS:
+            window.refresh()
+
+    def rgb888(self):
+        """Get the pixels currently shown on the panel.
+
+        :returns: A (height, width, 3) array of RGB888 pixels
+        """
+        rgb = self.frame[self.screen_rows()]
+        out = numpy.empty((HEIGHT, WIDTH, 3), numpy.uint8)
+        out[:, :, 0] = (rgb >> 8) & 0xf8
+        out[:, :, 1] = (rgb >> 3) & 0xfc
+        out[:, :, 2] = (rgb << 3) & 0xf8
+        return out
+
     def write(self, data):
-        if len(data) == 1:
-            # Assume if we get a byte at a time then it is command.
-            # This is a simplification do we don't have to track
-            # the D/C pin from within the simulator.
+        if len(data) == 1 and self.cmd != COLMOD:
+            # Assume if we get a byte at a time then it is command
+            # (unless it is the parameter for COLMOD). This is a
+            # simplification do we don't have to track the D/C pin from
+            # within the simulator.
             self.cmd = data[0]
+            if self.cmd == RAMWR:
+                self.x = self.colclip[0]
+                self.y = self.rowclip[0]
+            self.partial = ()
 
         elif self.cmd == CASET:
             self.colclip[0] = (data[0] << 8) + data[1]
@@ -47,40 +140,82 @@ class ST7789Sim(object):
             self.rowclip[1] = (data[2] << 8) + data[3]
             self.y = self.rowclip[0]
 
+        elif self.cmd == COLMOD:
+            self.bpp = 12 if (data[0] & 7) == 3 else 16
+            self.cmd = 0
+
+        elif self.cmd == VSCRDEF:
+            self.scroll_area = ((data[0] << 8) + data[1],
+                                (data[2] << 8) + data[3],
+                                (data[4] << 8) + data[5])
+            self.dirty = True
+            self.refresh()
+
+        elif self.cmd == VSCSAD:
+            self.scroll = (data[0] << 8) + data[1]
+            self.dirty = True
+            self.refresh()
+
         elif self.cmd == RAMWR:
-            #pixelview = sdl2.ext.PixelView(windowsurface)
-            pixelview = sdl2.ext.pixels2d(windowsurface)
-
-            half = False
-            for d in data:
-                if not half:
-                    rgb = d << 8
-                    half = True
-                    continue
-                rgb |= d
-                half = False
-
-                #pixel = ((rgb & 0xf800) >> 8,
-                #         (rgb & 0x07e0) >> 3,
-                #         (rgb & 0x001f) << 3)
-                pixel = (((rgb & 0xf800) << 8) +
-                         ((rgb & 0x07e0) << 5) +
-                         ((rgb & 0x001f) << 3))
-            
-                pv_x = self.x + SKIN['adjust'][0]
-                pv_y = self.y + SKIN['adjust'][1]
-                pixelview[pv_x][pv_y] = pixel
-
-                self.x += 1
-                if self.x > self.colclip[1]:
-                    self.x = self.colclip[0]
-                    self.y += 1
-                if self.y > self.rowclip[1]:
-                    self.y = self.rowclip[0]
-            
-            # Forcibly release the surface to ensure it is unlocked
-            del pixelview
-            window.refresh()
+            if self.bpp == 12:
+                pixels = self.decode444(data)
+            else:
+                pixels = self.decode565(data)
+            self.draw(pixels)
+            self.dirty = True
+            self.refresh()
+
+    def decode565(self, data):
+        """Convert (big endian) RGB565 pixel data to an array of pixels."""
+        data = bytes(self.partial) + bytes(data)
+        end = len(data) & ~1
+        self.partial = data[end:]
+        return numpy.frombuffer(data, '>u2', end // 2).astype(numpy.uint16)
+
+    def decode444(self, data):
+        """Convert packed RGB444 pixel data to an array of RGB565 pixels.
+
+        Every three bytes hold two pixels. Any incomplete pixel at the end
+        of the data is kept until the next write.
+        """
+        data = numpy.frombuffer(data, numpy.uint8)
+        nibbles = numpy.empty(len(self.partial) + 2*len(data), numpy.uint16)
+        nibbles[:len(self.partial)] = self.partial
+        nibbles[len(self.partial)::2] = data >> 4
+        nibbles[len(self.partial)+1::2] = data & 0xf
+        end = len(nibbles) - (len(nibbles) % 3)
+        self.partial = list(nibbles[end:])
+
+        rgb = nibbles[:end].reshape(-1, 3)
+        return (((rgb[:, 0] << 12) | ((rgb[:, 0] >> 3) << 11)) |
+                ((rgb[:, 1] << 7) | ((rgb[:, 1] >> 2) << 5)) |
+                ((rgb[:, 2] << 1) | (rgb[:, 2] >> 3)))
+
+    def draw(self, pixels):
+        """Write pixels to the frame memory, wrapping at the window edges."""
+        (x0, x1) = self.colclip
+        (y0, y1) = self.rowclip
+        w = x1 - x0 + 1
+        area = w * (y1 - y0 + 1)
+        n = len(pixels)
+        if not n or area <= 0:
+            return
+
+        pos = (self.y - y0) * w + (self.x - x0)
+        if n > area:
+            # Only the last lap around the window is visible
+            pos += n - area
+            pixels = pixels[n - area:]
+
+        index = (pos + numpy.arange(len(pixels))) % area
+        rows = y0 + index // w
+        cols = x0 + index % w
+        visible = (rows < FRAME_HEIGHT) & (cols < WIDTH)
+        self.frame[rows[visible], cols[visible]] = pixels[visible]
+
+        pos = (pos + len(pixels)) % area
+        self.x = x0 + pos % w
+        self.y = y0 + pos // w
 
 class CST816SSim():
     def __init__(self):
@@ -132,12 +267,12 @@ class CST816SSim():
         self.down_y = button.y
 
         if self.down_x < 50:
-            pins['BUTTON'].value(0)
+            press_button(pins, True)
 
 
     def handle_mousebuttonup(self, button, pins):
         if self.down_x < 50:
-            pins['BUTTON'].value(1)
+            press_button(pins, False)
             return
 
         down_x = max(0, min(239, self.down_x-SKIN['adjust'][0]))
@@ -159,9 +294,25 @@ class CST816SSim():
         self.regs[6] = up_y;
         self.raise_interrupt(pins)
 
+    def inject(self, gesture, x, y, pins):
+        """Simulate a touch event (without needing SDL)."""
+        self.regs[1] = gesture
+        self.regs[3] = 0
+        self.regs[4] = x
+        self.regs[6] = y
+        self.raise_interrupt(pins)
+
     def raise_interrupt(self, pins):
+        if recorder:
+            recorder.touch(self.regs[1], self.regs[4], self.regs[6])
         pins['TP_INT'].raise_irq()
 
+def press_button(pins, pressed):
+    """Simulate pressing (or releasing) the hardware button."""
+    if recorder:
+        recorder.button(pressed)
+    pins['BUTTON'].value(0 if pressed else 1)
+
 # Derive some extra values for padding the display
 SKIN['left_pad'] = 9
 SKIN['right_pad'] = SKIN['left_pad'] + SKIN['button_profile']
@@ -172,21 +323,72 @@ SKIN['window'] = (SKIN['size'][0] + SKIN['left_pad'] + SKIN['right_pad'],
 SKIN['adjust'] = (SKIN['offset'][0] + SKIN['left_pad'],
                   SKIN['offset'][1] + SKIN['top_pad'])
 
-sdl2.ext.init()
-window = sdl2.ext.Window("ST7789", size=SKIN['window'])
-window.show()
-windowsurface = window.get_surface()
-sdl2.ext.fill(windowsurface, (0xff, 0xff, 0xff))
-skin = sdl2.ext.load_image(SKIN['fname'])
-sdl2.SDL_BlitSurface(skin, None, windowsurface, sdl2.SDL_Rect(
-        SKIN['left_pad'], SKIN['top_pad'], SKIN['size'][0], SKIN['size'][1]))
-sdl2.SDL_FreeSurface(skin)
-window.refresh()
+def _png_chunk(tag, data):
+    chunk = tag + data
+    return (struct.pack('>I', len(data)) + chunk +
+            struct.pack('>I', zlib.crc32(chunk)))
+
+def save_png(fname):
+    """Save the pixels currently shown on the panel as a PNG file."""
+    rgb = spi_st7789_sim.rgb888()
+    (h, w, depth) = rgb.shape
+
+    # Every row is prefixed with a filter type of 0 (no filtering)
+    rows = numpy.zeros((h, 1 + w*depth), numpy.uint8)
+    rows[:, 1:] = rgb.reshape(h, w*depth)
+
+    with open(fname, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(_png_chunk(b'IHDR', struct.pack('>IIBBBBB', w, h, 8, 2, 0, 0, 0)))
+        f.write(_png_chunk(b'IDAT', zlib.compress(rows.tobytes())))
+        f.write(_png_chunk(b'IEND', b''))
+
+def write_frame(f):
+    """Append the pixels currently shown on the panel to a raw frame stream.
+
+    Each frame is 240x240 RGB888 pixels (with no header) which can be
+    converted to video with ``ffmpeg -f rawvideo -pixel_format rgb24
+    -video_size 240x240 -i <stream> ...``.
+    """
+    f.write(spi_st7789_sim.rgb888().tobytes())
+    f.flush()
+
+frame_stream = None
+if os.environ.get('WASP_FRAME_STREAM'):
+    frame_stream = open(os.environ['WASP_FRAME_STREAM'], 'wb')
+
+recorder = None
+if os.environ.get('WASP_RECORD'):
+    recorder = replay.Recorder(open(os.environ['WASP_RECORD'], 'w'))
+
+replayer = None
+if os.environ.get('WASP_REPLAY'):
+    with open(os.environ['WASP_REPLAY']) as f:
+        replayer = replay.Replayer(f)
+
+if not HEADLESS:
+    sdl2.ext.init()
+    window = sdl2.ext.Window("ST7789", size=SKIN['window'])
+    window.show()
+    windowsurface = window.get_surface()
+    sdl2.ext.fill(windowsurface, (0xff, 0xff, 0xff))
+    skin = sdl2.ext.load_image(SKIN['fname'])
+    sdl2.SDL_BlitSurface(skin, None, windowsurface, sdl2.SDL_Rect(
+            SKIN['left_pad'], SKIN['top_pad'], SKIN['size'][0], SKIN['size'][1]))
+    sdl2.SDL_FreeSurface(skin)
+    window.refresh()
 
 spi_st7789_sim = ST7789Sim()
 i2c_cst816s_sim = CST816SSim()
 
 def tick(pins):
+    if replayer:
+        replayer.poll(i2c_cst816s_sim, press_button, pins)
+
+    if HEADLESS:
+        spi_st7789_sim.refresh()
+        return
+
     events = sdl2.ext.get_events()
     for event in events:
         if event.type == sdl2.SDL_QUIT:
@@ -198,13 +400,13 @@ def tick(pins):
             i2c_cst816s_sim.handle_mousebuttonup(event.button, pins)
         elif event.type == sdl2.SDL_KEYDOWN:
             if event.key.keysym.sym == sdl2.SDLK_TAB:
-                pins['BUTTON'].value(0)
+                press_button(pins, True)
             else:
                 i2c_cst816s_sim.handle_key(event.key, pins)
         elif event.type == sdl2.SDL_KEYUP:
             if event.key.keysym.sym == sdl2.SDLK_TAB:
-                pins['BUTTON'].value(1)
+                press_button(pins, False)
         else:
             #print(event)
             pass
-    window.refresh()
+    spi_st7789_sim.refresh()
@@ -2,7 +2,7 @@
 # Copyright (C) 2020 Daniel Thompson
 
 import display
-import time
+import simtime
 
 class Tracer(object):
     def __init__(self, *args, **kwargs):
@@ -104,18 +104,31 @@ class I2C():
             raise OSError
 
 class Timer():
-    def __init__(self, id, period=1000000):
+    ONESHOT = 0
+    PERIODIC = 1
+
+    # Timers with a callback that are running (see _service_timers())
+    active = []
+
+    def __init__(self, id, period=1000000, mode=PERIODIC, callback=None):
         self.then = None
         self.period = period
+        self.mode = mode
+        self.callback = callback
 
     def start(self):
-        self.then = time.time()
+        self.then = simtime.time()
+        self.due = self.then + self.period / 1000000
+        if self.callback and self not in Timer.active:
+            Timer.active.append(self)
 
     def stop(self):
         self.then = None
+        if self in Timer.active:
+            Timer.active.remove(self)
 
     def time(self):
-        now = time.time()
+        now = simtime.time()
         elapsed_sec = now - self.then
         elapsed_us = int(elapsed_sec * 1000000)
 
@@ -124,9 +137,32 @@ class Timer():
     def period(self):
         self.time()
 
+def _service_timers():
+    """Run the callbacks of any timers that expired.
+
+    The simulator has no interrupts so the callbacks are delivered when
+    the CPU wakes up from sleep (catching up on every period that elapsed
+    while it was asleep).
+    """
+    now = simtime.time()
+    for t in list(Timer.active):
+        while t.then is not None and now >= t.due:
+            t.due += t.period / 1000000
+            if t.mode == Timer.ONESHOT:
+                t.stop()
+            t.callback(t)
+
 def lightsleep(ms=10):
     display.tick(Pin.pins)
-    time.sleep(ms / 1000)
-
-def deepsleep(ms=10):
+    simtime.sleep(ms / 1000)
+    _service_timers()
+
+def deepsleep(ms=None):
+    if ms is None:
+        # In fast forward mode we skip ahead by a fixed quantum whenever
+        # the system manager has nothing to do
+        if simtime.fast_forwarding():
+            ms = simtime.quantum * 1000
+        else:
+            ms = 10
     lightsleep(ms)
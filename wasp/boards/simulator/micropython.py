@@ -7,15 +7,25 @@ def const(fn):
 def native(fn):
     return fn
 
+def schedule(fn, arg):
+    # The simulator has no interrupts (timer callbacks are run from
+    # machine.lightsleep()) so it is always safe to run the function
+    # straight away
+    fn(arg)
+
 def viper(fn):
     def ptr8(buf):
         return buf
 
+    # Signed arrays give signed pointers so that the values read back
+    # behave like the (signed) int type used by viper
     def ptr16(buf):
-        return memoryview(buf).cast('b').cast('H')
+        signed = getattr(buf, 'typecode', None) == 'h'
+        return memoryview(buf).cast('b').cast('h' if signed else 'H')
 
     def ptr32(buf):
-        return memoryview(buf).cast('b').cast('I')
+        signed = getattr(buf, 'typecode', None) == 'i'
+        return memoryview(buf).cast('b').cast('i' if signed else 'I')
 
     # This is a bit of a hack since the scopes don't exactly match where
     # they would be in micropython but for the simple cases it does mean
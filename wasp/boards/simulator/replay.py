@@ -0,0 +1,102 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2020 Daniel Thompson
+
+"""Record and replay simulator input.
+
+Recordings are plain text with one event per line. Each line starts with
+a timestamp, in milliseconds of (virtual) time since the simulator
+started, followed by the event and its arguments:
+
+.. code-block:: none
+
+    # time event args
+    1500 swipe up 120 200
+    2750 touch 100 60
+    4000 button down
+    4100 button up
+
+Swipes can be ``down``, ``up``, ``left`` or ``right`` (matching
+``wasp.EventType``) and are followed by the coordinates reported by the
+touch controller. Blank lines and lines starting with ``#`` are ignored.
+
+Set ``WASP_RECORD`` to a filename to record input and ``WASP_REPLAY`` to a
+filename to replay it.
+"""
+
+import simtime
+
+GESTURES = ('down', 'up', 'left', 'right', 'touch')
+
+_start = simtime.monotonic()
+
+def now_ms():
+    """Report the time (in milliseconds) since the simulator started."""
+    return int((simtime.monotonic() - _start) * 1000)
+
+class Recorder(object):
+    def __init__(self, f):
+        self._f = f
+        f.write('# time event args\n')
+
+    def record(self, *event):
+        self._f.write('{} {}\n'.format(now_ms(), ' '.join(str(e) for e in event)))
+        self._f.flush()
+
+    def touch(self, gesture, x, y):
+        """Record a touch event using the gesture code from the CST816S."""
+        if gesture == 5:
+            self.record('touch', x, y)
+        elif 1 <= gesture <= 4:
+            self.record('swipe', GESTURES[gesture-1], x, y)
+
+    def button(self, pressed):
+        self.record('button', 'down' if pressed else 'up')
+
+class Replayer(object):
+    def __init__(self, f):
+        self._events = []
+        for n, line in enumerate(f, 1):
+            line = line.split('#')[0].split()
+            if not line:
+                continue
+            try:
+                self._events.append(self._parse(line))
+            except (ValueError, IndexError):
+                raise ValueError('{}:{}: bad event'.format(f.name, n))
+        self._events.sort(key=lambda e: e[0])
+        self._next = 0
+
+    @staticmethod
+    def _parse(line):
+        t = int(line[0])
+        kind = line[1]
+        if kind == 'touch':
+            return (t, 5, int(line[2]), int(line[3]))
+        if kind == 'swipe':
+            return (t, GESTURES.index(line[2]) + 1,
+                    int(line[3]) if len(line) > 3 else 120,
+                    int(line[4]) if len(line) > 4 else 120)
+        if kind == 'button':
+            return (t, ('up', 'down').index(line[2]))
+        raise ValueError(kind)
+
+    def done(self):
+        """Report whether every event has been replayed."""
+        return self._next >= len(self._events)
+
+    def poll(self, touch, button, pins):
+        """Inject any events that have fallen due.
+
+        :param touch:  The simulated touch controller (CST816SSim)
+        :param button: Function to press, or release, the button
+        :param pins:   The pin registry
+        """
+        events = self._events
+        now = now_ms()
+        while self._next < len(events) and events[self._next][0] <= now:
+            event = events[self._next]
+            self._next += 1
+            if len(event) == 2:
+                button(pins, bool(event[1]))
+            else:
+                touch.inject(event[1], event[2], event[3], pins)
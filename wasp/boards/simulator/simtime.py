@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2020 Daniel Thompson
+
+"""Virtual time source for the simulator.
+
+All the simulated peripherals take their time from this module. By default
+virtual time follows the wall clock. In fast forward mode virtual time only
+moves when the simulator sleeps and sleeping returns immediately, making
+long running scenarios both quick and repeatable.
+
+Fast forward mode is enabled by setting ``WASP_FAST_FORWARD=1`` in the
+environment (or by calling :py:func:`fast_forward`). When enabled
+``WASP_EPOCH`` can be used to choose the starting time, in seconds since
+the Unix epoch, and ``WASP_QUANTUM_MS`` sets how far each call to
+``machine.deepsleep()`` advances the clock.
+"""
+
+import os
+import time as _time
+
+_fast = False
+_offset = 0.0
+_now = 0.0
+quantum = int(os.environ.get('WASP_QUANTUM_MS', 125)) / 1000
+
+def time():
+    """Return the virtual time in seconds since the Unix epoch."""
+    if _fast:
+        return _now
+    return _time.time() + _offset
+
+def monotonic():
+    """Return a virtual time suitable for measuring intervals."""
+    return time()
+
+def localtime(secs=None):
+    """Convert virtual time into a time tuple in local time."""
+    if secs is None:
+        secs = time()
+    return _time.localtime(int(secs))
+
+def sleep(secs):
+    """Wait for secs seconds of virtual time to elapse."""
+    global _now
+
+    if _fast:
+        _now += secs
+    elif secs > 0:
+        _time.sleep(secs)
+
+def set_time(secs):
+    """Jump to a new virtual time (in seconds since the Unix epoch)."""
+    global _offset, _now
+
+    if _fast:
+        _now = secs
+    else:
+        _offset = secs - _time.time()
+
+def fast_forward(enable=True):
+    """Enable (or disable) fast forward mode.
+
+    Virtual time continues from its current value whenever the mode is
+    changed.
+    """
+    global _fast
+
+    now = time()
+    _fast = enable
+    set_time(now)
+
+def fast_forwarding():
+    """Report whether fast forward mode is enabled."""
+    return _fast
+
+if os.environ.get('WASP_FAST_FORWARD'):
+    fast_forward()
+if os.environ.get('WASP_EPOCH'):
+    set_time(float(os.environ['WASP_EPOCH']))
@@ -0,0 +1,281 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2020 Daniel Thompson
+
+"""SPI traffic accounting for the simulated display.
+
+Counts the commands, windows, transactions and bytes that are sent to the
+display, broken down by drawing operation and by application frame, and
+estimates how long the same traffic would occupy the bus on a real watch.
+The hits and misses of the glyph and sprite caches are counted too.
+
+Set ``WASP_SPI_STATS=1`` to enable accounting when the simulator starts; a
+report will be printed when the simulator exits. Alternatively:
+
+.. code-block:: python
+
+    import spistats
+    stats = spistats.install(wasp.watch.display, wasp.watch.drawable)
+    ...
+    print(stats.report())
+"""
+
+import sys
+
+_RAMWR = 0x2c
+
+# Drawing operations that are accounted separately
+OPERATIONS = ('fill', 'clear', 'flush', 'blit', 'rleblit', 'string')
+
+class BusModel(object):
+    """Estimate how long the SPI traffic takes on the real device.
+
+    :param int rate:           SPI clock frequency in Hz
+    :param float transaction_us: Fixed overhead for every chip select
+                                 transaction (setting up the DMA, toggling
+                                 the chip select and interpreter overhead)
+    :param float command_us:   Additional overhead for every command (for
+                               toggling the D/C signal)
+    """
+    def __init__(self, rate=8000000, transaction_us=10, command_us=5):
+        self.rate = rate
+        self.transaction_us = transaction_us
+        self.command_us = command_us
+
+    def time_us(self, c):
+        """Estimate the bus time, in microseconds, for a set of counters."""
+        return (8000000 * (c.data_bytes + c.cmds) / self.rate +
+                self.transaction_us * c.transactions +
+                self.command_us * c.cmds)
+
+class Counters(object):
+    """A set of SPI traffic counters."""
+    FIELDS = ('cmds', 'windows', 'transactions', 'writes', 'data_bytes')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        for f in self.FIELDS:
+            setattr(self, f, 0)
+
+    def copy(self):
+        c = Counters()
+        c.add(self)
+        return c
+
+    def add(self, other, sign=1):
+        for f in self.FIELDS:
+            setattr(self, f, getattr(self, f) + sign * getattr(other, f))
+
+    def __bool__(self):
+        return any(getattr(self, f) for f in self.FIELDS)
+
+    def as_dict(self, model=None):
+        d = { f: getattr(self, f) for f in self.FIELDS }
+        if model:
+            d['bus_us'] = round(model.time_us(self), 1)
+        return d
+
+class SpiStats(object):
+    """Instrument a display driver (and, optionally, a drawing library).
+
+    :param display:  ST7789_SPI display driver
+    :param drawable: Draw565 instance to account per operation and per
+                     frame (optional)
+    :param model:    BusModel used to estimate on-device timings
+    """
+    def __init__(self, display, drawable=None, model=None):
+        self.model = model if model else BusModel()
+        self.total = Counters()
+        self.operations = {}
+        self.calls = {}
+        self.frames = {}
+        self.caches = {}
+        self._frame_start = Counters()
+        self._depth = 0
+        self._in_cmd = False
+
+        self._wrap_display(display)
+        if drawable:
+            for op in OPERATIONS:
+                self._wrap_operation(drawable, op)
+            self._wrap_flush(drawable)
+            self._wrap_cache('glyphs', drawable._glyphs)
+            self._wrap_cache('sprites', drawable._sprites)
+
+    def _wrap_display(self, display):
+        total = self.total
+        write_cmd = display.write_cmd
+        write_data = display.write_data
+        quick_write = display.quick_write
+        quick_start = display.quick_start
+
+        def counted_write_cmd(cmd):
+            total.cmds += 1
+            total.transactions += 1
+            if cmd == _RAMWR:
+                total.windows += 1
+            self._in_cmd = True
+            try:
+                write_cmd(cmd)
+            finally:
+                self._in_cmd = False
+
+        def counted_write_data(buf):
+            total.transactions += 1
+            write_data(buf)
+
+        def counted_quick_write(buf):
+            if not self._in_cmd:
+                total.writes += 1
+                total.data_bytes += len(buf)
+            quick_write(buf)
+
+        def counted_quick_start():
+            total.transactions += 1
+            quick_start()
+
+        display.write_cmd = counted_write_cmd
+        display.write_data = counted_write_data
+        display.quick_write = counted_quick_write
+        display.quick_start = counted_quick_start
+
+    def _wrap_operation(self, drawable, op):
+        fn = getattr(drawable, op)
+        counters = self.operations.setdefault(op, Counters())
+        calls = self.calls
+        calls[op] = 0
+
+        def counted(*args, **kwargs):
+            # Only the outermost operation is charged for the traffic
+            if self._depth:
+                return fn(*args, **kwargs)
+            start = self.total.copy()
+            self._depth += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._depth -= 1
+                calls[op] += 1
+                counters.add(self.total)
+                counters.add(start, -1)
+
+        setattr(drawable, op, counted)
+
+    def _wrap_flush(self, drawable):
+        # The system manager flushes the drawable at the end of every tick
+        # so this is where we close off the current frame.
+        flush = drawable.flush
+
+        def flush_and_count():
+            flush()
+            if self._depth:
+                return
+            frame = self.total.copy()
+            frame.add(self._frame_start, -1)
+            self._frame_start = self.total.copy()
+            if frame:
+                self.frames.setdefault(_current_app(), []).append(frame)
+
+        drawable.flush = flush_and_count
+
+    def _wrap_cache(self, name, cache):
+        get = cache.get
+        counts = self.caches.setdefault(name, [0, 0])
+
+        def counted_get(key):
+            entry = get(key)
+            counts[0 if entry else 1] += 1
+            return entry
+
+        cache.get = counted_get
+
+    def reset(self):
+        """Discard everything counted so far."""
+        self.total.reset()
+        self._frame_start.reset()
+        for (op, c) in self.operations.items():
+            c.reset()
+            self.calls[op] = 0
+        self.frames = {}
+        for counts in self.caches.values():
+            counts[0:2] = (0, 0)
+
+    def as_dict(self):
+        """Summarize the counters in a form suitable for JSON."""
+        model = self.model
+        ops = {}
+        for (op, c) in self.operations.items():
+            ops[op] = c.as_dict(model)
+            ops[op]['calls'] = self.calls[op]
+
+        apps = {}
+        for (app, frames) in self.frames.items():
+            total = Counters()
+            for f in frames:
+                total.add(f)
+            times = [model.time_us(f) for f in frames]
+            apps[app] = total.as_dict(model)
+            apps[app]['frames'] = len(frames)
+            apps[app]['mean_frame_us'] = round(sum(times) / len(times), 1)
+            apps[app]['max_frame_us'] = round(max(times), 1)
+
+        return {
+            'model': {
+                'rate': model.rate,
+                'transaction_us': model.transaction_us,
+                'command_us': model.command_us,
+            },
+            'total': self.total.as_dict(model),
+            'operations': ops,
+            'apps': apps,
+            'caches': { name: { 'hits': c[0], 'misses': c[1] }
+                            for (name, c) in self.caches.items() },
+        }
+
+    def report(self):
+        """Format the counters as a human readable report."""
+        d = self.as_dict()
+        lines = []
+        header = '{:<16} {:>7} {:>7} {:>7} {:>7} {:>10} {:>10}'
+        row = '{:<16} {:>7} {:>7} {:>7} {:>7} {:>10} {:>10.1f}'
+
+        lines.append(header.format('operation', 'calls', 'cmds', 'windows',
+                                   'trans', 'bytes', 'bus ms'))
+        for (op, c) in sorted(d['operations'].items(),
+                              key=lambda x: -x[1]['bus_us']):
+            lines.append(row.format(op, c['calls'], c['cmds'], c['windows'],
+                                    c['transactions'], c['data_bytes'],
+                                    c['bus_us'] / 1000))
+
+        lines.append('')
+        lines.append(header.format('application', 'frames', 'cmds', 'windows',
+                                   'trans', 'bytes', 'frame ms'))
+        for (app, c) in sorted(d['apps'].items(),
+                               key=lambda x: -x[1]['mean_frame_us']):
+            lines.append(row.format(app, c['frames'], c['cmds'], c['windows'],
+                                    c['transactions'], c['data_bytes'],
+                                    c['mean_frame_us'] / 1000))
+
+        if d['caches']:
+            lines.append('')
+            lines.append('{:<16} {:>7} {:>7} {:>7}'.format('cache', 'hits',
+                                                           'misses', 'hit %'))
+            for (name, c) in sorted(d['caches'].items()):
+                lookups = c['hits'] + c['misses']
+                lines.append('{:<16} {:>7} {:>7} {:>7.1f}'.format(name,
+                        c['hits'], c['misses'],
+                        100 * c['hits'] / lookups if lookups else 0))
+
+        return '\n'.join(lines)
+
+def _current_app():
+    wasp = sys.modules.get('wasp')
+    try:
+        return wasp.system.app.NAME
+    except AttributeError:
+        return '(none)'
+
+def install(display, drawable=None, model=None):
+    """Start accounting the SPI traffic sent to display."""
+    return SpiStats(display, drawable, model)
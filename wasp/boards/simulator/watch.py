@@ -1,17 +1,40 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 # Copyright (C) 2020 Daniel Thompson
 
+import simtime
 import time
 def sleep_ms(ms):
-    time.sleep(ms / 1000)
+    simtime.sleep(ms / 1000)
 time.sleep_ms = sleep_ms
-
-import sys, traceback
+def ticks_ms():
+    return int(simtime.monotonic() * 1000)
+time.ticks_ms = ticks_ms
+def ticks_diff(a, b):
+    return a - b
+time.ticks_diff = ticks_diff
+
+# The system manager runs the garbage collector every tick. On the device
+# that is cheap but a full collection by the host Python is not (and would
+# dominate the run time when fast forwarding) so only collect the youngest
+# generation.
+import gc
+_collect = gc.collect
+def collect(generation=0):
+    return _collect(generation)
+gc.collect = collect
+
+import os, sys, traceback
 def print_exception(exc, file=sys.stdout):
     exc_type, exc_value, exc_traceback = sys.exc_info()
     traceback.print_exception(exc_type, exc_value, exc_traceback, file=file)
 sys.print_exception = print_exception
 
+# Where the simulated flash filesystem keeps recorded data (such as the
+# step history)
+import tempfile
+data_dir = os.environ.get('WASP_DATA_DIR',
+                          os.path.join(tempfile.gettempdir(), 'wasp-data'))
+
 import draw565
 import array
 
@@ -97,11 +120,11 @@ class Battery(object):
 
 class RTC(object):
     def __init__(self):
-        self._epoch = time.time()
+        self._epoch = simtime.time()
         self._lasttime = 0
 
     def update(self):
-        now = time.time()
+        now = simtime.time()
         if now == self._lasttime:
             return False
         self._lasttime = now
@@ -110,8 +133,8 @@ class RTC(object):
     def get_localtime(self):
         #if self.uptime < 60:
         #    # Jump back a little over a day
-        #    return time.localtime(time.time() - 100000)
-        return time.localtime()
+        #    return simtime.localtime(simtime.time() - 100000)
+        return simtime.localtime()
 
     def get_time(self):
         now = self.get_localtime()
@@ -119,7 +142,7 @@ class RTC(object):
 
     @property
     def uptime(self):
-        return time.time() - self._epoch
+        return simtime.time() - self._epoch
 
     def get_uptime_ms(self):
         return int(self.uptime * 1000)
@@ -165,15 +188,28 @@ class HRS():
 
         return d
 
+    def read_als(self):
+        return 1000
+
+    def read_hrs_als(self):
+        return (self.read_hrs(), self.read_als())
+
 backlight = Backlight()
 spi = SPI(0)
 spi.init(polarity=1, phase=1, baudrate=8000000)
 display = ST7789_SPI(240, 240, spi,
         cs=Pin("DISP_CS", Pin.OUT, quiet=True),
         dc=Pin("DISP_DC", Pin.OUT, quiet=True),
-        res=Pin("DISP_RST", Pin.OUT, quiet=True))
+        res=Pin("DISP_RST", Pin.OUT, quiet=True),
+        bpp=int(os.environ.get('WASP_DISPLAY_BPP', 16)))
 drawable = draw565.Draw565(display)
 
+if os.environ.get('WASP_SPI_STATS'):
+    import atexit
+    import spistats
+    spi_stats = spistats.install(display, drawable)
+    atexit.register(lambda: print(spi_stats.report()))
+
 accel = Accelerometer()
 battery = Battery()
 button = Pin('BUTTON', Pin.IN, quiet=True)
@@ -0,0 +1,42 @@
+# Code generated by rle_encode.py.
+# Cmd: tools/rle_encode.py --clut
+"""8-bit colour lookup table
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Palette used by 2-bit RLE images as 256 little endian RGB565 values.
+"""
+
+RGB565 = (
+    b'\x00\x00\x06\x00\x0c\x00\x13\x00\x19\x00\x1f\x00\x80\x01\x86\x01'
+    b'\x8c\x01\x93\x01\x99\x01\x9f\x01 \x03&\x03,\x033\x03'
+    b'9\x03?\x03\xc0\x04\xc6\x04\xcc\x04\xd3\x04\xd9\x04\xdf\x04'
+    b'`\x06f\x06l\x06s\x06y\x06\x7f\x06\xe0\x07\xe6\x07'
+    b'\xec\x07\xf3\x07\xf9\x07\xff\x07\x000\x060\x0c0\x130'
+    b'\x190\x1f0\x801\x861\x8c1\x931\x991\x9f1'
+    b' 3&3,33393?3\xc04\xc64'
+    b'\xcc4\xd34\xd94\xdf4`6f6l6s6'
+    b'y6\x7f6\xe07\xe67\xec7\xf37\xf97\xff7'
+    b'\x00`\x06`\x0c`\x13`\x19`\x1f`\x80a\x86a'
+    b'\x8ca\x93a\x99a\x9fa c&c,c3c'
+    b'9c?c\xc0d\xc6d\xccd\xd3d\xd9d\xdfd'
+    b'`ffflfsfyf\x7ff\xe0g\xe6g'
+    b'\xecg\xf3g\xf9g\xffg\x00\x98\x06\x98\x0c\x98\x13\x98'
+    b'\x19\x98\x1f\x98\x80\x99\x86\x99\x8c\x99\x93\x99\x99\x99\x9f\x99'
+    b' \x9b&\x9b,\x9b3\x9b9\x9b?\x9b\xc0\x9c\xc6\x9c'
+    b'\xcc\x9c\xd3\x9c\xd9\x9c\xdf\x9c`\x9ef\x9el\x9es\x9e'
+    b'y\x9e\x7f\x9e\xe0\x9f\xe6\x9f\xec\x9f\xf3\x9f\xf9\x9f\xff\x9f'
+    b'\x00\xc8\x06\xc8\x0c\xc8\x13\xc8\x19\xc8\x1f\xc8\x80\xc9\x86\xc9'
+    b'\x8c\xc9\x93\xc9\x99\xc9\x9f\xc9 \xcb&\xcb,\xcb3\xcb'
+    b'9\xcb?\xcb\xc0\xcc\xc6\xcc\xcc\xcc\xd3\xcc\xd9\xcc\xdf\xcc'
+    b'`\xcef\xcel\xces\xcey\xce\x7f\xce\xe0\xcf\xe6\xcf'
+    b'\xec\xcf\xf3\xcf\xf9\xcf\xff\xcf\x00\xf8\x06\xf8\x0c\xf8\x13\xf8'
+    b'\x19\xf8\x1f\xf8\x80\xf9\x86\xf9\x8c\xf9\x93\xf9\x99\xf9\x9f\xf9'
+    b' \xfb&\xfb,\xfb3\xfb9\xfb?\xfb\xc0\xfc\xc6\xfc'
+    b'\xcc\xfc\xd3\xfc\xd9\xfc\xdf\xfc`\xfef\xfel\xfes\xfe'
+    b'y\xfe\x7f\xfe\xe0\xff\xe6\xff\xec\xff\xf3\xff\xf9\xff\xff\xff'
+    b'ozvz|z\xef{\xf6{\xfc{\x8f}\x96}'
+    b'\x9c}/\x7f6\x7f<\x7fo\xb2v\xb2|\xb2\xef\xb3'
+    b'\xf6\xb3\xfc\xb3\x8f\xb5\x96\xb5\x9c\xb5/\xb76\xb7<\xb7'
+    b'o\xe2v\xe2|\xe2\xef\xe3\xf6\xe3\xfc\xe3\x8f\xe5\x96\xe5'
+    b'\x9c\xe5/\xe76\xe7<\xe7e)\xe79iJ\xebZ'
+)
@@ -6,9 +6,14 @@
 """
 
 import array
+import clut8
 import fonts.sans24
 import micropython
 
+# Width of the run length field of palette RLE images (indexed by the
+# number of colours in the palette)
+_LZ_FBITS = b'\x08\x08\x08\x07\x06\x06\x05\x05\x05'
+
 @micropython.viper
 def _bitblit(bitbuf, pixels, bgfg: int, count: int):
     mv = ptr16(bitbuf)
@@ -34,27 +39,6 @@ def _bitblit(bitbuf, pixels, bgfg: int, count: int):
             bitselect = 0x80
             pxp += 1
 
-@micropython.viper
-def _clut8_rgb565(i: int) -> int:
-    if i < 216:
-        rgb565  = (( i  % 6) * 0x33) >> 3
-        rg = i // 6
-        rgb565 += ((rg  % 6) * (0x33 << 3)) & 0x07e0
-        rgb565 += ((rg // 6) * (0x33 << 8)) & 0xf800
-    elif i < 252:
-        i -= 216
-        rgb565  = (0x7f + (( i  % 3) * 0x33)) >> 3
-        rg = i // 3
-        rgb565 += ((0x4c << 3) + ((rg  % 4) * (0x33 << 3))) & 0x07e0
-        rgb565 += ((0x7f << 8) + ((rg // 4) * (0x33 << 8))) & 0xf800
-    else:
-        i -= 252
-        gr6 = (0x2c + (0x10 * i)) >> 2
-        gr5 = gr6 >> 1
-        rgb565 = (gr5 << 11) + (gr6 << 5) + gr5
-
-    return rgb565
-
 @micropython.viper
 def _fill(mv, color: int, count: int, offset: int):
     p = ptr16(mv)
@@ -63,27 +47,326 @@ def _fill(mv, color: int, count: int, offset: int):
     for x in range(offset, offset+count):
         p[x] = color
 
-def _bounding_box(s, font):
-    w = 0
-    for ch in s:
-        (_, h, wc) = font.get_ch(ch)
-        w += wc + 1
+@micropython.viper
+def _fill444(mv, color: int, count: int):
+    p = ptr8(mv)
+    pixel = ((color >> 4) & 0xf00) | ((color >> 3) & 0xf0) | ((color >> 1) & 0xf)
+    b0 = pixel >> 4
+    b1 = ((pixel & 0xf) << 4) | (pixel >> 8)
+    b2 = pixel & 0xff
+
+    for x in range(0, 3 * ((count + 1) >> 1), 3):
+        p[x] = b0
+        p[x+1] = b1
+        p[x+2] = b2
+
+@micropython.viper
+def _pack444(mv, count: int):
+    """Convert RGB565 pixels to packed RGB444, in place.
+
+    Pairs of pixels are packed into three bytes. The output never overtakes
+    the input so the conversion can safely be done in place.
+    """
+    p = ptr8(mv)
+    i = 0
+    o = 0
+
+    for x in range(count >> 1):
+        c0 = (p[i] << 8) | p[i+1]
+        c1 = (p[i+2] << 8) | p[i+3]
+        p0 = ((c0 >> 4) & 0xf00) | ((c0 >> 3) & 0xf0) | ((c0 >> 1) & 0xf)
+        p1 = ((c1 >> 4) & 0xf00) | ((c1 >> 3) & 0xf0) | ((c1 >> 1) & 0xf)
+        p[o] = p0 >> 4
+        p[o+1] = ((p0 & 0xf) << 4) | (p1 >> 8)
+        p[o+2] = p1 & 0xff
+        i += 4
+        o += 3
+
+    if count & 1:
+        c0 = (p[i] << 8) | p[i+1]
+        p0 = ((c0 >> 4) & 0xf00) | ((c0 >> 3) & 0xf0) | ((c0 >> 1) & 0xf)
+        p[o] = p0 >> 4
+        p[o+1] = (p0 & 0xf) << 4
+
+@micropython.viper
+def _lzrow(rle, state, palette, buf):
+    """Decode pixels from a palette RLE image.
 
-    return (w, h)
+    The decoder state is held in state so that decoding can resume where it
+    left off: the offset into rle, the current colour, the remaining length
+    of the current run, the palette size, the width of the length field and
+    the range of pixels (in buf) to be filled.
+    """
+    src = ptr8(rle)
+    st = ptr32(state)
+    pal = ptr16(palette)
+    px = ptr16(buf)
+
+    sp = st[0]
+    c = st[1]
+    rl = st[2]
+    n = st[3]
+    fbits = st[4]
+    bp = st[5]
+    end = st[6]
+    fmax = (1 << fbits) - 1
+
+    while bp < end:
+        if not rl:
+            v = src[sp]
+            sp += 1
+            c += 1 + (v >> fbits)
+            if c >= n:
+                c -= n
+            rl = v & fmax
+            if rl == fmax:
+                e = 255
+                while e == 255:
+                    e = src[sp]
+                    sp += 1
+                    rl += e
+            continue
+
+        color = pal[c]
+        stop = bp + rl
+        if stop > end:
+            stop = end
+        rl -= stop - bp
+        while bp < stop:
+            px[bp] = color
+            bp += 1
+
+    st[0] = sp
+    st[1] = c
+    st[2] = rl
 
 @micropython.native
-def _draw_glyph(display, glyph, x, y, bgfg):
+def _send(display, buf, count):
+    """Send count RGB565 pixels from buf as part of a quick write sequence.
+
+    For displays in 12-bit mode the pixels are packed (in place) first. Only
+    the final write to a window may contain an odd number of pixels.
+    """
+    if display.bpp == 12:
+        _pack444(buf, count)
+        display.quick_write(memoryview(buf)[0:(3*count + 1) // 2])
+    elif 2*count == len(buf):
+        display.quick_write(buf)
+    else:
+        display.quick_write(memoryview(buf)[0:2*count])
+
+@micropython.native
+def _expand_glyph(glyph, bgfg):
     (px, h, w) = glyph
 
-    buf = memoryview(display.linebuffer)[0:2*(w+1)]
-    buf[2*w] = 0
-    buf[2*w + 1] = 0
+    stride = 2 * (w+1)
+    data = bytearray(stride * h)
+    mv = memoryview(data)
     bytes_per_row = (w + 7) // 8
 
-    display.set_window(x, y, w+1, h)
     for row in range(h):
-        _bitblit(buf, px[row*bytes_per_row:], bgfg, w)
-        display.write_data(buf)
+        _bitblit(mv[row*stride:], px[row*bytes_per_row:], bgfg, w)
+
+    return data
+
+@micropython.native
+def _draw_line(display, chars, x, y, h, leftpad, rightpad, bgfg):
+    """Compose a line of text scanline by scanline and draw it.
+
+    The whole line, including any padding, is drawn using a single window
+    with each scanline streamed straight from the line buffer.
+
+    In 12-bit mode pixels are sent in pairs so, if a scanline has an odd
+    number of pixels, its final pixel is carried over to the start of the
+    next scanline. This means that the line buffer must have room for one
+    extra pixel.
+    """
+    w = leftpad
+    for glyph in chars:
+        w += glyph[2] + 1
+    w += rightpad
+    if not w or not h:
+        return
+
+    packed = display.bpp == 12
+    buf = memoryview(display.linebuffer)
+    if not packed:
+        buf = buf[0:2*w]
+        _fill(buf, 0, leftpad, 0)
+        _fill(buf, 0, rightpad, w - rightpad)
+    carry = 0
+
+    display.set_window(x, y, w, h)
+    display.quick_start()
+    for row in range(h):
+        if packed:
+            # Packing overwrites the line buffer so the padding must be
+            # redrawn for every scanline
+            _fill(buf, 0, leftpad, carry)
+            _fill(buf, 0, rightpad, carry + w - rightpad)
+
+        p = 2 * (carry + leftpad)
+        for glyph in chars:
+            gw = glyph[2]
+            if len(glyph) == 3:
+                _bitblit(buf[p:], glyph[0][row*((gw+7)//8):], bgfg, gw)
+                p += 2 * gw
+                buf[p] = 0
+                buf[p+1] = 0
+                p += 2
+            else:
+                stride = glyph[3]
+                offset = row * stride
+                buf[p:p+stride] = memoryview(glyph[0])[offset:offset+stride]
+                p += stride
+
+        if packed:
+            n = carry + w
+            carry = n & 1 if row < h - 1 else 0
+            n -= carry
+            if carry:
+                c0 = buf[2*n]
+                c1 = buf[2*n + 1]
+            _send(display, buf, n)
+            if carry:
+                buf[0] = c0
+                buf[1] = c1
+        else:
+            display.quick_write(buf)
+    display.quick_end()
+
+class _Cache():
+    """Least recently used cache with a fixed byte budget.
+
+    Entries are tuples whose first element is the cached buffer, only the
+    size of the buffer is charged against the budget.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.used = 0
+        self._entries = {}
+        self._lru = []
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry:
+            lru = self._lru
+            if lru[-1] != key:
+                lru.remove(key)
+                lru.append(key)
+        return entry
+
+    def room(self, sz, keep=()):
+        """Evict entries, least recently used first, until there is room
+        for sz more bytes. Entries whose key is in keep are never evicted.
+
+        :return: True if there is now room for sz bytes
+        """
+        if sz > self.size:
+            return False
+        lru = self._lru
+        while self.used + sz > self.size:
+            if lru[0] in keep:
+                return False
+            old = self._entries.pop(lru.pop(0))
+            self.used -= len(old[0])
+        return True
+
+    def put(self, key, entry):
+        if self.room(len(entry[0])):
+            self._entries[key] = entry
+            self._lru.append(key)
+            self.used += len(entry[0])
+
+    def clear(self):
+        self._entries = {}
+        self._lru = []
+        self.used = 0
+
+def _subtract(r, s, out):
+    """Append the parts of rectangle r that are not covered by s to out.
+
+    Rectangles are (x0, y0, x1, y1) tuples with exclusive end points.
+    """
+    (x0, y0, x1, y1) = r
+    (sx0, sy0, sx1, sy1) = s
+    if sx0 >= x1 or sx1 <= x0 or sy0 >= y1 or sy1 <= y0:
+        out.append(r)
+        return
+    if sy0 > y0:
+        out.append((x0, y0, x1, sy0))
+        y0 = sy0
+    if sy1 < y1:
+        out.append((x0, sy1, x1, y1))
+        y1 = sy1
+    if sx0 > x0:
+        out.append((x0, y0, sx0, y1))
+    if sx1 < x1:
+        out.append((sx1, y0, x1, y1))
+
+class _Damage():
+    """Damage tracker.
+
+    Tracks two sets of rectangles. The dirty set is a (conservative)
+    record of every part of the display that might contain something
+    other than the background colour. The pending set records
+    background fills that have been requested but not yet drawn.
+
+    Pending fills are trimmed whenever something is drawn on top of them
+    and, when they are finally flushed, they are clipped to the dirty set
+    so only areas that actually need clearing are sent to the display.
+    """
+    def __init__(self, width, height, limit=16):
+        self._screen = (0, 0, width, height)
+        self.limit = limit
+        self.dirty = [self._screen]
+        self.pending = []
+
+    def paint(self, r, clean=False):
+        """Record an opaque drawing operation.
+
+        :param r:     Rectangle that has been drawn
+        :param clean: True if the rectangle was filled with the background
+                      colour
+        """
+        if self.pending:
+            pending = []
+            for p in self.pending:
+                _subtract(p, r, pending)
+            self.pending = pending
+
+        if clean:
+            dirty = []
+            for d in self.dirty:
+                _subtract(d, r, dirty)
+            self.dirty = dirty
+        else:
+            self._merge(r)
+
+    def _merge(self, r):
+        dirty = self.dirty
+        i = 0
+        while i < len(dirty):
+            d = dirty[i]
+            if d[0] < r[2] and r[0] < d[2] and d[1] < r[3] and r[1] < d[3]:
+                r = (min(d[0], r[0]), min(d[1], r[1]),
+                     max(d[2], r[2]), max(d[3], r[3]))
+                del dirty[i]
+                i = 0
+            else:
+                i += 1
+        dirty.append(r)
+
+        if len(dirty) > self.limit:
+            r = dirty[0]
+            for d in dirty:
+                r = (min(d[0], r[0]), min(d[1], r[1]),
+                     max(d[2], r[2]), max(d[3], r[3]))
+            self.dirty = [r]
+
+    def invalidate(self):
+        """Assume every pixel on the display might need to be redrawn."""
+        self.dirty = [self._screen]
 
 class Draw565(object):
     """Drawing library for RGB565 displays.
@@ -91,25 +374,76 @@ class Draw565(object):
     A full framebufer is not required although the library will
     'borrow' a line buffer from the underlying display driver.
 
+    Displays running in 12-bit mode (see the ``bpp`` argument of the
+    display driver) are also supported. All colours are still given in
+    RGB565 format and are converted to RGB444 as they are sent to the
+    display.
+
     .. automethod:: __init__
     """
 
-    def __init__(self, display):
+    def __init__(self, display, glyph_cache=0, sprite_cache=0):
         """Initialise the library.
 
         Defaults to white-on-black for monochrome drawing operations
         and 24pt Sans Serif text.
+
+        The caches are disabled by default because the memory they need
+        to be useful is a large fraction of the heap. Applications that
+        redraw the same text or images over and over again can enable
+        them using :py:meth:`set_cache`.
+
+        :param display:      Display driver to draw on
+        :param glyph_cache:  Default number of bytes to spend caching
+                             pre-expanded glyphs, 0 disables the cache
+        :param sprite_cache: Default number of bytes to spend caching
+                             decoded images, 0 disables the cache
         """
         self._display = display
+        self._cache_defaults = (glyph_cache, sprite_cache)
+        self._glyphs = _Cache(0)
+        self._sprites = _Cache(0)
+        self._damage = _Damage(display.width, display.height)
         self.reset()
 
     def reset(self):
         """Restore the default colours and font.
 
         Default colours are white-on-block (white foreground, black
-        background) and the default font is 24pt Sans Serif."""
+        background) and the default font is 24pt Sans Serif.
+
+        Any pending clears are flushed and the whole display is treated as
+        damaged since the previous user of the display may have drawn on
+        it without using this library. The caches are emptied and return
+        to their default sizes.
+        """
+        self.flush()
+        self._damage.invalidate()
         self.set_color(0xffff)
         self.set_font(fonts.sans24)
+        self.set_cache(*self._cache_defaults)
+
+    def set_cache(self, glyphs=0, sprites=0):
+        """Set the amount of memory used to cache glyphs and images.
+
+        Glyphs are cached after they have been expanded to RGB565 (which
+        takes two bytes per pixel) so :py:meth:`string` can copy them
+        straight to the display and decoded images are cached in the same
+        way by :py:meth:`blit`. When a cache is full the least recently
+        used entries are evicted so the budgets should be big enough for
+        the glyphs and images that are redrawn most often. The caches are
+        emptied (and the memory released) whenever the sizes change or the
+        drawable is reset (which happens every time the system switches
+        application).
+
+        :param glyphs:  Maximum number of bytes to spend caching glyphs
+        :param sprites: Maximum number of bytes to spend caching images
+        """
+        for (cache, size) in ((self._glyphs, glyphs),
+                              (self._sprites, sprites)):
+            if cache.size != size or cache.used:
+                cache.clear()
+                cache.size = size
 
     def fill(self, bg=None, x=0, y=0, w=None, h=None):
         """Draw a solid colour rectangle.
@@ -126,7 +460,6 @@ class Draw565(object):
                    the bottom-most pixel of the display)
         """
         display = self._display
-        quick_write = display.quick_write
 
         if bg is None:
             bg = self._bgfg >> 16
@@ -135,35 +468,132 @@ class Draw565(object):
         if h is None:
             h = display.height - y
 
+        self._damage.paint((x, y, x+w, y+h), bg == 0)
+        self._fill_rect(bg, x, y, w, h)
+
+    def _fill_rect(self, bg, x, y, w, h):
+        """Draw a solid colour rectangle (without damage tracking)."""
+        display = self._display
+        quick_write = display.quick_write
+
         display.set_window(x, y, w, h)
 
         remaining = w * h
 
-        # Populate the line buffer
-        buf = display.linebuffer
-        sz = len(display.linebuffer) // 2
-        _fill(buf, bg, min(sz, remaining), 0)
+        # Populate the line buffer (sz is the number of pixels it holds)
+        buf = memoryview(display.linebuffer)
+        if display.bpp == 12:
+            sz = 2 * (len(buf) // 3)
+            buf = buf[0:3 * (sz // 2)]
+            _fill444(buf, bg, min(sz, remaining))
+        else:
+            sz = len(buf) // 2
+            _fill(buf, bg, min(sz, remaining), 0)
 
         display.quick_start()
         while remaining >= sz:
             quick_write(buf)
             remaining -= sz
         if remaining:
-            quick_write(memoryview(display.linebuffer)[0:2*remaining])
+            quick_write(buf[0:(display.bpp * remaining + 7) // 8])
         display.quick_end()
 
+    def clear(self, x=0, y=0, w=None, h=None):
+        """Clear a rectangle to black at the next flush.
+
+        This is a lazy version of ``fill(0, x, y, w, h)``. The clear is
+        recorded rather than drawn immediately. Anything drawn on top of the
+        rectangle before the next :py:meth:`~.flush` is excluded from the
+        clear and nothing is sent to the display for parts of the
+        rectangle that are already black. This makes it cheap to
+        unconditionally clear areas that usually have nothing in them.
+
+        The system manager flushes pending clears once per tick and before
+        it unmutes the display after switching applications.
+
+        :param x:  X coordinate of the left-most pixels of the rectangle
+        :param y:  Y coordinate of the top-most pixels of the rectangle
+        :param w:  Width of the rectangle, defaults to None (which means select
+                   the right-most pixel of the display)
+        :param h:  Height of the rectangle, defaults to None (which means select
+                   the bottom-most pixel of the display)
+        """
+        display = self._display
+        damage = self._damage
+
+        if w is None:
+            w = display.width - x
+        if h is None:
+            h = display.height - y
+        if w <= 0 or h <= 0:
+            return
+
+        damage.pending.append((x, y, x+w, y+h))
+        if len(damage.pending) > damage.limit:
+            self.flush()
+
+    def damage(self, x=0, y=0, w=None, h=None):
+        """Record that a rectangle was drawn without using this library.
+
+        Applications that write directly to the display driver must use
+        this to keep the damage tracking up to date (or must avoid
+        :py:meth:`~.clear`). With no arguments the whole display is marked
+        as damaged.
+
+        :param x:  X coordinate of the left-most pixels of the rectangle
+        :param y:  Y coordinate of the top-most pixels of the rectangle
+        :param w:  Width of the rectangle, defaults to None (which means select
+                   the right-most pixel of the display)
+        :param h:  Height of the rectangle, defaults to None (which means select
+                   the bottom-most pixel of the display)
+        """
+        display = self._display
+
+        if w is None:
+            w = display.width - x
+        if h is None:
+            h = display.height - y
+        self._damage.paint((x, y, x+w, y+h))
+
+    def flush(self):
+        """Draw any pending clears.
+
+        Only the parts of the pending clears that overlap the damaged
+        areas of the display are drawn.
+        """
+        damage = self._damage
+        pending = damage.pending
+        if not pending:
+            return
+        damage.pending = []
+
+        for p in pending:
+            dirty = []
+            for d in damage.dirty:
+                x0 = max(p[0], d[0])
+                y0 = max(p[1], d[1])
+                x1 = min(p[2], d[2])
+                y1 = min(p[3], d[3])
+                if x0 < x1 and y0 < y1:
+                    self._fill_rect(0, x0, y0, x1-x0, y1-y0)
+                _subtract(d, p, dirty)
+            damage.dirty = dirty
+
     @micropython.native
     def blit(self, image, x, y, fg=0xffff, c1=0x4a69, c2=0x7bef):
         """Decode and draw an encoded image.
 
-        :param image: Image data in either 1-bit RLE or 2-bit RLE formats. The
-                      format will be autodetected
+        :param image: Image data in 1-bit RLE, 2-bit RLE or palette RLE
+                      formats. The format will be autodetected
         :param x: X coordinate for the left-most pixels in the image
         :param y: Y coordinate for the top-most pixels in the image
         """
         if len(image) == 3:
             # Legacy 1-bit image
             self.rleblit(image, (x, y), fg)
+        elif image[0] == 3:
+            # Palette RLE image with row references
+            self._lzblit(image, x, y, fg, c1, c2)
         else: #elif image[0] == 2:
             # 2-bit RLE image, (255x255, v1)
             self._rle2bit(image, x, y, fg, c1, c2)
@@ -176,50 +606,61 @@ class Draw565(object):
             Use :py:meth:`~.blit` instead.
         """
         display = self._display
-        write_data = display.write_data
         (sx, sy, rle) = image
 
-        display.set_window(pos[0], pos[1], sx, sy)
+        self._damage.paint((pos[0], pos[1], pos[0]+sx, pos[1]+sy))
+        key = (id(image), fg, bg)
+        buf = self._sprite(key, image, pos[0], pos[1], sx, sy)
+        if buf is None:
+            return
 
-        buf = memoryview(display.linebuffer)[0:2*sx]
+        # The image is decoded as a stream of pixels, each time the buffer
+        # fills up it is sent to the display.
+        sz = len(buf) // 2
         bp = 0
         color = bg
 
+        display.quick_start()
         for rl in rle:
             while rl:
-                count = min(sx - bp, rl)
+                count = min(sz - bp, rl)
                 _fill(buf, color, count, bp)
                 bp += count
                 rl -= count
 
-                if bp >= sx:
-                    write_data(buf)
+                if bp >= sz:
+                    _send(display, buf, bp)
                     bp = 0
 
             if color == bg:
                 color = fg
             else:
                 color = bg
+        if bp:
+            _send(display, buf, bp)
+        display.quick_end()
+        self._sprite_decoded(key, image, buf, sx * sy)
 
     @micropython.native
     def _rle2bit(self, image, x, y, fg, c1, c2):
         """Decode and draw a 2-bit RLE image."""
         display = self._display
-        quick_write = display.quick_write
         sx = image[1]
         sy = image[2]
         rle = memoryview(image)[3:]
 
-        display.set_window(x, y, sx, sy)
-
-        if sx <= (len(display.linebuffer) // 4) and not bool(sy & 1):
-            sx *= 2
-            sy //= 2
+        self._damage.paint((x, y, x+sx, y+sy))
+        key = (id(image), fg, c1, c2)
+        buf = self._sprite(key, image, x, y, sx, sy)
+        if buf is None:
+            return
 
+        # The palette is kept in RGB565 format, for displays in 12-bit mode
+        # the conversion happens as the buffer is sent
         palette = array.array('H', (0, c1, c2, fg))
-        next_color = 1
+        clut = clut8.RGB565
         rl = 0
-        buf = memoryview(display.linebuffer)[0:2*sx]
+        sz = len(buf) // 2
         bp = 0
 
         display.quick_start()
@@ -237,24 +678,164 @@ class Draw565(object):
                 if op >= 255:
                     continue
             else:
-                palette[next_color] = _clut8_rgb565(op)
-                if next_color < 3:
-                    next_color += 1
-                else:
-                    next_color = 1
+                # Palette change, the entry to replace comes from the
+                # opcode that introduced it
+                palette[px] = clut[2*op] | (clut[2*op + 1] << 8)
                 rl = 0
                 continue
 
             while rl:
-                count = min(sx - bp, rl)
+                count = min(sz - bp, rl)
                 _fill(buf, palette[px], count, bp)
                 bp += count
                 rl -= count
 
-                if bp >= sx:
-                    quick_write(buf)
+                if bp >= sz:
+                    _send(display, buf, bp)
                     bp = 0
+        if bp:
+            _send(display, buf, bp)
         display.quick_end()
+        self._sprite_decoded(key, image, buf, sx * sy)
+
+    @micropython.native
+    def _lzblit(self, image, x, y, fg, c1, c2):
+        """Decode and draw a palette RLE image.
+
+        The format is described in ``tools/rle_encode.py``.
+        """
+        display = self._display
+        sx = image[1]
+        sy = image[2]
+        n = image[3] & 0xf
+
+        self._damage.paint((x, y, x+sx, y+sy))
+        key = (id(image), fg, c1, c2)
+        buf = self._sprite(key, image, x, y, sx, sy)
+        if buf is None:
+            return
+
+        # Every white and default grey pixel is recoloured. The palette
+        # is byte swapped so the decoder can store pixels directly into
+        # the buffer.
+        if image[3] & 0x80:
+            colors = (0, fg, c1, c2)
+            sp = 4
+        else:
+            clut = clut8.RGB565
+            colors = []
+            for i in image[4:4+n]:
+                if i == 215:
+                    colors.append(fg)
+                elif i == 254:
+                    colors.append(c1)
+                elif i == 219:
+                    colors.append(c2)
+                else:
+                    colors.append(clut[2*i] | (clut[2*i + 1] << 8))
+            sp = 4 + n
+        palette = array.array('H', [((c & 0xff) << 8) | (c >> 8)
+                                    for c in colors[0:n]])
+
+        state = array.array('I', (sp, n-1, 0, n, _LZ_FBITS[n], 0, 0))
+        ref = array.array('I', state)
+        rows = [0] * 64
+        odd = display.bpp == 12
+        sz = len(buf) // 2
+        bp = 0
+
+        display.quick_start()
+        y = 0
+        while y < sy:
+            # Row references can only appear at the start of a row that
+            # doesn't continue a run from the previous row
+            repeat = 1
+            row = None
+            if not state[2]:
+                sp = state[0]
+                if image[sp] == 0:
+                    v = image[sp+1]
+                    if v:
+                        if v & 0x80:
+                            repeat = (v & 0x7f) + 2
+                            v = 1
+                        row = rows[(y - v) & 63]
+                        state[0] = sp + 2
+                    else:
+                        state[0] = sp + 1
+                if row is None:
+                    rows[y & 63] = (state[0] << 3) | state[1]
+
+            for i in range(repeat):
+                if bp + sx > sz:
+                    # Only the final write to a window can contain an odd
+                    # number of pixels when the display is in 12-bit mode
+                    if odd and bp & 1:
+                        _send(display, buf, bp - 1)
+                        buf[0] = buf[2*bp - 2]
+                        buf[1] = buf[2*bp - 1]
+                        bp = 1
+                    else:
+                        _send(display, buf, bp)
+                        bp = 0
+
+                if row is None:
+                    decoder = state
+                else:
+                    decoder = ref
+                    ref[0] = row >> 3
+                    ref[1] = row & 7
+                    ref[2] = 0
+                    rows[y & 63] = row
+                decoder[5] = bp
+                decoder[6] = bp + sx
+                _lzrow(image, decoder, palette, buf)
+                bp += sx
+                y += 1
+
+            if row is not None:
+                state[1] = ref[1]
+
+        if bp:
+            _send(display, buf, bp)
+        display.quick_end()
+        self._sprite_decoded(key, image, buf, sx * sy)
+
+    def _sprite(self, key, image, x, y, w, h):
+        """Prepare to draw an image.
+
+        If the image is in the sprite cache then it is drawn immediately and
+        None is returned. Otherwise this returns the buffer the image should
+        be decoded into; either a new buffer (which will be added to the
+        cache) or the display's line buffer.
+        """
+        display = self._display
+        sprites = self._sprites
+        display.set_window(x, y, w, h)
+
+        entry = sprites.get(key)
+        if entry and entry[1] is image:
+            display.write_data(entry[2])
+            return None
+
+        # Images that are bigger than the cache are decoded straight into
+        # the line buffer
+        if 2 * w * h <= sprites.size:
+            return bytearray(2 * w * h)
+        return display.linebuffer
+
+    def _sprite_decoded(self, key, image, buf, count):
+        """Add a freshly decoded image to the sprite cache."""
+        display = self._display
+        if buf is display.linebuffer:
+            return
+
+        # Displays in 12-bit mode receive packed pixels (which are packed
+        # in place when the buffer is sent)
+        data = buf
+        if display.bpp == 12:
+            data = memoryview(buf)[0:(3*count + 1) // 2]
+        self._sprites.put(key, (buf, image, data))
 
     def set_color(self, color, bg=0):
         """Set the foreground and background colours.
@@ -291,21 +872,68 @@ class Draw565(object):
         display = self._display
         bgfg = self._bgfg
         font = self._font
-
+        glyphs = self._glyphs
+        h = font.height()
+
+        # Collect the glyphs. Glyphs that are not in the cache are
+        # expanded to RGB565 and cached unless that would evict a glyph
+        # this string needs (in which case they are expanded straight
+        # into the line buffer as the line is drawn).
+        chars = []
+        keys = []
+        w = 0
+        for ch in s:
+            key = (font, ch, bgfg)
+            glyph = glyphs.get(key)
+            if not glyph:
+                glyph = font.get_ch(ch)
+                stride = 2 * (glyph[2]+1)
+                if glyphs.room(stride * h, keys):
+                    glyph = (_expand_glyph(glyph, bgfg), h, glyph[2], stride)
+                    glyphs.put(key, glyph)
+            chars.append(glyph)
+            keys.append(key)
+            w += glyph[2] + 1
+
+        leftpad = 0
+        rightpad = 0
         if width:
-            (w, h) = _bounding_box(s, font)
-            leftpad = (width - w) // 2
-            rightpad = width - w - leftpad
-            self.fill(0, x, y, leftpad, h)
+            leftpad = max(0, (width - w) // 2)
+            rightpad = max(0, width - w - leftpad)
+
+        w += leftpad + rightpad
+        self._damage.paint((x, y, x+w, y+h))
+        if w + (display.bpp == 12) > len(display.linebuffer) // 2:
+            self._string(chars, x, y, leftpad, rightpad)
+            return
+
+        _draw_line(display, chars, x, y, h, leftpad, rightpad, bgfg)
+
+    def _string(self, chars, x, y, leftpad, rightpad):
+        """Draw a string one glyph at a time.
+
+        This is used for strings that are too wide to be composed in the
+        line buffer.
+        """
+        display = self._display
+        bgfg = self._bgfg
+        h = self._font.height()
+
+        if leftpad:
+            self._fill_rect(0, x, y, leftpad, h)
             x += leftpad
 
-        for ch in s:
-            glyph = font.get_ch(ch)
-            _draw_glyph(display, glyph, x, y, bgfg)
-            x += glyph[2] + 1
+        for glyph in chars:
+            w = glyph[2]
+            if len(glyph) == 3 or display.bpp == 12:
+                _draw_line(display, (glyph,), x, y, h, 0, 0, bgfg)
+            else:
+                display.set_window(x, y, w+1, h)
+                display.write_data(glyph[0])
+            x += w + 1
 
-        if width:
-            self.fill(0, x, y, rightpad, h)
+        if rightpad:
+            self._fill_rect(0, x, y, rightpad, h)
 
     def wrap(self, s, width):
         """Chunk a string so it can rendered within a specified width.
@@ -8,6 +8,15 @@
 import array
 import time
 from machine import Pin
+from micropython import const
+
+# Number of events that can be queued (must be a power of two)
+_QUEUE = const(8)
+
+# The controller repeats its report of a gesture (for as long as the
+# finger stays on the panel) more often than this. Two separate gestures
+# cannot be made this quickly.
+_REPEAT_MS = const(50)
 
 class CST816S:
     """Hynitron CST816S I2C touch controller driver.
@@ -27,6 +36,15 @@ class CST816S:
         self.dbuf = bytearray(6)
         self.event = array.array('H', (0, 0, 0))
 
+        # Events are queued by the interrupt handler (so none are lost if
+        # several arrive before the system manager runs). The interrupt
+        # handler only writes to _head and get_event() only writes to
+        # _tail.
+        self._queue = array.array('H', [0] * (3 * _QUEUE))
+        self._head = 0
+        self._tail = 0
+        self._last_ms = 0
+
         self._reset()
         self.tp_int.irq(trigger=Pin.IRQ_FALLING, handler=self.get_touch_data)
 
@@ -43,16 +61,40 @@ class CST816S:
         prepare it ready to go in the event queue.
         """
         dbuf = self.dbuf
-        event = self.event
+        queue = self._queue
 
         try:
             self.i2c.readfrom_mem_into(21, 1, dbuf)
         except OSError:
             return None
 
-        event[0] = dbuf[0] # event
-        event[1] = ((dbuf[2] & 0xf) << 8) + dbuf[3] # x coord
-        event[2] = ((dbuf[4] & 0xf) << 8) + dbuf[5] # y coord
+        gesture = dbuf[0]
+        x = ((dbuf[2] & 0xf) << 8) + dbuf[3]
+        y = ((dbuf[4] & 0xf) << 8) + dbuf[5]
+        if gesture == 0:
+            return None
+
+        # Coalesce repeated reports of the same gesture (keeping the
+        # latest coordinates). Separate gestures, even if they are in the
+        # same direction, are always queued.
+        now = time.ticks_ms()
+        repeat = time.ticks_diff(now, self._last_ms) < _REPEAT_MS
+        self._last_ms = now
+        head = self._head
+        if repeat and head != self._tail:
+            i = 3 * ((head - 1) & (_QUEUE - 1))
+            if queue[i] == gesture:
+                queue[i+1] = x
+                queue[i+2] = y
+                return None
+
+        # If the queue is full then the newest event is dropped
+        if head - self._tail < _QUEUE:
+            i = 3 * (head & (_QUEUE - 1))
+            queue[i] = gesture
+            queue[i+1] = x
+            queue[i+2] = y
+            self._head = head + 1
 
         if self.schedule:
             self.schedule(self)
@@ -60,15 +102,26 @@ class CST816S:
     def get_event(self):
         """Receive a touch event.
 
-        Check for a pending touch event and, if an event is pending,
-        prepare it ready to go in the event queue.
+        Remove the oldest event from the queue and return it. The same
+        event is returned until :py:meth:`reset_touch_data` is called.
 
         :return: An event record if an event is received, None otherwise.
         """
-        if self.event[0] == 0:
+        event = self.event
+        if event[0]:
+            return event
+
+        tail = self._tail
+        if tail == self._head:
             return None
 
-        return self.event
+        i = 3 * (tail & (_QUEUE - 1))
+        queue = self._queue
+        event[0] = queue[i]
+        event[1] = queue[i+1]
+        event[2] = queue[i+2]
+        self._tail = tail + 1
+        return event
 
     def reset_touch_data(self):
         """Reset touch data.
@@ -94,3 +147,4 @@ class CST816S:
 
         # Ensure get_event() cannot return anything
         self.event[0] = 0
+        self._tail = self._head
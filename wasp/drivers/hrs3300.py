@@ -27,6 +27,14 @@ class HRS3300:
     def __init__(self, i2c):
         self._i2c = i2c
 
+        # The data registers are all found between C1DATAM and C0DATAL so
+        # they can be read with a single burst (buffers are preallocated
+        # to avoid allocating memory for every sample). _dbuf[i] holds
+        # register _C1DATAM+i.
+        self._dbuf = bytearray(8)
+        self._hrsbuf = memoryview(self._dbuf)[1:8]
+        self._alsbuf = memoryview(self._dbuf)[0:7]
+
         w = self.write_reg
 
         # HRS disabled, 12.5 ms wait time between cycles, (partly) 20mA drive
@@ -59,21 +67,37 @@ class HRS3300:
         enable &= ~_ENABLE_HEN
         self.write_reg(_ENABLE, enable)
 
-    def read_hrs(self):
-        # TODO: Try fusing the read of H & L
-        m = self.read_reg(_C0DATAM)
-        h = self.read_reg(_C0DATAH)
-        l = self.read_reg(_C0DATAL)
-
+    def _hrs(self):
+        d = self._dbuf
+        m = d[_C0DATAM - _C1DATAM]
+        h = d[_C0DATAH - _C1DATAM]
+        l = d[_C0DATAL - _C1DATAM]
         return (m << 8) | ((h & 0x0f) << 4) | (l & 0x0f) | ((l & 0x30) << 12)
 
+    def _als(self):
+        d = self._dbuf
+        m = d[0]
+        h = d[_C1DATAH - _C1DATAM]
+        l = d[_C1DATAL - _C1DATAM]
+        return (m << 3) | ((h & 0x3f) << 11) | (l & 0x07)
+
+    def read_hrs(self):
+        """Read the heart rate sensor (using a single I2C transaction)."""
+        self._i2c.readfrom_mem_into(_I2CADDR, _C0DATAM, self._hrsbuf)
+        return self._hrs()
+
     def read_als(self):
-        # TODO: Try fusing the read of H & L
-        m = self.read_reg(_C1DATAM)
-        h = self.read_reg(_C1DATAH)
-        l = self.read_reg(_C1DATAL)
+        """Read the ambient light sensor (using a single I2C transaction)."""
+        self._i2c.readfrom_mem_into(_I2CADDR, _C1DATAM, self._alsbuf)
+        return self._als()
 
-        return (m << 3) | ((h & 0x3f) << 11) | (l & 0x07)
+    def read_hrs_als(self):
+        """Read both sensors (using a single I2C transaction).
+
+        :return: Tuple of the heart rate and ambient light readings
+        """
+        self._i2c.readfrom_mem_into(_I2CADDR, _C1DATAM, self._dbuf)
+        return (self._hrs(), self._als())
 
     def set_gain(self, gain):
         if gain > 64:
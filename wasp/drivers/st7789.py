@@ -28,34 +28,54 @@ _DISPON             = const(0x29)
 _CASET              = const(0x2a)
 _RASET              = const(0x2b)
 _RAMWR              = const(0x2c)
+_VSCRDEF            = const(0x33)
 _COLMOD             = const(0x3a)
 _MADCTL             = const(0x36)
+_VSCSAD             = const(0x37)
+
+# The frame memory has more rows than most panels so the frame memory
+# height is needed to define the scroll area
+_FRAME_HEIGHT       = const(320)
 
 class ST7789(object):
     """Sitronix ST7789 display driver
 
     .. automethod:: __init__
     """
-    def __init__(self, width, height):
+    def __init__(self, width, height, bpp=16):
         """Configure the size of the display.
 
         :param int width: Display width, in pixels
         :param int height: Display height in pixels
+        :param int bpp: Bits per pixel on the bus, either 16 (RGB565) or
+                        12 (RGB444, two pixels packed into every three bytes)
         """
+        if bpp not in (12, 16):
+            raise ValueError('unsupported pixel format')
         self.width = width
         self.height = height
+        self.bpp = bpp
         self.linebuffer = bytearray(2 * width)
+
+        # Preallocated parameter buffers (so we don't have to allocate
+        # memory every time we issue a command)
+        self._param = bytearray(6)
+        self._param4 = memoryview(self._param)[0:4]
+        self._param2 = memoryview(self._param)[0:2]
+
         self.init_display()
 
     def init_display(self):
         """Reset and initialize the display."""
         self.reset()
+        self._forget_window()
 
         self.write_cmd(_SLPOUT)
         sleep_ms(10)
 
         for cmd in (
-            (_COLMOD,   b'\x05'), # MCU will send 16-bit RGB565
+            # MCU will send 16-bit RGB565 or 12-bit RGB444
+            (_COLMOD,   b'\x03' if self.bpp == 12 else b'\x05'),
             (_MADCTL,   b'\x00'), # Left to right, top to bottom
             #(_INVOFF,   None), # Results in odd palette
             (_INVON,   None),
@@ -105,11 +125,63 @@ class ST7789(object):
         else:
             self.write_cmd(_DISPON)
 
+    def set_scroll_area(self, tfa=0, vsa=_FRAME_HEIGHT, bfa=0):
+        """Define the vertical scrolling area.
+
+        The frame memory is divided into a top fixed area, a scrolling area
+        and a bottom fixed area which, together, must add up to 320 rows
+        (the height of the frame memory, which can be larger than the
+        panel). Calling this method with no arguments restores the default
+        (non-scrolling) layout.
+
+        When scrolling is active the y coordinates passed to
+        :py:meth:`~.set_window` are frame memory rows rather than screen
+        rows.
+
+        :param int tfa: Height of the top fixed area
+        :param int vsa: Height of the vertical scrolling area
+        :param int bfa: Height of the bottom fixed area
+        """
+        param = self._param
+        param[0] = tfa >> 8
+        param[1] = tfa & 0xff
+        param[2] = vsa >> 8
+        param[3] = vsa & 0xff
+        param[4] = bfa >> 8
+        param[5] = bfa & 0xff
+
+        self.write_cmd(_VSCRDEF)
+        self.write_data(param)
+        self.scroll(tfa)
+
+    def scroll(self, line):
+        """Set the frame memory row shown at the top of the scrolling area.
+
+        :param int line: Frame memory row, must be within the scrolling area
+                         defined using :py:meth:`~.set_scroll_area`
+        """
+        param = self._param2
+        param[0] = line >> 8
+        param[1] = line & 0xff
+
+        self.write_cmd(_VSCSAD)
+        self.write_data(param)
+
+    def _forget_window(self):
+        """Ensure the next call to set_window() updates all the registers."""
+        self._x0 = -1
+        self._x1 = -1
+        self._y0 = -1
+        self._y1 = -1
+
     def set_window(self, x=0, y=0, width=None, height=None):
         """Set the clipping rectangle.
 
         All writes to the display will be wrapped at the edges of the rectangle.
 
+        The column and row addresses are only sent to the display if they
+        have changed since the last call.
+
         :param x:  X coordinate of the left-most pixels of the rectangle
         :param y:  Y coordinate of the top-most pixels of the rectangle
         :param w:  Width of the rectangle, defaults to None (which means select
@@ -124,17 +196,35 @@ class ST7789(object):
 
         xp = x + width - 1
         yp = y + height - 1
+        param = self._param4
+
+        if x != self._x0 or xp != self._x1:
+            param[0] = x >> 8
+            param[1] = x & 0xff
+            param[2] = xp >> 8
+            param[3] = xp & 0xff
+            self.write_cmd(_CASET)
+            self.write_data(param)
+            self._x0 = x
+            self._x1 = xp
+
+        if y != self._y0 or yp != self._y1:
+            param[0] = y >> 8
+            param[1] = y & 0xff
+            param[2] = yp >> 8
+            param[3] = yp & 0xff
+            self.write_cmd(_RASET)
+            self.write_data(param)
+            self._y0 = y
+            self._y1 = yp
 
-        self.write_cmd(_CASET)
-        self.write_data(bytearray([x >> 8, x & 0xff, xp >> 8, xp & 0xff]))
-        self.write_cmd(_RASET)
-        self.write_data(bytearray([y >> 8, y & 0xff, yp >> 8, yp & 0xff]))
         self.write_cmd(_RAMWR)
 
     def rawblit(self, buf, x, y, width, height):
         """Blit raw pixels to the display.
 
-        :param buf: Pixel buffer
+        :param buf: Pixel buffer, must already be in the format selected by
+                    :py:attr:`bpp`
         :param x:  X coordinate of the left-most pixels of the rectangle
         :param y:  Y coordinate of the top-most pixels of the rectangle
         :param w:  Width of the rectangle, defaults to None (which means select
@@ -165,6 +255,28 @@ class ST7789(object):
             h = self.height - y
         self.set_window(x, y, w, h)
 
+        if self.bpp == 12:
+            # Pixels are packed in pairs so, rather than writing a row at a
+            # time, the whole window is streamed in multiples of 3 bytes
+            pixel = (((bg >> 4) & 0xf00) | ((bg >> 3) & 0xf0) |
+                     ((bg >> 1) & 0xf))
+            sz = len(self.linebuffer) // 3
+            buf = memoryview(self.linebuffer)[0:3*sz]
+            for xi in range(0, 3*sz, 3):
+                buf[xi] = pixel >> 4
+                buf[xi+1] = ((pixel & 0xf) << 4) | (pixel >> 8)
+                buf[xi+2] = pixel & 0xff
+
+            remaining = (w * h + 1) // 2
+            self.quick_start()
+            while remaining >= sz:
+                self.quick_write(buf)
+                remaining -= sz
+            if remaining:
+                self.quick_write(buf[0:3*remaining])
+            self.quick_end()
+            return
+
         # Populate the line buffer
         buf = memoryview(self.linebuffer)[0:2*w]
         for xi in range(0, 2*w, 2):
@@ -184,7 +296,8 @@ class ST7789_SPI(ST7789):
         :param bytearray buf: Data, must be in a form that can be directly
                               consumed by the SPI bus.
     """
-    def __init__(self, width, height, spi, cs, dc, res=None, rate=8000000):
+    def __init__(self, width, height, spi, cs, dc, res=None, rate=8000000,
+                 bpp=16):
         """Configure the display.
 
         :param int width: Width of the display
@@ -196,8 +309,10 @@ class ST7789_SPI(ST7789):
         :param machine.Pin res: Pin (or signal) to, optionally, use to reset
                                 the display.
         :param int rate: SPI bus frequency
+        :param int bpp: Bits per pixel on the bus, 16 (RGB565) or 12 (RGB444)
         """
         self.quick_write = spi.write
+        self._cmd = bytearray(1)
         self.cs = cs.value
         self.dc = dc.value
         self.res = res
@@ -209,7 +324,7 @@ class ST7789_SPI(ST7789):
         if res:
             res.init(res.OUT, value=0)
 
-        super().__init__(width, height)
+        super().__init__(width, height, bpp)
 
     def reset(self):
         """Reset the display.
@@ -233,10 +348,12 @@ class ST7789_SPI(ST7789):
         """
         dc = self.dc
         cs = self.cs
+        buf = self._cmd
+        buf[0] = cmd
 
         dc(0)
         cs(0)
-        self.quick_write(bytearray([cmd]))
+        self.quick_write(buf)
         cs(1)
         dc(1)
 
@@ -1,33 +1,169 @@
+# Code generated by assets.py.
+# Cmd: tools/assets.py
+
 # 1-bit RLE, generated from res/clock_0.png, 217 bytes
-clock_0 = (48, 60, b'\x10\t%\x0e \x12\x1c\x16\x19\x18\x17\x1a\x16\n\x06\n\x15\t\n\t\x13\t\x0c\t\x12\x08\x0e\x08\x11\x08\x0f\t\x10\x08\x10\x08\x0f\x08\x11\x08\x0f\x08\x12\x08\x0e\x08\x12\x08\x0e\x07\x13\x08\r\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08\x0b\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\x0b\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08\r\x07\x13\x08\x0e\x08\x12\x08\x0e\x08\x12\x08\x0e\x08\x11\t\x0f\x08\x10\x08\x10\x08\x0f\t\x11\x08\x0e\x08\x12\t\x0c\t\x13\t\n\t\x15\n\x06\n\x16\x1a\x17\x18\x19\x16\x1c\x12\x1f\x0f$\n\x16')
+clock_0 = (
+    48, 60,
+    b'\x10\t%\x0e \x12\x1c\x16\x19\x18\x17\x1a\x16\n\x06\n'
+    b'\x15\t\n\t\x13\t\x0c\t\x12\x08\x0e\x08\x11\x08\x0f\t'
+    b'\x10\x08\x10\x08\x0f\x08\x11\x08\x0f\x08\x12\x08\x0e\x08\x12\x08'
+    b'\x0e\x07\x13\x08\r\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08'
+    b'\x0c\x08\x14\x08\x0c\x08\x14\x08\x0b\x08\x16\x08\n\x08\x16\x08'
+    b'\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08'
+    b'\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08'
+    b'\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08'
+    b'\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08'
+    b'\x0b\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08'
+    b'\x0c\x08\x14\x08\r\x07\x13\x08\x0e\x08\x12\x08\x0e\x08\x12\x08'
+    b'\x0e\x08\x11\t\x0f\x08\x10\x08\x10\x08\x0f\t\x11\x08\x0e\x08'
+    b'\x12\t\x0c\t\x13\t\n\t\x15\n\x06\n\x16\x1a\x17\x18'
+    b'\x19\x16\x1c\x12\x1f\x0f$\n\x16'
+)
 
 # 1-bit RLE, generated from res/clock_1.png, 123 bytes
-clock_1 = (48, 60, b'B\n"\x0e\x1d\x13\x1b\x15\x1b\x15\x1b\x15\x1b\x0b\x02\x08\x1b\x07\x06\x08\x1b\x02\x0b\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08\x1c \x10 \x10 \x10 \x10 \x10 8')
+clock_1 = (
+    48, 60,
+    b'B\n"\x0e\x1d\x13\x1b\x15\x1b\x15\x1b\x15\x1b\x0b\x02\x08'
+    b'\x1b\x07\x06\x08\x1b\x02\x0b\x08(\x08(\x08(\x08(\x08'
+    b'(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08'
+    b'(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08'
+    b'(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08'
+    b'(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08'
+    b'(\x08(\x08(\x08(\x08(\x08(\x08(\x08\x1c '
+    b'\x10 \x10 \x10 \x10 \x10 8'
+)
 
 # 1-bit RLE, generated from res/clock_2.png, 131 bytes
-clock_2 = (48, 60, b"\x0e\x0c \x14\x19\x19\x14\x1e\x11 \x10!\x0f\r\t\x0c\x0e\t\x10\n\r\x07\x13\n\x0c\x05\x16\t\x0c\x03\x19\t\x0b\x01\x1c\x08(\x08)\x08(\x08(\x08(\x08(\x08(\x08(\x08'\x08(\x08(\x08'\x08'\t'\x08'\t&\t&\t'\t&\t&\t&\t&\t&\t&\t&\t&\t&\t&\t&\t&\t&\t&\t&\t&\t&\t&\t&\t&\t&\t&\t&\t&&\n&\n&\n&\n&\n&7")
+clock_2 = (
+    48, 60,
+    b'\x0e\x0c \x14\x19\x19\x14\x1e\x11 \x10!\x0f\r\t\x0c'
+    b'\x0e\t\x10\n\r\x07\x13\n\x0c\x05\x16\t\x0c\x03\x19\t'
+    b'\x0b\x01\x1c\x08(\x08)\x08(\x08(\x08(\x08(\x08'
+    b"(\x08(\x08'\x08(\x08(\x08'\x08'\t'\x08"
+    b"'\t&\t&\t'\t&\t&\t&\t&\t"
+    b'&\t&\t&\t&\t&\t&\t&\t&\t'
+    b'&\t&\t&\t&\t&\t&\t&\t&\t'
+    b'&\t&\t&\t&&\n&\n&\n&\n&'
+    b'\n&7'
+)
 
 # 1-bit RLE, generated from res/clock_3.png, 139 bytes
-clock_3 = (48, 60, b"\x0e\x0b \x14\x19\x19\x15\x1d\x13\x1e\x12\x1f\x11\n\n\x0c\x10\x06\x11\n\x0f\x03\x15\t\x0f\x01\x18\t(\x08(\x08)\x08(\x08(\x08(\x08(\x08(\x08(\x08'\x08(\x08'\t&\t%\n#\x0c\x19\x16\x1a\x14\x1c\x12\x1e\x12\x1e\x14\x1c\x16%\x0c'\n(\t(\t(\x08(\t(\x08(\x08)\x08(\x08(\x08(\x08(\x08(\x08(\x08'\t'\x08'\t\x0b\x01\x1b\t\x0b\x03\x18\t\x0c\x05\x15\n\x0c\x07\x11\x0b\r\x0b\n\r\x0e!\x0f \x10\x1f\x12\x1c\x18\x16\x1f\r\x17")
+clock_3 = (
+    48, 60,
+    b'\x0e\x0b \x14\x19\x19\x15\x1d\x13\x1e\x12\x1f\x11\n\n\x0c'
+    b'\x10\x06\x11\n\x0f\x03\x15\t\x0f\x01\x18\t(\x08(\x08'
+    b")\x08(\x08(\x08(\x08(\x08(\x08(\x08'\x08"
+    b"(\x08'\t&\t%\n#\x0c\x19\x16\x1a\x14\x1c\x12"
+    b"\x1e\x12\x1e\x14\x1c\x16%\x0c'\n(\t(\t(\x08"
+    b'(\t(\x08(\x08)\x08(\x08(\x08(\x08(\x08'
+    b"(\x08(\x08'\t'\x08'\t\x0b\x01\x1b\t\x0b\x03"
+    b'\x18\t\x0c\x05\x15\n\x0c\x07\x11\x0b\r\x0b\n\r\x0e!'
+    b'\x0f \x10\x1f\x12\x1c\x18\x16\x1f\r\x17'
+)
 
 # 1-bit RLE, generated from res/clock_4.png, 177 bytes
-clock_4 = (48, 60, b'H\t&\n%\x0b%\x0b$\x0c$\x0c#\r"\x0e"\x05\x01\x08!\x06\x01\x08 \x06\x02\x08 \x06\x02\x08\x1f\x06\x03\x08\x1f\x05\x04\x08\x1e\x06\x04\x08\x1d\x06\x05\x08\x1d\x06\x05\x08\x1c\x06\x06\x08\x1b\x06\x07\x08\x1b\x06\x07\x08\x1a\x06\x08\x08\x19\x07\x08\x08\x19\x06\t\x08\x18\x07\t\x08\x18\x06\n\x08\x17\x06\x0b\x08\x16\x07\x0b\x08\x16\x06\x0c\x08\x15\x07\x0c\x08\x14\x07\r\x08\x14\x06\x0e\x08\x13\x07\x0e\x08\x13\x06\x0f\x08\x12\x07\x0f\x08\x11\x07\x10\x08\x11\x07\x10\x08\x10\x07\x11\x08\x10\x06\x12\x08\x10(\x08(\x08(\x08(\x08(\x08( \x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08?')
+clock_4 = (
+    48, 60,
+    b'H\t&\n%\x0b%\x0b$\x0c$\x0c#\r"\x0e'
+    b'"\x05\x01\x08!\x06\x01\x08 \x06\x02\x08 \x06\x02\x08'
+    b'\x1f\x06\x03\x08\x1f\x05\x04\x08\x1e\x06\x04\x08\x1d\x06\x05\x08'
+    b'\x1d\x06\x05\x08\x1c\x06\x06\x08\x1b\x06\x07\x08\x1b\x06\x07\x08'
+    b'\x1a\x06\x08\x08\x19\x07\x08\x08\x19\x06\t\x08\x18\x07\t\x08'
+    b'\x18\x06\n\x08\x17\x06\x0b\x08\x16\x07\x0b\x08\x16\x06\x0c\x08'
+    b'\x15\x07\x0c\x08\x14\x07\r\x08\x14\x06\x0e\x08\x13\x07\x0e\x08'
+    b'\x13\x06\x0f\x08\x12\x07\x0f\x08\x11\x07\x10\x08\x11\x07\x10\x08'
+    b'\x10\x07\x11\x08\x10\x06\x12\x08\x10(\x08(\x08(\x08('
+    b'\x08(\x08( \x08(\x08(\x08(\x08(\x08(\x08'
+    b'(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08'
+    b'?'
+)
 
 # 1-bit RLE, generated from res/clock_5.png, 137 bytes
-clock_5 = (48, 60, b"6\x1f\x11\x1f\x11\x1f\x11\x1f\x11\x1f\x11\x1f\x11\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08\x02\n\x1c\x18\x18\x1a\x16\x1b\x15\x1d\x13\x1e\x12\x07\n\x0e\x11\x03\x11\x0b\x11\x01\x15\n'\n'\t(\t'\t(\x08(\x08(\t(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08'\t'\x08(\x08'\t'\x08\x0c\x01\x1a\t\x0c\x02\x18\t\r\x04\x15\n\r\x07\x10\x0b\x0e\x0b\t\r\x0f \x10\x1f\x11\x1e\x13\x1b\x18\x16\x1f\r\x17")
+clock_5 = (
+    48, 60,
+    b'6\x1f\x11\x1f\x11\x1f\x11\x1f\x11\x1f\x11\x1f\x11\x08(\x08'
+    b'(\x08(\x08(\x08(\x08(\x08(\x08(\x08(\x08'
+    b'(\x08(\x08(\x08(\x08\x02\n\x1c\x18\x18\x1a\x16\x1b'
+    b'\x15\x1d\x13\x1e\x12\x07\n\x0e\x11\x03\x11\x0b\x11\x01\x15\n'
+    b"'\n'\t(\t'\t(\x08(\x08(\t(\x08"
+    b"(\x08(\x08(\x08(\x08(\x08(\x08(\x08'\t"
+    b"'\x08(\x08'\t'\x08\x0c\x01\x1a\t\x0c\x02\x18\t"
+    b'\r\x04\x15\n\r\x07\x10\x0b\x0e\x0b\t\r\x0f \x10\x1f'
+    b'\x11\x1e\x13\x1b\x18\x16\x1f\r\x17'
+)
 
 # 1-bit RLE, generated from res/clock_6.png, 197 bytes
-clock_6 = (48, 60, b'\x13\x0b"\x12\x1c\x16\x18\x18\x17\x19\x16\x1a\x15\x0c\x08\x07\x14\n\x0f\x03\x13\t\x13\x01\x13\x08\'\x08\'\x08(\x07)\x07(\x07)\x07)\x07(\x07)\x07)\x07)\x07\x08\t\x18\x06\x06\x0f\x14\x07\x05\x12\x12\x07\x03\x15\x11\x07\x02\x18\x0f\x07\x01\x1a\x0e\x07\x01\x08\x07\x0b\x0e\x0e\x0b\n\r\r\r\n\x0c\x0c\x0f\t\x0c\x0b\x11\x08\x0c\x0b\x12\x08\x0b\n\x13\x08\x0b\n\x13\x08\x0b\n\x13\t\n\t\x15\x08\n\t\x15\x08\n\t\x15\x08\n\t\x15\x08\x0b\x08\x15\x08\x0b\x08\x15\x08\x0b\x08\x15\x08\x0b\x08\x15\x08\x0b\x08\x15\x08\x0b\x08\x15\x08\x0c\x08\x13\t\x0c\x08\x13\x08\r\x08\x13\x08\x0e\x08\x12\x08\x0e\x08\x11\x08\x0f\t\x0f\t\x10\t\r\t\x12\t\x0b\n\x12\x0b\x07\x0b\x14\x1b\x16\x19\x18\x17\x1b\x14\x1e\x10#\n\x15')
+clock_6 = (
+    48, 60,
+    b'\x13\x0b"\x12\x1c\x16\x18\x18\x17\x19\x16\x1a\x15\x0c\x08\x07'
+    b"\x14\n\x0f\x03\x13\t\x13\x01\x13\x08'\x08'\x08(\x07"
+    b')\x07(\x07)\x07)\x07(\x07)\x07)\x07)\x07'
+    b'\x08\t\x18\x06\x06\x0f\x14\x07\x05\x12\x12\x07\x03\x15\x11\x07'
+    b'\x02\x18\x0f\x07\x01\x1a\x0e\x07\x01\x08\x07\x0b\x0e\x0e\x0b\n'
+    b'\r\r\r\n\x0c\x0c\x0f\t\x0c\x0b\x11\x08\x0c\x0b\x12\x08'
+    b'\x0b\n\x13\x08\x0b\n\x13\x08\x0b\n\x13\t\n\t\x15\x08'
+    b'\n\t\x15\x08\n\t\x15\x08\n\t\x15\x08\x0b\x08\x15\x08'
+    b'\x0b\x08\x15\x08\x0b\x08\x15\x08\x0b\x08\x15\x08\x0b\x08\x15\x08'
+    b'\x0b\x08\x15\x08\x0c\x08\x13\t\x0c\x08\x13\x08\r\x08\x13\x08'
+    b'\x0e\x08\x12\x08\x0e\x08\x11\x08\x0f\t\x0f\t\x10\t\r\t'
+    b'\x12\t\x0b\n\x12\x0b\x07\x0b\x14\x1b\x16\x19\x18\x17\x1b\x14'
+    b'\x1e\x10#\n\x15'
+)
 
 # 1-bit RLE, generated from res/clock_7.png, 117 bytes
-clock_7 = (48, 60, b"2&\n&\n&\n&\n&\n%(\x08'\x08(\x08(\x08'\x08(\x08'\x08(\x08(\x08'\x08(\x08'\x08(\x08'\t'\x08(\x08'\x08(\x08'\t'\x08(\x08'\t'\x08'\t'\x08(\x08'\t'\x08'\t'\x08(\x08'\t'\x08'\t'\x08(\x08'\t'\x08'\t'\x08(\x08'\t'\x08'\t'\x08(\x08'\t'\x08'\t'\x08(\x08'\tM")
+clock_7 = (
+    48, 60,
+    b"2&\n&\n&\n&\n&\n%(\x08'\x08"
+    b"(\x08(\x08'\x08(\x08'\x08(\x08(\x08'\x08"
+    b"(\x08'\x08(\x08'\t'\x08(\x08'\x08(\x08"
+    b"'\t'\x08(\x08'\t'\x08'\t'\x08(\x08"
+    b"'\t'\x08'\t'\x08(\x08'\t'\x08'\t"
+    b"'\x08(\x08'\t'\x08'\t'\x08(\x08'\t"
+    b"'\x08'\t'\x08(\x08'\t'\x08'\t'\x08"
+    b"(\x08'\tM"
+)
 
 # 1-bit RLE, generated from res/clock_8.png, 205 bytes
-clock_8 = (48, 60, b'\x10\n"\x12\x1c\x16\x18\x19\x16\x1c\x13\x1e\x11\x0c\x08\x0b\x11\n\x0c\n\x0f\n\x0e\n\x0e\t\x10\t\x0e\x08\x12\x08\r\t\x12\t\x0c\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08\r\x08\x12\x08\x0e\x08\x12\x08\x0f\x08\x10\x08\x10\x08\x10\x08\x11\t\x0c\t\x13\n\x08\n\x15\x19\x19\x16\x1d\x10\x1f\x12\x1b\x18\x17\x1a\x14\x0b\x08\n\x13\t\x0c\t\x11\x08\x10\x08\x0f\x08\x12\x08\x0e\x08\x12\x08\r\x08\x14\x08\x0c\x08\x14\x08\x0c\x07\x15\x08\x0b\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\t\x14\t\x0b\x08\x14\x08\x0c\t\x12\t\x0c\t\x12\t\r\t\x10\t\x0e\x0b\x0c\x0b\x0f\x0c\x08\x0c\x11\x1e\x13\x1c\x15\x1a\x18\x16\x1c\x12"\n\x16')
+clock_8 = (
+    48, 60,
+    b'\x10\n"\x12\x1c\x16\x18\x19\x16\x1c\x13\x1e\x11\x0c\x08\x0b'
+    b'\x11\n\x0c\n\x0f\n\x0e\n\x0e\t\x10\t\x0e\x08\x12\x08'
+    b'\r\t\x12\t\x0c\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08'
+    b'\x0c\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08\x0c\x08\x14\x08'
+    b'\r\x08\x12\x08\x0e\x08\x12\x08\x0f\x08\x10\x08\x10\x08\x10\x08'
+    b'\x11\t\x0c\t\x13\n\x08\n\x15\x19\x19\x16\x1d\x10\x1f\x12'
+    b'\x1b\x18\x17\x1a\x14\x0b\x08\n\x13\t\x0c\t\x11\x08\x10\x08'
+    b'\x0f\x08\x12\x08\x0e\x08\x12\x08\r\x08\x14\x08\x0c\x08\x14\x08'
+    b'\x0c\x07\x15\x08\x0b\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08'
+    b'\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08\n\x08\x16\x08'
+    b'\n\x08\x16\x08\n\t\x14\t\x0b\x08\x14\x08\x0c\t\x12\t'
+    b'\x0c\t\x12\t\r\t\x10\t\x0e\x0b\x0c\x0b\x0f\x0c\x08\x0c'
+    b'\x11\x1e\x13\x1c\x15\x1a\x18\x16\x1c\x12"\n\x16'
+)
 
 # 1-bit RLE, generated from res/clock_9.png, 197 bytes
-clock_9 = (48, 60, b'\x0f\n#\x10\x1e\x14\x1b\x17\x17\x1a\x15\x1c\x14\x0b\x07\x0b\x12\n\x0b\t\x11\n\r\t\x10\t\x0f\x08\x10\x08\x11\x08\x0e\x08\x12\x08\x0e\x08\x13\x08\r\x08\x13\x08\x0c\t\x13\x08\x0c\x08\x15\x08\x0b\x08\x15\x08\x0b\x08\x15\x08\x0b\x08\x15\x08\x0b\x08\x15\x08\x0b\x08\x15\x08\x0b\x08\x15\t\n\x08\x15\t\n\x08\x15\t\n\x08\x15\t\n\x08\x14\n\x0b\x08\x13\n\x0b\x08\x13\n\x0b\x08\x12\x0b\x0c\x08\x11\x0b\x0c\t\x0f\x0c\x0c\t\x0e\r\r\n\x0b\x0e\x0e\x0b\x07\x08\x01\x07\x0e\x1a\x01\x07\x0f\x18\x02\x07\x11\x15\x03\x07\x12\x12\x05\x07\x14\x0f\x06\x06\x18\t\x08\x07)\x07)\x07)\x07(\x07)\x07)\x07(\x07)\x07(\x08\'\x08\'\x08\x13\x01\x13\t\x13\x03\x0f\n\x14\x06\n\x0b\x15\x1a\x16\x19\x17\x18\x18\x16\x1b\x13"\x0b\x19')
+clock_9 = (
+    48, 60,
+    b'\x0f\n#\x10\x1e\x14\x1b\x17\x17\x1a\x15\x1c\x14\x0b\x07\x0b'
+    b'\x12\n\x0b\t\x11\n\r\t\x10\t\x0f\x08\x10\x08\x11\x08'
+    b'\x0e\x08\x12\x08\x0e\x08\x13\x08\r\x08\x13\x08\x0c\t\x13\x08'
+    b'\x0c\x08\x15\x08\x0b\x08\x15\x08\x0b\x08\x15\x08\x0b\x08\x15\x08'
+    b'\x0b\x08\x15\x08\x0b\x08\x15\x08\x0b\x08\x15\t\n\x08\x15\t'
+    b'\n\x08\x15\t\n\x08\x15\t\n\x08\x14\n\x0b\x08\x13\n'
+    b'\x0b\x08\x13\n\x0b\x08\x12\x0b\x0c\x08\x11\x0b\x0c\t\x0f\x0c'
+    b'\x0c\t\x0e\r\r\n\x0b\x0e\x0e\x0b\x07\x08\x01\x07\x0e\x1a'
+    b'\x01\x07\x0f\x18\x02\x07\x11\x15\x03\x07\x12\x12\x05\x07\x14\x0f'
+    b'\x06\x06\x18\t\x08\x07)\x07)\x07)\x07(\x07)\x07'
+    b")\x07(\x07)\x07(\x08'\x08'\x08\x13\x01\x13\t"
+    b'\x13\x03\x0f\n\x14\x06\n\x0b\x15\x1a\x16\x19\x17\x18\x18\x16'
+    b'\x1b\x13"\x0b\x19'
+)
 
 # 1-bit RLE, generated from res/clock_colon.png, 61 bytes
-clock_colon = (48, 60, b'\xff\x00\xff\x00\xff\x00s\n&\n&\n&\n&\n&\n&\n&\n&\n&\n&\n&\n\xff\x00\xff\x00\xff\x00Y\n&\n&\n&\n&\n&\n&\n&\n&\n&\n&\n&\nF')
-
+clock_colon = (
+    48, 60,
+    b'\xff\x00\xff\x00\xff\x00s\n&\n&\n&\n&\n'
+    b'&\n&\n&\n&\n&\n&\n&\n\xff\x00'
+    b'\xff\x00\xff\x00Y\n&\n&\n&\n&\n&\n'
+    b'&\n&\n&\n&\n&\n&\nF'
+)
@@ -1,19 +1,32 @@
-# SPDX-License-Identifier: LGPL-3.0-or-later
-# Copyright (C) 2020 Daniel Thompson
+# Code generated by assets.py.
+# Cmd: tools/assets.py
 
 # 1-bit RLE, generated from res/battery.png, 189 bytes
-battery = (36, 48, b'\x97\x0e\x14\x12\x11\x14\x10\x14\x0c\x08\x0c\x08\x08\x08\x0c\x08\x08\x08\x0c\x08\x08\x08\x0c\x08\x08\x04\x14\x04\x08\x04\x14\x04\x08\x04\x0c\x04\x04\x04\x08\x04\x0b\x05\x04\x04\x08\x04\n\x06\x04\x04\x08\x04\t\x07\x04\x04\x08\x04\x08\x07\x05\x04\x08\x04\x07\x07\x06\x04\x08\x04\x06\x07\x07\x04\x08\x04\x05\x07\x08\x04\x08\x04\x04\x0e\x02\x04\x08\x04\x03\x0f\x02\x04\x08\x04\x02\x10\x02\x04\x08\x04\x02\x10\x02\x04\x08\x04\x02\x0f\x03\x04\x08\x04\x02\x0e\x04\x04\x08\x04\x08\x07\x05\x04\x08\x04\x07\x07\x06\x04\x08\x04\x06\x07\x07\x04\x08\x04\x05\x07\x08\x04\x08\x04\x04\x07\t\x04\x08\x04\x04\x06\n\x04\x08\x04\x04\x05\x0b\x04\x08\x04\x04\x04\x0c\x04\x08\x04\x14\x04\x08\x04\x14\x04\x08\x04\x14\x04\x08\x04\x14\x04\x08\x1c\x08\x1c\x08\x1c\x08\x1c\x98')
+battery = (
+    36, 48,
+    b'\x97\x0e\x14\x12\x11\x14\x10\x14\x0c\x08\x0c\x08\x08\x08\x0c\x08'
+    b'\x08\x08\x0c\x08\x08\x08\x0c\x08\x08\x04\x14\x04\x08\x04\x14\x04'
+    b'\x08\x04\x0c\x04\x04\x04\x08\x04\x0b\x05\x04\x04\x08\x04\n\x06'
+    b'\x04\x04\x08\x04\t\x07\x04\x04\x08\x04\x08\x07\x05\x04\x08\x04'
+    b'\x07\x07\x06\x04\x08\x04\x06\x07\x07\x04\x08\x04\x05\x07\x08\x04'
+    b'\x08\x04\x04\x0e\x02\x04\x08\x04\x03\x0f\x02\x04\x08\x04\x02\x10'
+    b'\x02\x04\x08\x04\x02\x10\x02\x04\x08\x04\x02\x0f\x03\x04\x08\x04'
+    b'\x02\x0e\x04\x04\x08\x04\x08\x07\x05\x04\x08\x04\x07\x07\x06\x04'
+    b'\x08\x04\x06\x07\x07\x04\x08\x04\x05\x07\x08\x04\x08\x04\x04\x07'
+    b'\t\x04\x08\x04\x04\x06\n\x04\x08\x04\x04\x05\x0b\x04\x08\x04'
+    b'\x04\x04\x0c\x04\x08\x04\x14\x04\x08\x04\x14\x04\x08\x04\x14\x04'
+    b'\x08\x04\x14\x04\x08\x1c\x08\x1c\x08\x1c\x08\x1c\x98'
+)
 
-# 2-bit RLE, generated from res/bomb.png, 100 bytes
+# 1-bit RLE, generated from res/bomb.png, 97 bytes
 bomb = (
-    b'\x02'
-    b'  '
-    b'\x15\xc2\x06\xc22\xc3\x03\xc2\x02\xc2\x13\xc1\x03\xc1\x1a\xc1'
-    b'\x05\xc5\x15\xc1\x1c\xc7\x04\xc2\x02\xc2\x0f\xc7\x19\xc7\x02\xc2'
-    b'\x06\xc2\r\xc7\x17\xcb\x13\xcf\x10\xc6\x02\xc9\x0e\xd3\r\xd3'
-    b'\x0c\xc5\x02\xce\x0b\xc4\x02\xcf\x0b\xd5\n\xc4\x01\xd2\t\xc3'
-    b'\x02\xd2\t\xc3\x01\xd3\t\xc3\x02\xd2\t\xc4\x01\xd2\n\xd5'
-    b'\x0b\xd5\x0b\xd5\x0c\xd3\r\xd3\x0e\xd1\x10\xcf\x13\xcb\x18\xc5'
+    32, 32,
+    b'\x15\x02\x06\x022\x03\x03\x02\x02\x02\x13\x01\x03\x01\x1a\x01'
+    b'\x05\x05\x15\x01\x1c\x07\x04\x02\x02\x02\x0f\x07\x19\x07\x02\x02'
+    b'\x06\x02\r\x07\x17\x0b\x13\x0f\x10\x06\x02\t\x0e\x13\r\x13'
+    b'\x0c\x05\x02\x0e\x0b\x04\x02\x0f\x0b\x15\n\x04\x01\x12\t\x03'
+    b'\x02\x12\t\x03\x01\x13\t\x03\x02\x12\t\x04\x01\x12\n\x15'
+    b'\x0b\x15\x0b\x15\x0c\x13\r\x13\x0e\x11\x10\x0f\x13\x0b\x18\x05'
     b'\x0e'
 )
 
@@ -52,28 +65,28 @@ app = (
     b'\x81f;d<d<d\x1e'
 )
 
-# 2-bit RLE, generated from res/clock_icon.png, 288 bytes
+# Palette RLE, generated from res/clock_icon.png, 283 bytes
 clock = (
-    b'\x02'
+    b'\x03'
     b'`@'
-    b'?\xff\xff\xff\xff\xff\xff\x8e@\xacF\r\xc6!E\x0b'
-    b'\xc8\x0cH\x0b\xca\x1dI\x07\xcc\nH\n\xcc\x1bK\x06'
-    b'\xce\x08C\x02C\n\xc4\x05\xc4\x1aD\x03D\x06\xc2\x08'
-    b'\xc4\rC\t\xc4\x07\xc3\x19D\x05D\x10\xc4\x0cC\t'
-    b'\xc3\t\xc2\x19C\x07C\x11\xc3\x0cC\t\xc3\t\xc3\n'
-    b'D\tD\x07D\x10\xc3\x0cC\t\xc3\t\xc3\nD\t'
-    b'C\tC\x10\xc3\x0cC\t\xc3\t\xc3\nD\tC\t'
-    b'C\x10\xc3\x0cC\t\xc4\x07\xc4\nD\tC\tC\x0f'
-    b'\xc4\x0cC\n\xc4\x05\xc5\nD\tC\tC\x0e\xc4\r'
-    b'C\n\xca\x01\xc3\x17C\tC\r\xc5\rC\x0b\xc9\x01'
-    b'\xc3\x17C\tC\x0c\xc5\x0eC\r\xc5\x03\xc3\x17C\t'
-    b'C\x0b\xc5\x0fC\x15\xc3\x17C\tC\n\xc5\x10C\x14'
-    b'\xc4\x17C\tC\t\xc5\x11C\x14\xc3\x18D\x07D\x08'
-    b'\xc4\x13C\x14\xc3\x19C\x07C\x08\xc4\x14C\x13\xc4\x0b'
-    b'D\nC\x06D\x07\xc4\x15C\x0b\xc1\x05\xc5\x0cD\x0b'
-    b'D\x03D\x07\xc3\x12M\x06\xca\rD\x0bK\x06\xcf\x07'
-    b'M\x06\xc9\x0eD\x0cI\x07\xcf\x07M\x07\xc6\x10D\x0e'
-    b'E\t\xcf?\xff\xff\xff\xff\xff\xff\xff\xffk'
+    b'\x03\x00\xac\xd7`\x00\x8f\x00\x00\x87\x06\x8d\x86!\x05\x8b'
+    b'\x88\x0c\x08\x8b\x8a\x1d\t\x87\x8c\n\x08\x8a\x8c\x1b\x0b\x86'
+    b'\x8e\x08\x03\x82\x03\x8a\x84\x05\x84\x1a\x04\x83\x04\x86\x82\x08'
+    b'\x84\r\x03\x89\x84\x07\x83\x19\x04\x85\x04\x90\x84\x0c\x03\x89'
+    b'\x83\t\x82\x19\x03\x87\x03\x91\x83\x0c\x03\x89\x83\t\x83\n'
+    b'\x04\x89\x04\x87\x04\x90\x83\x0c\x03\x89\x83\t\x83\n\x04\x89'
+    b'\x03\x89\x03\x90\x83\x0c\x03\x89\x83\t\x83\n\x04\x89\x03\x89'
+    b'\x03\x90\x83\x0c\x03\x89\x84\x07\x84\n\x04\x89\x03\x89\x03\x8f'
+    b'\x84\x0c\x03\x8a\x84\x05\x85\n\x04\x89\x03\x89\x03\x8e\x84\r'
+    b'\x03\x8a\x8a\x01\x83\x17\x03\x89\x03\x8d\x85\r\x03\x8b\x89\x01'
+    b'\x83\x17\x03\x89\x03\x8c\x85\x0e\x03\x8d\x85\x03\x83\x17\x03\x89'
+    b'\x03\x8b\x85\x0f\x03\x95\x83\x17\x03\x89\x03\x8a\x85\x10\x03\x94'
+    b'\x84\x17\x03\x89\x03\x89\x85\x11\x03\x94\x83\x18\x04\x87\x04\x88'
+    b'\x84\x13\x03\x94\x83\x19\x03\x87\x03\x88\x84\x14\x03\x93\x84\x0b'
+    b'\x04\x8a\x03\x86\x04\x87\x84\x15\x03\x8b\x81\x05\x85\x0c\x04\x8b'
+    b'\x04\x83\x04\x87\x83\x12\r\x86\x8a\r\x04\x8b\x0b\x86\x8f\x07'
+    b'\r\x86\x89\x0e\x04\x8c\t\x87\x8f\x07\r\x87\x86\x10\x04\x8e'
+    b'\x05\x89\x8f\x02\x00\x18\x00\x94'
 )
 
 # 2-bit RLE, generated from res/settings_icon.png, 468 bytes
@@ -108,70 +121,74 @@ settings = (
     b'C\x04C\x04D\n\xc3,\xc3\x12C\x04C\x12\xc3,'
     b'\xc3\x13H\x13\xc3,\xc3\x13H\x13\xc3,\xc3\x14F\x14'
     b'\xc3,\xc3.\xc3,\xc3.\xc3,\xc3.\xc3,\xf4-'
-    b'\xf2/\xf02\xec?X\xc0\xdb\xe6;\xe4<\xe4<\xe4'
+    b'\xf2/\xf02\xec?X@\xdbf;d<d<d'
     b'\x1e'
 )
 
-# 2-bit RLE, generated from res/torch_icon.png, 245 bytes
+# Palette RLE, generated from res/torch_icon.png, 240 bytes
 torch = (
-    b'\x02'
+    b'\x03'
     b'`@'
-    b'?\xff\xff\xff\xff\xff\xff\xff&\xc6\x0c@\xd4B?\n'
-    b'\xca\tD?\x08\xc4\x06\xc2\x07F?\x07\xc3\x07\xc2\x06'
-    b'H?\x06\xc2\n\xc1\x04G\xc2A8\xc5\x08\xc2\t\xc2'
-    b'\x02F\xc3C7\xc7\x06\xc2\x0b\xc1F\xc2F\x1e\xe8\n'
-    b'\xc2C\xc3H\x1d\xe8\x0c\xc1N\x1d\xc2%\xc1\x0b\xc2N'
-    b'\x1d\xc2%\xc1\x0c\xc1N\x1d\xc2\x04\x9d\x04\xc1\x0b\xc2N'
-    b'\x1d\xc2\x06\x81\x03\x81\x03\x81\x03\x81\x03\x81\x03\x81\x03\x81'
-    b'\x06\xc1\x0c\xc1N\x1d\xc2\x04\x9d\x04\xc1\x0b\xc2C\xcaA'
-    b'\x1d\xc2\x06\x81\x03\x81\x03\x81\x03\x81\x03\x81\x03\x81\x03\x81'
-    b'\x06\xc1\x0c\xc1N\x1d\xc2\x04\x9d\x04\xc1\x0b\xc2N\x1d\xc2'
-    b'%\xc1\x0c\xc1N\x1d\xc2%\xc1\x0b\xc2N\x1d\xe8\x0c\xc1'
-    b'N\x1e\xe8\n\xc2C\xc3H?\x05\xc2\x0b\xc1F\xc2F'
-    b'?\x06\xc2\t\xc2\x02F\xc3C?\x06\xc2\n\xc1\x04G'
-    b'\xc2A?\x07\xc3\x07\xc2\x06H?\x08\xc4\x06\xc2\x07F'
-    b'?\n\xca\tD?\r\xc6\x0cB?\xff\xff\xff\xff\xff'
-    b'\xff\x95'
+    b'\x04\x00\xd7\xd4\xdb?!\x00\x90\x00\x00\xbe\x06\x8cB\x7f'
+    b'\n\n\x89D\x7f\x08\x04\x86\x02\x87F\x7f\x07\x03\x87\x02'
+    b'\x86H\x7f\x06\x02\x8a\x01\x84G\x82\x01x\x05\x88\x02\x89'
+    b'\x02\x82F\x83\x03w\x07\x86\x02\x8b\x01\x06\x82\x06^('
+    b'\x8a\x02\x03\x83\x08](\x8c\x01\x0e]\x02\xa5\x01\x8b\x02'
+    b'\x0e]\x02\xa5\x01\x8c\x01\x0e]\x02\x84\x9d\x04\x01\x8b\x02'
+    b'\x0e]\x02\x86\x81\x03\x81\x03\x81\x03\x81\x03\x81\x03\x81\x03'
+    b'\x81\x06\x01\x8c\x01\x0e]\x02\x84\x9d\x04\x01\x8b\x02\x03\x8a'
+    b'\x01]\x02\x86\x81\x03\x81\x03\x81\x03\x81\x03\x81\x03\x81\x03'
+    b'\x81\x06\x01\x8c\x01\x0e]\x02\x84\x9d\x04\x01\x8b\x02\x0e]'
+    b'\x02\xa5\x01\x8c\x01\x0e]\x02\xa5\x01\x8b\x02\x0e](\x8c'
+    b'\x01\x0e^(\x8a\x02\x03\x83\x08\x7f\x05\x02\x8b\x01\x06\x82'
+    b'\x06\x7f\x06\x02\x89\x02\x82F\x83\x03\x7f\x06\x02\x8a\x01\x84'
+    b'G\x82\x01\x7f\x07\x03\x87\x02\x86H\x7f\x08\x04\x86\x02\x87'
+    b'F\x7f\n\n\x89DN\x00\x1a\x00\x1c\x00\x8f'
 )
 
 # 1-bit RLE, generated from res/up_arrow.png, 16 bytes
-up_arrow = (16, 9, b'\x07\x02\r\x04\x0b\x06\t\x08\x07\n\x05\x0c\x03\x0e\x01 ')
+up_arrow = (
+    16, 9,
+    b'\x07\x02\r\x04\x0b\x06\t\x08\x07\n\x05\x0c\x03\x0e\x01 '
+)
 
 # 1-bit RLE, generated from res/down_arrow.png, 17 bytes
-down_arrow = (16, 9, b'\x00 \x01\x0e\x03\x0c\x05\n\x07\x08\t\x06\x0b\x04\r\x02\x07')
+down_arrow = (
+    16, 9,
+    b'\x00 \x01\x0e\x03\x0c\x05\n\x07\x08\t\x06\x0b\x04\r\x02'
+    b'\x07'
+)
 
-# 2-bit RLE, generated from res/knob.png, 72 bytes
+# 1-bit RLE, generated from res/knob.png, 69 bytes
 knob = (
-    b'\x02'
-    b'(('
-    b'\x10\xc8\x1c\xd0\x16\xd4\x13\xd6\x10\xda\r\xdc\x0b\xde\t\xe0'
-    b'\x08\xe0\x07\xe2\x05\xe4\x04\xe4\x03\xe6\x02\xe6\x02\xe6\x02\xe6'
-    b'\x01\xff\xff\x02\x01\xe6\x02\xe6\x02\xe6\x02\xe6\x03\xe4\x04\xe4'
-    b'\x05\xe2\x07\xe0\x08\xe0\t\xde\x0b\xdc\r\xda\x10\xd6\x13\xd4'
-    b'\x16\xd0\x1c\xc8\x10'
+    40, 40,
+    b'\x10\x08\x1c\x10\x16\x14\x13\x16\x10\x1a\r\x1c\x0b\x1e\t '
+    b'\x08 \x07"\x05$\x04$\x03&\x02&\x02&\x02&'
+    b'\x01\xff\x00A\x01&\x02&\x02&\x02&\x03$\x04$'
+    b'\x05"\x07 \x08 \t\x1e\x0b\x1c\r\x1a\x10\x16\x13\x14'
+    b'\x16\x10\x1c\x08\x10'
 )
 
-# 2-bit RLE, generated from res/notification.png, 105 bytes
+# 1-bit RLE, generated from res/notification.png, 101 bytes
 notification = (
-    b'\x02'
-    b'  '
-    b'\x0f\xc2\x1d\xc4\x1c\xc4\x19\xca\x14\xce\x11\xd0\x0f\xd2\x0e\xc5'
-    b'\x08\xc5\r\xc4\x0c\xc4\x0c\xc4\x0c\xc4\x0b\xc4\x0e\xc4\n\xc4'
-    b'\x0e\xc4\n\xc4\x0e\xc4\n\xc3\x0f\xc4\t\xc4\x10\xc3\t\xc4'
-    b'\x10\xc4\x08\xc4\x10\xc4\x08\xc4\x10\xc4\x08\xc4\x10\xc4\x08\xc3'
-    b'\x11\xc4\x07\xc4\x12\xc4\x06\xc4\x12\xc4\x06\xc4\x12\xc4\x05\xc5'
-    b'\x12\xc4\x05\xc4\x14\xc4\x03\xc5\x14\xc5\x02\xde\x01\xff\x01\x01'
-    b'\xde\x0f\xc4\x1d\xc2\x0f'
+    32, 32,
+    b'\x0f\x02\x1d\x04\x1c\x04\x19\n\x14\x0e\x11\x10\x0f\x12\x0e\x05'
+    b'\x08\x05\r\x04\x0c\x04\x0c\x04\x0c\x04\x0b\x04\x0e\x04\n\x04'
+    b'\x0e\x04\n\x04\x0e\x04\n\x03\x0f\x04\t\x04\x10\x03\t\x04'
+    b'\x10\x04\x08\x04\x10\x04\x08\x04\x10\x04\x08\x04\x10\x04\x08\x03'
+    b'\x11\x04\x07\x04\x12\x04\x06\x04\x12\x04\x06\x04\x12\x04\x05\x05'
+    b'\x12\x04\x05\x04\x14\x04\x03\x05\x14\x05\x02\x1e\x01@\x01\x1e'
+    b'\x0f\x04\x1d\x02\x0f'
 )
-# 2-bit RLE, generated from res/blestatus.png, 104 bytes
+
+# Palette RLE, generated from res/blestatus.png, 98 bytes
 blestatus = (
-    b'\x02'
+    b'\x03'
     b'\x11 '
-    b'\x07\xc1\x10\xc2\x0f\xc3\x0e\xc4\r\xc5\x0c\xc6\x0b\xc7\n\xc3'
-    b'\x01\xc4\x03\xc2\x04\xc3\x02\xc4\x01\xc4\x03\xc3\x03\xc4\x01\xc4'
-    b'\x02\xc3\x02\xc4\x03\xc4\x01\xc3\x01\xc4\x05\xcb\x07\xc9\t\xc7'
-    b'\x0b\xc5\x0c\xc5\x0b\xc7\t\xc9\x07\xcb\x05\xc4\x01\xc3\x01\xc4'
-    b'\x03\xc4\x02\xc3\x02\xc4\x01\xc4\x03\xc3\x03\xc4\x01\xc2\x04\xc3'
-    b'\x02\xc4\x08\xc3\x01\xc4\t\xc7\n\xc6\x0b\xc5\x0c\xc4\r\xc3'
-    b'\x0e\xc2\x0f\xc1\t'
+    b'\x82\x07\x01\x10\x02\x0f\x03\x0e\x04\r\x05\x0c\x06\x0b\x07\n'
+    b'\x03\x01\x04\x03\x02\x04\x03\x02\x04\x01\x04\x03\x03\x03\x04\x01'
+    b'\x04\x02\x03\x02\x04\x03\x04\x01\x03\x01\x04\x05\x0b\x07\t\t'
+    b'\x07\x0b\x05\x0c\x05\x0b\x07\t\t\x07\x0b\x05\x04\x01\x03\x01'
+    b'\x04\x02\x00\x0b\x00\r\x01\x02\x04\x03\x02\x04\x08\x03\x01\x04'
+    b'\t\x07\n\x06\x0b\x05\x0c\x04\r\x03\x0e\x02\x08\x00\x1f'
 )
@@ -10,28 +10,126 @@ raw PPG signals into something useful.
 
 import array
 import micropython
+from micropython import const
+
+# The heart rate is estimated from the most recent _WINDOW samples (10
+# seconds) and the period of the heart beat can be up to _LAGS-1 samples
+# (the trough search can look up to four cycles ahead)
+_WINDOW = const(240)
+_RING = const(256)
+_LAGS = const(211)
+
+# Filter coefficients (b0, b1, b2, a1, a2) and AGC parameters (start,
+# decay, threshold) used by the preprocessing chain
+HPF = (0.87033078, -1.74066156, 0.87033078, -1.72377617, 0.75754694)
+AGC = (20, 0.971, 2)
+LPF = (0.11595249, 0.23190498, 0.11595249, -0.72168143, 0.18549138)
 
 @micropython.viper
-def _compare(d1, d2, count: int, shift: int) -> int:
-    """Compare two sequences of (signed) bytes and quantify how dissimilar
-    they are.
+def _slide(ring, sums, n: int):
+    """Update the dissimilarity of the signal for every lag.
+
+    sums[lag] holds the sum of the squared differences between each
+    (signed) sample in the window and the sample lag places before it.
+    Sample n has just been added to the ring buffer so the pairs that
+    include it are added to the sums and, if sample n-_WINDOW has just
+    left the window, the pairs that include that sample are removed.
     """
-    p1 = ptr8(d1)
-    p2 = ptr8(d2)
+    r = ptr8(ring)
+    s = ptr32(sums)
+
+    x = int(r[n & (_RING-1)])
+    if x > 127:
+        x -= 256
+    lags = n + 1 if n < _LAGS else _LAGS
+    for lag in range(1, lags):
+        v = int(r[(n - lag) & (_RING-1)])
+        if v > 127:
+            v -= 256
+        d = x - v
+        s[lag] += d*d
+
+    if n >= _WINDOW:
+        o = n - _WINDOW
+        x = int(r[o & (_RING-1)])
+        if x > 127:
+            x -= 256
+        for lag in range(1, _LAGS):
+            v = int(r[(o + lag) & (_RING-1)])
+            if v > 127:
+                v -= 256
+            d = v - x
+            s[lag] -= d*d
+
+@micropython.viper
+def _biquad(q, x: int) -> int:
+    """Fixed point Direct Form I biquad filter.
 
-    e = 0
-    for i in range(count):
-        s1 = int(p1[i])
-        if s1 > 127:
-            s1 -= 256
+    q holds the coefficients b0, b1, b2, -a1 and -a2 (in Q28, each split
+    into a signed upper and an unsigned lower 14-bit half) followed by
+    x, x1, x2, y1 and y2.
+    """
+    p = ptr32(q)
+    p[10] = x
+
+    # The coefficients and the samples are both split in half so that
+    # none of the products overflow a 32-bit machine word
+    y = 0
+    for i in range(5):
+        c = p[2*i]
+        d = p[2*i+1]
+        v = p[10+i]
+        h = v >> 14
+        l = v & 0x3fff
+        y += h * c + ((h * d + l * c + ((l * d) >> 14) + 0x2000) >> 14)
+
+    p[14] = p[13]
+    p[13] = y
+    p[12] = p[11]
+    p[11] = x
+    return y
 
-        s2 = int(p2[i])
-        if s2 > 127:
-            s2 -= 256
+@micropython.viper
+def _ptagc(q, x: int) -> int:
+    """Fixed point peak tracking automatic gain control.
 
-        d = s1 - s2
-        e += d*d
-    return e
+    q holds the peak (in Q14), the decay and the boost (both in Q30,
+    split into two 15-bit halves) and the threshold (in Q15). The samples
+    are in Q12.
+    """
+    p = ptr32(q)
+    peak = p[0]
+    a = x if x >= 0 else -x
+    big = a >= 0x8000000
+    a <<= 2
+
+    # peak tracking (the peak is kept between 1 and 32768 so that it can
+    # always grow again and so the maths cannot overflow). The extra
+    # precision of the constants stops the peak drifting after many
+    # boosts and decays.
+    i = 3 if big or a > peak else 1
+    c = p[i]
+    h = peak >> 15
+    l = peak & 0x7fff
+    peak = h * c + ((l * c + h * p[i+1] + ((l * p[i+1]) >> 15) + 0x4000) >> 15)
+    if peak < 0x4000:
+        peak = 0x4000
+    if peak > 0x20000000:
+        peak = 0x20000000
+    p[0] = peak
+
+    # rejection filter (clipper)
+    c = p[5]
+    if big or a > (peak >> 15) * c + (((peak & 0x7fff) * c) >> 15):
+        return 0
+
+    # booster, y = 100 * x / (2 * peak), calculated by finding the ratio
+    # in Q14 (after scaling both values so the division fits in 32-bits)
+    while peak > 0x7fff:
+        peak >>= 1
+        a >>= 1
+    y = ((((a << 14) + (peak >> 1)) // peak) * 50 + 2) >> 2
+    return y if x >= 0 else -y
 
 class Biquad():
     """Direct Form II Biquad Filter"""
@@ -87,43 +185,100 @@ class PTAGC():
 
         return spl
 
-class PPG():
+class FixedBiquad():
+    """Fixed point Direct Form I Biquad Filter
+
+    Samples are integers and the coefficients are stored in Q28. This
+    avoids any floating point maths (and therefore any memory allocation)
+    for each sample.
     """
+    def __init__(self, b0, b1, b2, a1, a2):
+        # The middle coefficients absorb the rounding errors so that the
+        # sums of the coefficients (and hence the DC gain) are unchanged
+        one = 1 << 28
+        q0 = round(b0 * one)
+        q2 = round(b2 * one)
+        q1 = round((b0 + b1 + b2) * one) - q0 - q2
+        q4 = round(-a2 * one)
+        q3 = round(-(a1 + a2) * one) - q4
+
+        self._q = array.array('i', [0] * 15)
+        for (i, c) in enumerate((q0, q1, q2, q3, q4)):
+            self._q[2*i] = c >> 14
+            self._q[2*i+1] = c & 0x3fff
+
+    def step(self, x):
+        return _biquad(self._q, x)
+
+class FixedPTAGC():
+    """Fixed point Peak Tracking Automatic Gain Control
+
+    This is the same algorithm as :py:class:`PTAGC` but the samples are
+    in Q12 rather than floating point. The threshold must not be larger
+    than 2.
+    """
+    def __init__(self, start, decay, threshold):
+        d = 32768 * decay
+        b = 32768 / decay
+        self._q = array.array('i', (round(start * 16384),
+                                    int(d), round((d - int(d)) * 32768),
+                                    int(b), round((b - int(b)) * 32768),
+                                    round(threshold * 32768)))
+
+    def step(self, spl):
+        return _ptagc(self._q, spl)
+
+class PPG():
+    """Convert raw PPG samples into a heart rate.
+
+    The preprocessed samples are kept in a preallocated ring buffer and
+    the dissimilarity of the signal with delayed copies of itself is
+    updated as each sample arrives. This means the heart rate (measured
+    over the last ten seconds) can be read at any time without any
+    memory allocation.
     """
 
     def __init__(self, spl):
         self._offset = spl
-        self.data = array.array('b')
+        self._ring = bytearray(_RING)
+        self._sums = array.array('i', [0] * _LAGS)
+        self.count = 0
 
-        self._hpf = Biquad(0.87033078, -1.74066156, 0.87033078,
-                                       -1.72377617, 0.75754694)
-        self._agc = PTAGC(20, 0.971, 2)
-        self._lpf = Biquad(0.11595249, 0.23190498, 0.11595249,
-                                      -0.72168143, 0.18549138)
+        self._hpf = FixedBiquad(*HPF)
+        self._agc = FixedPTAGC(*AGC)
+        self._lpf = FixedBiquad(*LPF)
 
     def preprocess(self, spl):
         """Preprocess a PPG sample.
 
         Must be called at 24Hz for accurate heart rate calculations.
+        The filters work in fixed point (Q12) and give the same results
+        as :py:class:`Biquad` and :py:class:`PTAGC` (to within rounding
+        errors).
         """
-        spl -= self._offset
+        spl = (spl - self._offset) << 12
         spl = self._hpf.step(spl)
         spl = self._agc.step(spl)
         spl = self._lpf.step(spl)
-        spl = int(spl)
 
-        self.data.append(spl)
+        # Convert from Q12 (rounding towards zero, just like int())
+        spl = spl >> 12 if spl >= 0 else -(-spl >> 12)
+
+        self._append(spl)
         return spl
 
-    def _get_heart_rate(self):
-        def compare(d, shift):
-            return _compare(d[shift:], d[:-shift], len(d)-shift, shift)
+    def _append(self, spl):
+        n = self.count
+        self._ring[n & (_RING-1)] = spl & 0xff
+        _slide(self._ring, self._sums, n)
+        self.count = n + 1
 
+    def _get_heart_rate(self):
         def trough(d, mn, mx):
-            z2 = compare(d, mn-2)
-            z1 = compare(d, mn-1)
+            z2 = d[mn-2]
+            z1 = d[mn-1]
             for i in range(mn, mx+1):
-                z = compare(d, i)
+                z = d[i]
                 if z2 > z1 and z1 < z:
                     return i
                 z2 = z1
@@ -131,7 +286,7 @@ class PPG():
 
             return -1
 
-        data = memoryview(self.data)
+        data = self._sums
 
         # Search initially from ~210 to 30 bpm
         t0 = trough(data, 7, 48)
@@ -159,12 +314,11 @@ class PPG():
         return (60 * 24 * 4) // t3
 
     def get_heart_rate(self):
-        if len(self.data) < 200:
-            return None
-
-        hr = self._get_heart_rate()
+        """Estimate the heart rate from the last ten seconds of samples.
 
-        # Clear out the accumulated data
-        self.data = array.array('b')
-
-        return hr
+        :return: Heart rate in beats per minute or None if there is not
+                 enough data or no clear heart beat
+        """
+        if self.count < 200:
+            return None
+        return self._get_heart_rate()
@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2020 Daniel Thompson
+
+"""Periodic sensor sampling
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Reads a sensor at a fixed rate, from a hardware timer, into a preallocated
+FIFO. The samples can be collected later, in batches, by an application
+tick without the application having to busy-wait for the next sample to
+be due.
+"""
+
+import array
+import machine
+import micropython
+
+class Sampler():
+    """Sample a sensor at a fixed rate.
+
+    The timer interrupt handler does nothing except schedule the sensor
+    read (which needs the I2C bus) to run as soon as the interrupt
+    returns. If the FIFO fills up (or the read cannot be scheduled) then
+    new samples are discarded and counted in ``overflows``.
+
+    .. code-block:: python
+
+        sampler = Sampler(wasp.watch.hrs.read_hrs, 24)
+        sampler.start()
+        ...
+        n = sampler.read_into(buf)
+    """
+
+    def __init__(self, read, hz, size=64, id=1):
+        """Prepare to sample a sensor.
+
+        :param read: Function that returns a single (integer) sample
+        :param hz: Sample rate
+        :param size: Number of samples the FIFO can hold, must be a power
+                     of two
+        :param id: Hardware timer to use
+        """
+        self._read = read
+        self._period = 1000000 // hz
+        self._id = id
+        self._fifo = array.array('i', [0] * size)
+        self._mask = size - 1
+        self._head = 0
+        self._tail = 0
+        self._timer = None
+        self.overflows = 0
+
+        # Bound methods are objects in their own right so create the one
+        # we schedule now (the interrupt handler cannot allocate memory)
+        self._sample_ref = self._sample
+
+    def start(self):
+        """Start sampling (the FIFO is emptied first)."""
+        self._head = self._tail
+        self._timer = machine.Timer(id=self._id, period=self._period,
+                                    mode=machine.Timer.PERIODIC,
+                                    callback=self._irq)
+        self._timer.start()
+
+    def stop(self):
+        """Stop sampling."""
+        if self._timer:
+            self._timer.stop()
+            self._timer = None
+
+    def _irq(self, timer):
+        # If the system is too busy to run the scheduled read then the
+        # sample is dropped (just like when the FIFO is full)
+        try:
+            micropython.schedule(self._sample_ref, None)
+        except RuntimeError:
+            self.overflows += 1
+
+    def _sample(self, _):
+        head = self._head
+        if head - self._tail > self._mask:
+            self.overflows += 1
+            return
+        self._fifo[head & self._mask] = self._read()
+        self._head = head + 1
+
+    def __len__(self):
+        return self._head - self._tail
+
+    def read_into(self, buf):
+        """Move samples from the FIFO into a buffer.
+
+        :param buf: Buffer (usually an array) to fill with samples
+        :return: Number of samples copied
+        """
+        tail = self._tail
+        n = self._head - tail
+        if n > len(buf):
+            n = len(buf)
+        fifo = self._fifo
+        mask = self._mask
+        for i in range(n):
+            buf[i] = fifo[(tail + i) & mask]
+        self._tail = tail + n
+        return n
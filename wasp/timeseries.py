@@ -0,0 +1,261 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2020 Daniel Thompson
+
+"""Time series storage
+~~~~~~~~~~~~~~~~~~~~~~
+
+Compact, append-only, storage for sensor readings (such as the step count
+or the heart rate) on the flash filesystem.
+
+Readings are summarised into one record per minute, one per hour and one
+per day and each of these tiers is kept in its own file. Every record is
+eight bytes long (the time at the start of the period, the value and the
+number of readings summarised) so a file can be searched without reading
+all of it. Old minute and hour records are discarded automatically,
+by which time they have been summarised in the hourly and daily records.
+
+.. code-block:: python
+
+    steps = TimeSeries('steps', SUM)
+    steps.append(20)
+    for (t, value, n) in steps.query(start, end, HOURS):
+        ...
+
+The same queries can be used, via the REPL, to copy the data to a host.
+"""
+
+import os
+import struct
+import time
+import watch
+from micropython import const
+
+_RECORD = const(8)
+
+# Records are collected in RAM until there is a flash page worth of them
+_BUFFER = const(256)
+
+# How to summarise the readings
+SUM = const(0)
+MEAN = const(1)
+
+# Tiers
+MINUTES = const(0)
+HOURS = const(1)
+DAYS = const(2)
+
+# Length of the period (in seconds), file suffix and the number of
+# records to keep (2 days of minutes, 60 days of hours and every day) for
+# each tier
+_TIERS = (
+    (60, '.min', 2 * 24 * 60),
+    (60 * 60, '.hr', 60 * 24),
+    (24 * 60 * 60, '.day', 0),
+)
+
+class TimeSeries():
+    """An append-only series of readings, summarised by minute, hour and
+    day.
+
+    Values are integers between 0 and 65535 (larger values are clipped).
+
+    To limit flash wear the records for each tier are buffered in RAM
+    and written a whole flash page at a time: every 32 minutes, 32 hours
+    and 32 days respectively. :py:meth:`flush` writes the buffers early
+    but, since every flush adds a partially filled page to each file, it
+    should be called rarely (such as once a day). The trade off is that
+    the buffered records are lost if the watch is reset. That means up to
+    32 minutes of readings (plus the current minute, which is only ever
+    kept in RAM). Lost hour and day records are rebuilt from the minute
+    and hour files when the series is next opened, so these are only lost
+    if the minute records they summarise are lost too.
+    """
+
+    def __init__(self, name, mode=MEAN, directory=None):
+        """Open (or create) a time series.
+
+        Nothing is written to the filesystem (not even the directory)
+        until there are records to store.
+
+        :param name: Name of the series, used to name its files
+        :param mode: Whether the summaries hold the ``SUM`` or the ``MEAN``
+                     of the readings
+        :param directory: Directory to keep the files in (default:
+                          ``watch.data_dir`` if the board provides one,
+                          otherwise ``logs``)
+        """
+        if directory is None:
+            directory = getattr(watch, 'data_dir', 'logs')
+        self._dir = directory
+        self._path = directory + '/' + name
+        self._mode = mode
+        self._bufs = (bytearray(_BUFFER), bytearray(_BUFFER),
+                      bytearray(_BUFFER))
+        self._used = [0, 0, 0]
+
+        # The time, total and number of readings for the summary being
+        # collected in each tier
+        self._open = [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
+        self._recover()
+
+    def append(self, value, t=None):
+        """Add a reading.
+
+        :param value: The reading
+        :param t: Time of the reading in seconds (default: now), readings
+                  must be added in time order
+        """
+        if t is None:
+            t = time.mktime(watch.rtc.get_localtime())
+        self._add(MINUTES, int(t), value, 1)
+
+    def flush(self):
+        """Write any buffered records to flash."""
+        for tier in (MINUTES, HOURS, DAYS):
+            self._flush(tier)
+
+    def query(self, start=0, end=None, tier=MINUTES):
+        """Iterate over the records in a range of time.
+
+        Readings from the current minute, hour or day are only included
+        once that period is over. Do not add readings whilst iterating.
+
+        :param start: Start of the range (inclusive) in seconds
+        :param end: End of the range (exclusive) in seconds or None for
+                    no limit
+        :param tier: ``MINUTES``, ``HOURS`` or ``DAYS``
+        :return: Iterator of (time, value, readings) tuples
+        """
+        buf = bytearray(_BUFFER)
+        try:
+            f = open(self._path + _TIERS[tier][1], 'rb')
+        except OSError:
+            f = None
+
+        if f:
+            with f:
+                # Binary search for the first record in the range
+                lo = 0
+                hi = f.seek(0, 2) // _RECORD
+                rec = memoryview(buf)[0:_RECORD]
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    f.seek(mid * _RECORD)
+                    f.readinto(rec)
+                    if struct.unpack_from('<I', rec)[0] < start:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+
+                f.seek(lo * _RECORD)
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    for i in range(0, n - n % _RECORD, _RECORD):
+                        r = struct.unpack_from('<IHH', buf, i)
+                        if end is not None and r[0] >= end:
+                            return
+                        yield r
+
+        buf = self._bufs[tier]
+        for i in range(0, self._used[tier], _RECORD):
+            r = struct.unpack_from('<IHH', buf, i)
+            if r[0] >= start:
+                if end is not None and r[0] >= end:
+                    return
+                yield r
+
+    def _add(self, tier, t, total, n):
+        """Add readings to the summary being collected for a tier."""
+        s = self._open[tier]
+        t -= t % _TIERS[tier][0]
+
+        # The files must stay in time order (even if the clock is set
+        # backwards) otherwise they cannot be searched
+        if t < s[0]:
+            t = s[0]
+        if s[2] and s[0] != t:
+            self._close(tier)
+        s[0] = t
+        s[1] += total
+        s[2] += n
+
+    def _close(self, tier):
+        """Record the summary for a tier and start a new one."""
+        s = self._open[tier]
+        (t, total, n) = s
+        if self._mode == MEAN:
+            value = (total + n // 2) // n
+        else:
+            value = total
+        value = min(max(value, 0), 0xffff)
+
+        used = self._used[tier]
+        struct.pack_into('<IHH', self._bufs[tier], used,
+                         t, value, min(n, 0xffff))
+        self._used[tier] = used + _RECORD
+        if used + _RECORD >= _BUFFER:
+            self._flush(tier)
+
+        s[1] = 0
+        s[2] = 0
+        if tier < DAYS:
+            self._add(tier + 1, t, total, n)
+
+    def _flush(self, tier):
+        used = self._used[tier]
+        if used:
+            self._write(tier, memoryview(self._bufs[tier])[0:used])
+            self._used[tier] = 0
+
+    def _write(self, tier, data):
+        fname = self._path + _TIERS[tier][1]
+        try:
+            f = open(fname, 'ab')
+        except OSError:
+            os.mkdir(self._dir)
+            f = open(fname, 'ab')
+        with f:
+            f.write(data)
+            size = f.seek(0, 2)
+
+        # Discard the oldest records once the file is twice as long as it
+        # needs to be (so it is only rewritten occasionally)
+        keep = _TIERS[tier][2] * _RECORD
+        if keep and size >= 2 * keep:
+            buf = bytearray(_BUFFER)
+            with open(fname, 'rb') as src:
+                with open(fname + '~', 'wb') as dst:
+                    src.seek(size - keep)
+                    while True:
+                        n = src.readinto(buf)
+                        if not n:
+                            break
+                        dst.write(memoryview(buf)[0:n])
+            os.rename(fname + '~', fname)
+
+    def _last(self, tier):
+        """Find the time of the most recent record in a tier."""
+        try:
+            with open(self._path + _TIERS[tier][1], 'rb') as f:
+                size = f.seek(0, 2)
+                if size < _RECORD:
+                    return -1
+                f.seek(size - size % _RECORD - _RECORD)
+                return struct.unpack('<I', f.read(4))[0]
+        except OSError:
+            return -1
+
+    def _recover(self):
+        """Rebuild the hour and day summaries that were being collected
+        from the records written since the last summary (the daily summary
+        is rebuilt first so that any hours closed whilst rebuilding the
+        hourly summary are not counted twice).
+        """
+        for tier in (DAYS, HOURS):
+            start = self._last(tier)
+            start = start + _TIERS[tier][0] if start >= 0 else 0
+            for (t, value, n) in self.query(start, None, tier - 1):
+                self._add(tier, t, value * n if self._mode == MEAN else value,
+                          n)
@@ -18,6 +18,8 @@
 import gc
 import machine
 import micropython
+import time
+import timeseries
 import watch
 import widgets
 
@@ -112,6 +114,12 @@ class Manager():
         self._scheduled = False
         self._scheduling = False
 
+        # Step history (the series is opened on first use)
+        self._steps_log = None
+        self._steps = 0
+        self._steps_day = None
+        self._steps_at = 0
+
         # TODO: Eventually these should move to main.py
         self.register(ClockApp(), True)
         self.register(StepCounterApp(), True)
@@ -164,6 +172,7 @@ class Manager():
         watch.display.mute(True)
         watch.drawable.reset()
         app.foreground()
+        watch.drawable.flush()
         watch.display.mute(False)
 
     def navigate(self, direction=None):
@@ -299,6 +308,33 @@ class Manager():
             self.app.touch(event)
         watch.touch.reset_touch_data()
 
+    def _log_steps(self):
+        """Record the steps taken since the last minute.
+
+        This runs once a minute, whatever application is running and
+        even when the watch is asleep. The step counter is reset, and the
+        step history is written to flash, at midnight.
+        """
+        uptime = watch.rtc.uptime
+        if uptime < self._steps_at:
+            return
+        self._steps_at = uptime + 60
+
+        if not self._steps_log:
+            self._steps_log = timeseries.TimeSeries('steps', timeseries.SUM)
+
+        now = watch.rtc.get_localtime()
+        steps = watch.accel.steps
+        self._steps_log.append(max(steps - self._steps, 0), time.mktime(now))
+        self._steps = steps
+
+        if now[2] != self._steps_day:
+            if self._steps_day is not None:
+                watch.accel.steps = 0
+                self._steps = 0
+                self._steps_log.flush()
+            self._steps_day = now[2]
+
     def _tick(self):
         """Handle the system tick.
 
@@ -323,9 +359,17 @@ class Manager():
             if None != state:
                 self._handle_button(state)
 
+            # Dispatch every touch event that arrived since the last
+            # tick (_handle_touch() removes each event once handled)
             event = watch.touch.get_event()
-            if event:
+            while event:
                 self._handle_touch(event)
+                event = watch.touch.get_event()
+
+            self._log_steps()
+
+            # Draw any clears the application has left pending
+            watch.drawable.flush()
 
             if self.sleep_at and watch.rtc.uptime > self.sleep_at:
                 self.sleep()
@@ -333,6 +377,7 @@ class Manager():
             gc.collect()
         else:
             watch.rtc.update()
+            self._log_steps()
 
             if 1 == self._button.get_event() or \
                     self._charging != watch.battery.charging():
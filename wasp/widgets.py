@@ -64,7 +64,7 @@ class BatteryMeter:
             x = 239 - 30
             w = 16
             if 24 - h:
-                draw.fill(0, x, 14, w, 24 - h)
+                draw.clear(x, 14, w, 24 - h)
             if h:
                 draw.fill(rgb, x, 38 - h, w, h)
 
@@ -94,12 +94,12 @@ class StatusBar:
             if wasp.system.notifications:
                 draw.blit(icons.notification, x+24, y, fg=0x7bef)
             else:
-                draw.fill(0, x+24, y, 32, 32)
+                draw.clear(x+24, y, 32, 32)
         elif wasp.system.notifications:
             draw.blit(icons.notification, x, y, fg=0x7bef)
-            draw.fill(0, x+32, y, 32, 32)
+            draw.clear(x+32, y, 32, 32)
         else:
-            draw.fill(0, x, y, 56, 32)
+            draw.clear(x, y, 56, 32)
 
 class ScrollIndicator:
     """Scrolling indicator.
@@ -112,6 +112,14 @@ class ScrollIndicator:
         self.up = True
         self.down = True
 
+    def move(self, x, y):
+        """Change the position of the indicator.
+
+        The indicator is not redrawn until :py:meth:`~.draw` or
+        :py:meth:`~.update` is called.
+        """
+        self._pos = (x, y)
+
     def draw(self):
         """Draw from scrolling indicator.
 